@@ -0,0 +1,315 @@
+"""Benchmark suite for the physics, AI, rendering and full-frame hot paths.
+
+Every case is timed with timeit (best of several repeats, each long enough to
+swamp timer noise) and reported as operations per second. The whole suite runs
+several rounds, so every case is sampled at different moments of a noisy
+machine, and each case keeps its best round; baseline and comparison use the
+same rounds so their numbers are comparable. Results are compared
+against a stored baseline (bench/baseline.json) and the run exits with status 1
+when a case is slower than the baseline by more than the allowed tolerance, so
+regressions are caught before a release. Rendering runs on the SDL dummy
+video/audio drivers; no window is opened.
+
+Usage (from tiny-football/):
+	python3 bench/bench.py                  # run and compare with the baseline
+	python3 bench/bench.py --filter ai.     # only the cases whose name contains "ai."
+	python3 bench/bench.py --save-baseline  # record this machine's numbers as the baseline
+
+Baselines are machine specific: record one on the machine that runs the
+comparison.
+"""
+
+import os
+import sys
+
+# Headless SDL before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import argparse
+import json
+import platform
+import timeit
+import numpy as np
+import pygame
+from pygame.math import Vector2 as V2
+from settings import CFG
+from scaling import SCALING
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+WINDOW_SIZES = ((960, 540), (1280, 720), (1920, 1080))
+AI_TEAM_SIZES = (1, 2, 3, 4, 5, 8, 11)
+PHYSICS_TEAM_SIZES = (2, 5, 11)
+SEED = 7
+
+
+def _set_window(size: tuple) -> pygame.Surface:
+	"""Open (or resize) the dummy display and set the render scale for it."""
+	screen = pygame.display.set_mode(size)
+	SCALING.update_size(*size)
+	return screen
+
+
+def _game(surface: pygame.Surface = None, per_team: int = 2, headless: bool = False):
+	"""An AI-vs-AI match already past its kickoff countdown."""
+	from game import Game
+	game = Game(surface, mode="multiplayer_ai", per_team=per_team, minutes=60, headless=headless, seed=SEED)
+	game.countdown_timer = 0.0
+	game.update(game.step_dt)  # leaves the countdown
+	return game
+
+
+# --- Cases: each returns the zero-argument operation to time -----------------
+
+def _kernel_game(per_team: int):
+	"""A headless match with the ball just short of the first left player, heading into it."""
+	game = _game(per_team=per_team, headless=True)
+	world, ball = game.world, game.ball
+	player = game.team_l.players[0]
+	ball.pos = player.pos + V2(player.radius + ball.radius + 1.0, 0.5)
+	ball.vel = V2(-400.0, 0.0)
+	world.snapshot()  # players at rest: start-of-step positions equal current ones
+	return game
+
+
+def case_integrate_players(per_team: int):
+	"""integrate_players over every player of a match (the batched Player.move kernel)."""
+	def make():
+		from physics.world import integrate_players, rect_bounds
+		game = _game(per_team=per_team, headless=True)
+		world = game.world
+		rows = world.players
+		dirs = np.tile((1.0, 1.0), (world.num_players, 1))
+		bounds = rect_bounds(game.pitch.inner)
+		args = (world.player_pos[rows], world.player_vel[rows], dirs, world.player_radius[rows], world.player_accel[rows],
+			world.player_drag[rows], world.player_max_speed[rows])
+
+		def op():
+			integrate_players(*args, game.step_dt, bounds)
+		return op
+	return make
+
+
+def case_find_contacts(per_team: int):
+	"""PhysicsWorld.find_contacts after players moved (broadphase rebuild plus the contact list)."""
+	def make():
+		game = _kernel_game(per_team)
+		world = game.world
+
+		def op():
+			world.mark_players_moved()
+			world.find_contacts(game.step_dt)
+		return op
+	return make
+
+
+def case_sweep_balls(per_team: int):
+	"""PhysicsWorld.sweep_balls for one step in which the ball hits a player."""
+	def make():
+		game = _kernel_game(per_team)
+		world, ball = game.world, game.ball
+		goals = (game.pitch.left_goal, game.pitch.right_goal)
+		restitution = float(CFG.ball.get("restitution", 0.98))
+		contacts = world.find_contacts(game.step_dt)
+		start_pos, start_vel = ball.pos, ball.vel
+
+		def op():
+			ball.pos = start_pos
+			ball.vel = start_vel
+			world.sweep_balls(game.step_dt, ball.play_rect, goals, restitution, contacts)
+		return op
+	return make
+
+
+def case_clamp_balls():
+	"""PhysicsWorld.clamp_balls with one wall bounce: ball placed past the left wall."""
+	game = _game(headless=True)
+	world, ball = game.world, game.ball
+	rect = ball.play_rect
+	start = (rect.left - 2.0, rect.centery)
+	restitution = float(CFG.ball.get("restitution", 0.98))
+
+	def op():
+		ball.pos = start
+		ball.vel = (-300.0, 40.0)
+		world.clamp_balls(rect, restitution)
+	return op
+
+
+def case_player_move():
+	"""One Player.move step with diagonal input."""
+	game = _game(headless=True)
+	player = game.team_l.players[0]
+	rect = game.pitch.inner
+	direction = V2(1, 1)
+	home = player.pos
+
+	def op():
+		player.move(direction, game.step_dt, rect)
+		player.pos = home
+	return op
+
+
+def case_ai_update(per_team: int):
+	"""Both teams' SimpleAI.update for one fixed step."""
+	def make():
+		game = _game(per_team=per_team, headless=True)
+		rect = game.pitch.inner
+		ball = game.ball
+		ball.vel = V2(200.0, 60.0)
+		ai_l, ai_r = game.ai_l, game.ai_r
+		players_l, players_r = game.team_l.players, game.team_r.players
+		rng_state = game.rng.getstate()
+
+		def op():
+			# Same random draws and a full decision pass on every call
+			game.rng.setstate(rng_state)
+			ai_l.timer = ai_l.reaction
+			ai_r.timer = ai_r.reaction
+			ai_l.update(game.step_dt, rect, ball, players_l)
+			ai_r.update(game.step_dt, rect, ball, players_r)
+		return op
+	return make
+
+
+def case_game_step():
+	"""One headless Game.step (AI, kicks, physics, goals) with 2 players per team."""
+	game = _game(headless=True)
+	return lambda: game.step(game.step_dt)
+
+
+def case_pitch_draw(size: tuple):
+	"""Pitch.draw at a window size."""
+	def make():
+		from pitch import Pitch
+		screen = _set_window(size)
+		pitch = Pitch(screen)
+		return lambda: pitch.draw(debug=False)
+	return make
+
+
+def case_hud_draw(size: tuple):
+	"""HUD.draw (score, hint, FPS, timer) at a window size."""
+	def make():
+		from hud import HUD
+		screen = _set_window(size)
+		hud = HUD()
+		return lambda: hud.draw(screen, 1, 2, 10, 12, 120.0, "", time_left=90.0)
+	return make
+
+
+def case_run_frame(size: tuple, dirty_rects: bool = False):
+	"""Full Game.run_frame (events, fixed steps, draw, flip) at a window size, uncapped."""
+	def make():
+		screen = _set_window(size)
+		game = _game(screen)
+		game.dirty_rects = dirty_rects
+		return game.run_frame
+	return make
+
+
+def build_cases() -> dict:
+	"""Benchmark name -> setup function returning the operation."""
+	cases = {
+		"physics.clamp_balls": case_clamp_balls,
+		"physics.player_move": case_player_move,
+	}
+	for n in PHYSICS_TEAM_SIZES:
+		cases[f"physics.integrate_players[{n}v{n}]"] = case_integrate_players(n)
+		cases[f"physics.find_contacts[{n}v{n}]"] = case_find_contacts(n)
+		cases[f"physics.sweep_balls[{n}v{n}]"] = case_sweep_balls(n)
+	cases["sim.game_step"] = case_game_step
+	for n in AI_TEAM_SIZES:
+		cases[f"ai.update[{n}v{n}]"] = case_ai_update(n)
+	for w, h in WINDOW_SIZES:
+		cases[f"render.pitch_draw[{w}x{h}]"] = case_pitch_draw((w, h))
+		cases[f"render.hud_draw[{w}x{h}]"] = case_hud_draw((w, h))
+		cases[f"frame.run_frame[{w}x{h}]"] = case_run_frame((w, h))
+	w, h = WINDOW_SIZES[0]
+	cases[f"frame.run_frame_dirty[{w}x{h}]"] = case_run_frame((w, h), dirty_rects=True)
+	return cases
+
+
+def measure(op, min_time: float, repeat: int) -> float:
+	"""Best-of-repeat operations per second, each repeat lasting at least min_time."""
+	timer = timeit.Timer(op)
+	number = 1
+	while True:
+		if timer.timeit(number) >= min_time:
+			break
+		number *= 2
+	best = min(timer.repeat(repeat, number))
+	return number / best
+
+
+def environment() -> dict:
+	"""Versions recorded next to the numbers."""
+	return {
+		"python": platform.python_version(),
+		"pygame": pygame.version.ver,
+		"numpy": np.__version__,
+		"machine": platform.machine(),
+		"system": platform.system(),
+	}
+
+
+def main() -> None:
+	"""Command line entry point: run the suite and compare with the baseline."""
+	parser = argparse.ArgumentParser(description="Benchmark Tiny Football's hot paths.")
+	parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+	parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timing repeat")
+	parser.add_argument("--repeat", type=int, default=3, help="timing repeats per case (best is kept)")
+	parser.add_argument("--rounds", type=int, default=5, help="passes over the whole suite (best per case is kept)")
+	parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against or write")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+	parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+	args = parser.parse_args()
+
+	pygame.init()
+	# Uncapped frame rate so run_frame measures work, not Clock.tick sleeping
+	CFG.window["fps"] = 0
+	CFG.teams["max_per_team"] = max(CFG.teams.get("max_per_team", 5), max(AI_TEAM_SIZES + PHYSICS_TEAM_SIZES))
+	_set_window(WINDOW_SIZES[0])
+
+	baseline = {}
+	if os.path.exists(args.baseline) and not args.save_baseline:
+		with open(args.baseline, "r", encoding="utf-8") as f:
+			baseline = json.load(f).get("results", {})
+
+	# Every round runs the whole suite, so a burst of machine load lands on
+	# different cases each round; load only slows a case down, so keep the best
+	cases = {name: setup for name, setup in build_cases().items() if args.filter in name}
+	samples = {name: [] for name in cases}
+	for _ in range(max(1, args.rounds)):
+		for name, setup in cases.items():
+			samples[name].append(measure(setup(), args.min_time, args.repeat))
+
+	results = {}
+	regressions = []
+	print(f"{'case':<36} {'ops/s':>12} {'baseline':>12} {'change':>8}")
+	for name, ops_list in samples.items():
+		ops = max(ops_list)
+		results[name] = round(ops, 1)
+		base = baseline.get(name)
+		if base:
+			change = ops / base - 1.0
+			flag = "  SLOWER" if change < -args.tolerance else ""
+			if flag:
+				regressions.append(name)
+			print(f"{name:<36} {ops:>12.1f} {base:>12.1f} {change:>+8.1%}{flag}")
+		else:
+			print(f"{name:<36} {ops:>12.1f} {'-':>12} {'':>8}")
+
+	if args.save_baseline:
+		with open(args.baseline, "w", encoding="utf-8") as f:
+			json.dump({"environment": environment(), "results": results}, f, indent=1)
+			f.write("\n")
+		print(f"\nWrote {len(results)} results to {args.baseline}")
+	elif regressions:
+		print(f"\n{len(regressions)} case(s) more than {args.tolerance:.0%} slower than the baseline: {', '.join(regressions)}")
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
@@ -1,18 +1,25 @@
 """Smarter AI advisor with per-player roles, attacking & defending logic, and difficulty scaling."""
 
 import random
+import numpy as np
 import pygame
 from pygame.math import Vector2 as V2
+from settings import CFG
+from scaling import SCALING
+from physics.predict import BallTrajectory
 
 
 class SimpleAI:
     """AI that controls a whole team with roles, attacking, defending, and difficulty scaling."""
 
-    def __init__(self, side_left: bool, difficulty: str = "Normal"):
+    def __init__(self, side_left: bool, difficulty: str = "Normal", rng: random.Random = None):
         self.left = side_left
+        self.rng = rng if rng is not None else random.Random()  # seed it for reproducible matches
         self.difficulty = difficulty
-        self.targets = {}   # player -> Vector2 target
-        self.hints = {}     # debug hints
+        # Per-player state indexed by Player.pid, sized for the largest allowed team
+        capacity = int(CFG.teams.get("max_per_team", 5))
+        self.targets = np.zeros((capacity, 2))          # pid -> target position
+        self.has_target = np.zeros(capacity, dtype=bool)  # pid -> target set since the last forget()
         self.timer = 0.0
 
         self.set_difficulty(difficulty)
@@ -105,12 +112,24 @@ class SimpleAI:
     #         self.targets[p] = target
     #         self.hints[p] = target
     
+    def _nearest_players(self, players, point: V2, k: int) -> list:
+        """Up to k players ordered by distance to point (ties keep list order).
+
+        Goes through the physics world's spatial hash, so large rosters only
+        scan nearby cells instead of sorting every player.
+        """
+        if not players:
+            return []
+        by_row = {p.index: p for p in players}
+        rows = players[0].world.nearest_players((point.x, point.y), list(by_row), k)
+        return [by_row[r] for r in rows]
+
     def _find_open_teammate(self, players, ball_carrier):
         """Find nearest teammate not holding the ball for passing option."""
-        candidates = [p for p in players if p is not ball_carrier]
-        if not candidates:
-            return None
-        return min(candidates, key=lambda t: (t.pos - ball_carrier.pos).length_squared())
+        for p in self._nearest_players(players, ball_carrier.pos, 2):
+            if p is not ball_carrier:
+                return p
+        return None
     
     def _get_collision_point(self, ball_pos: V2, target_pos: V2, player_radius: float, ball_radius: float) -> V2:
         """
@@ -129,12 +148,14 @@ class SimpleAI:
             (ball_pos.x > pitch_rect.right - margin and (ball_pos.y < pitch_rect.top + margin or ball_pos.y > pitch_rect.bottom - margin))
         )
         
-    def update(self, dt: float, pitch_rect: pygame.Rect, ball_pos: V2, ball_vel: V2, players: list) -> None:
+    def update(self, dt: float, pitch_rect: pygame.Rect, ball, players: list) -> None:
         """Update AI targets with smarter shooting, passing, and team roles."""
         self.timer += dt
         if self.timer < self.reaction:
             return
         self.timer = 0.0
+        ball_pos, ball_vel = ball.pos, ball.vel
+        self._ensure_capacity(len(players))
         corner_stuck = self._ball_in_corner(ball_pos, pitch_rect)
         # Define goals
         if self.left:
@@ -144,11 +165,17 @@ class SimpleAI:
             my_goal = V2(pitch_rect.right - 20, pitch_rect.centery)
             opp_goal = V2(pitch_rect.left + 20, pitch_rect.centery)
 
-        # Sort players by distance to ball
-        ordered_players = sorted(players, key=lambda p: (p.pos - ball_pos).length_squared())
+        # Two players nearest to the ball (broadphase query instead of a full sort)
+        ordered_players = self._nearest_players(players, ball_pos, 2)
         nearest = ordered_players[0] if ordered_players else None
         second_nearest = ordered_players[1] if len(ordered_players) > 1 else None
 
+        # Defenders hold a line in their own half and meet the ball where it will cross it
+        defend_x = pitch_rect.left + pitch_rect.width * 0.25 if self.left else pitch_rect.right - pitch_rect.width * 0.25
+        intercept = None
+        if len(players) > 2 and self._ball_heading_to_goal(ball_pos, ball_vel, my_goal, pitch_rect):
+            intercept = self._predict_intercept(ball, V2(defend_x, pitch_rect.centery), pitch_rect)
+
         for i, p in enumerate(players):
             has_ball = getattr(p, "has_ball", False)
             ball_radius = 10  # approx
@@ -194,16 +221,16 @@ class SimpleAI:
             elif has_ball:
                 # Ball carrier: shoot or pass
                 teammate = self._find_open_teammate(players, p)
-                if teammate and random.random() < self.awareness:
+                if teammate and self.rng.random() < self.awareness:
                     target_point = teammate.pos
                 else:
                     # Shoot with difficulty-based accuracy
                     if self.difficulty == "Hard":
-                        goal_y = opp_goal.y + random.uniform(-20, 20)
+                        goal_y = opp_goal.y + self.rng.uniform(-20, 20)
                     elif self.difficulty == "Normal":
-                        goal_y = opp_goal.y + random.uniform(-50, 50)
+                        goal_y = opp_goal.y + self.rng.uniform(-50, 50)
                     else:
-                        goal_y = opp_goal.y + random.uniform(-100, 100)
+                        goal_y = opp_goal.y + self.rng.uniform(-100, 100)
                     target_point = V2(opp_goal.x, goal_y)
 
                 # Compute collision approach
@@ -219,17 +246,13 @@ class SimpleAI:
                 # Supporter: position for a pass (triangle support)
                 direction = (opp_goal - ball_pos).normalize()
                 perp = V2(-direction.y, direction.x)  # perpendicular vector
-                side = 1 if random.random() > 0.5 else -1
+                side = 1 if self.rng.random() > 0.5 else -1
                 support_offset = perp * 120 * side
                 target = ball_pos + support_offset
 
             else:
-                # Defenders: stay in own half, aligned with ball
-                if self.left:
-                    base_x = pitch_rect.left + pitch_rect.width * 0.25
-                else:
-                    base_x = pitch_rect.right - pitch_rect.width * 0.25
-                target = V2(base_x, ball_pos.y)
+                # Defenders: stay in own half, aligned with the ball or its predicted crossing
+                target = V2(intercept) if intercept is not None else V2(defend_x, ball_pos.y)
 
             # Clamp inside pitch
             target.x = max(pitch_rect.left + 20, min(pitch_rect.right - 20, target.x))
@@ -238,12 +261,20 @@ class SimpleAI:
             # Add difficulty error
             if not self._ball_heading_to_goal(ball_pos, ball_vel, my_goal, pitch_rect):
                 target += V2(
-                    random.uniform(-self.error_range, self.error_range),
-                    random.uniform(-self.error_range, self.error_range),
+                    self.rng.uniform(-self.error_range, self.error_range),
+                    self.rng.uniform(-self.error_range, self.error_range),
                 )
 
-            self.targets[p] = target
-            self.hints[p] = target
+            self.targets[p.pid] = (target.x, target.y)
+            self.has_target[p.pid] = True
+
+    def _ensure_capacity(self, n: int) -> None:
+        """Grow the per-player arrays to hold pids 0..n-1 (only if a team outgrows max_per_team)."""
+        capacity = len(self.has_target)
+        if n <= capacity:
+            return
+        self.targets = np.vstack([self.targets, np.zeros((n - capacity, 2))])
+        self.has_target = np.concatenate([self.has_target, np.zeros(n - capacity, dtype=bool)])
 
     def _ball_heading_to_goal(self, ball_pos: V2, ball_vel: V2, my_goal: V2, pitch_rect: pygame.Rect) -> bool:
         """Check if ball is moving toward my half/goal."""
@@ -253,26 +284,38 @@ class SimpleAI:
             return True
         return False
 
-    def _predict_intercept(self, ball_pos: V2, ball_vel: V2, my_goal: V2, pitch_rect: pygame.Rect) -> V2 | None:
-        """Predict where to intercept ball before it hits our goal line."""
-        if abs(ball_vel.x) < 1e-3:
+    def _predict_intercept(self, ball, my_goal: V2, pitch_rect: pygame.Rect) -> V2 | None:
+        """Predict where the ball crosses the vertical line x = my_goal.x (None if it stops first).
+
+        Follows the ball's real path: friction slows it down and it bounces off
+        the pitch walls on the way.
+        """
+        if ball.vel.length_squared() < 1e-6:
             return None
-        t = (my_goal.x - ball_pos.x) / ball_vel.x
-        if t < 0:
+        trajectory = BallTrajectory.of(ball)
+        t = trajectory.time_to_line(0, my_goal.x)
+        if t == float("inf"):
             return None
-        intercept_y = ball_pos.y + ball_vel.y * t
+        intercept_y = trajectory.position(t)[1]
         intercept_y = max(pitch_rect.top + 30, min(pitch_rect.bottom - 30, intercept_y))
         return V2(my_goal.x, intercept_y)
 
     def advise_direction(self, player) -> V2:
-        target = self.targets.get(player)
-        if target is None:
+        """Unit vector from player toward its current target (zero if it has none)."""
+        if player.pid >= len(self.has_target) or not self.has_target[player.pid]:
             return V2(0, 0)
-        d = target - player.pos
+        d = V2(*self.targets[player.pid].tolist()) - player.pos
         return d.normalize() if d.length_squared() > 0 else V2(0, 0)
 
-    def draw_hint(self, surface: pygame.Surface, debug: bool = False) -> None:
+    def forget(self) -> None:
+        """Drop per-player targets (kickoff: players start from rest)."""
+        self.has_target[:] = False
+
+    def draw_hint(self, surface: pygame.Surface, debug: bool = False) -> list:
+        """Draw the AI target markers in debug mode; returns the drawn rects."""
         if not debug:
-            return
-        for pos in self.hints.values():
-            pygame.draw.circle(surface, (100, 180, 255), (int(pos.x), int(pos.y)), 6, 2)
+            return []
+        # Targets are in world units: same transform as the players
+        s = SCALING.geometry.scale
+        ox, oy = SCALING.geometry.offset
+        return [pygame.draw.circle(surface, (100, 180, 255), (int(x * s + ox), int(y * s + oy)), 6, 2) for x, y in self.targets[self.has_target].tolist()]
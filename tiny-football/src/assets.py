@@ -0,0 +1,97 @@
+"""Central asset manager: images, pre-scaled copies and sounds, loaded once.
+
+Every image and sound is decoded from disk once per process and shared, so new
+matches, kickoffs after a goal and the menu never touch the file system again.
+Scaled copies are cached by (asset, size, smooth): all entities drawing the
+same sprite at the same size share one Surface, and after a window resize each
+sprite is scaled once instead of every frame. Scaled copies are kept under a
+byte budget and the least recently used ones are dropped first, so dragging
+the window edge does not pile up stale copies. Missing or unreadable files are
+remembered as None.
+"""
+
+import os
+from collections import OrderedDict
+import pygame
+
+ASSET_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+
+
+class AssetManager:
+	"""Decoded images and sounds keyed by asset path, plus scaled image copies.
+
+	Args:
+		budget_bytes: Pixel memory allowed for scaled copies before the least
+			recently used are dropped (originals are always kept).
+	"""
+
+	def __init__(self, budget_bytes: int = 32 * 1024 * 1024):
+		self.budget_bytes = budget_bytes
+		self.images = {}  # (asset, alpha) -> Surface (None if missing or unreadable)
+		self.sounds = {}  # asset -> Sound (None if missing, unreadable or no mixer)
+		self.scaled = OrderedDict()  # (asset, size, smooth, alpha) -> Surface, least recent first
+		self.scaled_bytes = 0
+
+	def path(self, asset: str):
+		"""Absolute path of asset (e.g. "sfx/goal.wav"), or None if the file does not exist."""
+		path = os.path.join(ASSET_DIR, asset)
+		return path if os.path.exists(path) else None
+
+	def load(self, asset: str, alpha: bool = True):
+		"""Original image of asset (a path under assets/, e.g. "gfx/ball.png"); None if unavailable."""
+		key = (asset, alpha)
+		if key not in self.images:
+			try:
+				image = pygame.image.load(os.path.join(ASSET_DIR, asset))
+				self.images[key] = image.convert_alpha() if alpha else image.convert()
+			except (pygame.error, FileNotFoundError):
+				self.images[key] = None
+		return self.images[key]
+
+	def get(self, asset: str, size: tuple, smooth: bool = False, alpha: bool = True):
+		"""asset scaled to size (smoothscaled if smooth), scaled once and shared; None if unavailable."""
+		size = (max(1, int(size[0])), max(1, int(size[1])))
+		key = (asset, size, smooth, alpha)
+		surf = self.scaled.get(key)
+		if surf is not None:
+			self.scaled.move_to_end(key)
+			return surf
+		image = self.load(asset, alpha)
+		if image is None:
+			return None
+		if image.get_size() == size:
+			return image
+		surf = pygame.transform.smoothscale(image, size) if smooth else pygame.transform.scale(image, size)
+		self.scaled[key] = surf
+		self.scaled_bytes += self._bytes(surf)
+		# Evict least recently used copies (never the one just made)
+		while self.scaled_bytes > self.budget_bytes and len(self.scaled) > 1:
+			_, old = self.scaled.popitem(last=False)
+			self.scaled_bytes -= self._bytes(old)
+		return surf
+
+	def sound(self, asset: str):
+		"""Shared Sound for asset; None if the file is missing or cannot be played."""
+		if not pygame.mixer.get_init():
+			return None  # not cached: the mixer may come up later
+		if asset not in self.sounds:
+			path = self.path(asset)
+			try:
+				self.sounds[asset] = pygame.mixer.Sound(path) if path else None
+			except pygame.error:
+				self.sounds[asset] = None
+		return self.sounds[asset]
+
+	def clear(self) -> None:
+		"""Drop every loaded image, scaled copy and sound."""
+		self.images.clear()
+		self.sounds.clear()
+		self.scaled.clear()
+		self.scaled_bytes = 0
+
+	@staticmethod
+	def _bytes(surf: pygame.Surface) -> int:
+		return surf.get_pitch() * surf.get_height()
+
+
+ASSETS = AssetManager()
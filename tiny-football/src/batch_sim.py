@@ -0,0 +1,257 @@
+"""Lockstep batch simulator for many independent AI-vs-AI matches.
+
+All N matches share one set of arrays shaped (N, players, 2) for players and
+(N, 2) for balls, and every physics stage (player movement, the proximity
+stage that feeds kicks, hit counters and possession, swept ball motion
+against walls, players and goal sensors, force field) runs as a single array
+operation across the batch. Only the AI's decision making
+and kickoff resets stay per match in Python.
+
+Each match is backed by a regular headless Game whose PhysicsWorld is bound to
+its slice of the batch arrays, so kickoffs, team layouts and AI behave exactly
+as in the single-match engine and per-match results agree with run_match().
+"""
+
+import argparse
+import time
+import numpy as np
+from settings import CFG
+from game import Game
+from physics.world import PhysicsWorld, Contacts, integrate_players, damp_balls, clamp_balls_with_walls, rect_bounds
+from physics.sweep import sweep_balls, GOAL_LEFT, GOAL_NONE
+
+# Match states, mirroring Game.state
+COUNTDOWN, PLAYING, GOAL_PAUSE, FINISHED = range(4)
+
+
+class BatchSimulator:
+	"""Advances N multiplayer_ai matches one fixed tick at a time, in lockstep.
+
+	Args:
+		seeds: One seed per match; the batch size is len(seeds).
+		per_team: Players per team (the same for every match).
+		minutes: Match length in minutes.
+		ai_difficulty: One difficulty for all matches, or one per match.
+		dt: Tick length in seconds; defaults to the configured fixed step.
+	"""
+
+	def __init__(self, seeds: list, per_team: int = 2, minutes: int = 2, ai_difficulty="Normal", dt: float = None):
+		n = len(seeds)
+		# Same clamp as Team, so every array row holds a real player
+		per_team = int(max(1, min(per_team, CFG.teams.get("max_per_team", 5))))
+		p = 2 * per_team
+		self.size = n
+		self.n_left = per_team
+		self.dt = dt or 1.0 / max(1, int(CFG.sim.get("tick_rate", CFG.fps)))
+		difficulties = [ai_difficulty] * n if isinstance(ai_difficulty, str) else list(ai_difficulty)
+
+		# Step 1: allocate batch storage, one row per match
+		self.player_pos = np.zeros((n, p, 2))
+		self.player_prev = np.zeros((n, p, 2))
+		self.player_vel = np.zeros((n, p, 2))
+		self.player_radius = np.zeros((n, p))
+		self.player_accel = np.zeros((n, p))
+		self.player_max_speed = np.zeros((n, p))
+		self.player_drag = np.zeros((n, p))
+		self.player_has_ball = np.zeros((n, p), dtype=bool)
+		self.ball_pos = np.zeros((n, 1, 2))
+		self.ball_prev = np.zeros((n, 1, 2))
+		self.ball_vel = np.zeros((n, 1, 2))
+		self.ball_radius = np.zeros((n, 1))
+		self.ball_friction = np.zeros((n, 1))
+		self.ball_max_speed = np.zeros((n, 1))
+		# AI targets copied out of each SimpleAI whenever it re-plans
+		self.target = np.zeros((n, p, 2))
+		self.has_target = np.zeros((n, p), dtype=bool)
+
+		# Step 2: build one headless Game per match on its slice of the arrays
+		self.games = []
+		for i, (seed, difficulty) in enumerate(zip(seeds, difficulties)):
+			world = PhysicsWorld.bound_to({name: getattr(self, name)[i] for name in PhysicsWorld.PLAYER_FIELDS + PhysicsWorld.BALL_FIELDS})
+			self.games.append(Game(None, mode="multiplayer_ai", per_team=per_team, minutes=minutes, ai_difficulty=difficulty, headless=True, seed=seed, world=world))
+
+		# Step 3: per-match state machine and statistics as arrays
+		game = self.games[0]
+		self.state = np.full(n, COUNTDOWN)
+		self.countdown_timer = np.full(n, game.countdown_timer)
+		self.time_left = np.full(n, game.match_time)
+		self.score = np.zeros((n, 2), dtype=int)
+		self.hits = np.zeros((n, 2), dtype=int)
+		self.possession = np.zeros((n, 2))
+		self.ticks = np.zeros(n, dtype=int)
+
+		# Every match uses the same pitch geometry
+		self.play_rect = game.pitch.inner
+		self.bounds = rect_bounds(self.play_rect)
+		self.ball_bounds = rect_bounds(game.ball.play_rect)
+		self.goals = (rect_bounds(game.pitch.left_goal), rect_bounds(game.pitch.right_goal))
+		self.restitution = float(CFG.ball.get("restitution", 0.98))
+
+	@property
+	def done(self) -> bool:
+		"""True once every match has finished."""
+		return bool((self.state == FINISHED).all())
+
+	def step(self) -> None:
+		"""Advance every unfinished match by one tick (Game.step for all of them at once)."""
+		dt = self.dt
+		live = self.state != FINISHED
+		sel = slice(None) if live.all() else np.flatnonzero(live)
+
+		# Step 1: start-of-step snapshot (swept contacts move players from prev to pos)
+		self.player_prev[sel] = self.player_pos[sel]
+		self.ball_prev[sel] = self.ball_pos[sel]
+
+		# Step 2: AI movement - unit directions towards each player's target
+		d = self.target[sel] - self.player_pos[sel]
+		l2 = np.add.reduce(d * d, axis=-1)
+		move = self.has_target[sel] & (l2 > 0)
+		dirs = np.where(move[..., None], d / np.sqrt(np.where(move, l2, 1.0))[..., None], 0.0)
+		pos, vel = integrate_players(
+			self.player_pos[sel], self.player_vel[sel], dirs, self.player_radius[sel], self.player_accel[sel],
+			self.player_drag[sel], self.player_max_speed[sel], dt, self.bounds,
+		)
+		self.player_pos[sel] = pos
+		self.player_vel[sel] = vel
+
+		# Step 3: proximity stage, then auto kicks (left team's columns come first, as in Game._handle_kicks)
+		contacts = Contacts(self.ball_pos[sel, 0], self.ball_radius[sel, 0], self.player_pos[sel], self.player_radius[sel])
+		ball_vel = self.ball_vel[sel, 0]
+		contacts.apply_kicks(ball_vel, self.ball_max_speed[sel, 0])
+		self.ball_vel[sel, 0] = ball_vel
+
+		# Step 4: state machine timers (Game.update returns early outside "playing")
+		state = self.state.copy()
+		waiting = (state == COUNTDOWN) | (state == GOAL_PAUSE)
+		self.countdown_timer[waiting] -= dt
+		self.state[waiting & (self.countdown_timer <= 0)] = PLAYING
+		playing = state == PLAYING
+		self.time_left[playing] -= dt
+		ended = playing & (self.time_left <= 0)
+		self.state[ended] = FINISHED
+		self.time_left[ended] = 0.0
+		self.ticks[live] += 1
+		active = np.flatnonzero(playing & ~ended)
+		if active.size:
+			# Contact rows of the active matches (contacts cover the live ones)
+			rows = active if isinstance(sel, slice) else np.searchsorted(sel, active)
+			self._step_physics(active, dt, contacts, rows)
+
+	def _step_physics(self, active: np.ndarray, dt: float, contacts: Contacts, rows: np.ndarray) -> None:
+		"""Swept ball motion, force field, AI, hit counters, possession and goals for playing matches."""
+		a = slice(None) if active.size == self.size else active
+
+		# Step 1: swept ball motion (walls, players, goal sensors), friction, force field, wall clamp
+		pos = self.ball_pos[a, 0]
+		vel = self.ball_vel[a, 0]
+		radius = self.ball_radius[a, 0]
+		player_pos = self.player_pos[a]
+		player_radius = self.player_radius[a]
+		hits, _, goal = sweep_balls(pos, vel, radius, player_pos, self.player_prev[a], self.player_vel[a], player_radius, self.ball_bounds, self.goals, self.restitution, dt)
+		vel = damp_balls(vel, self.ball_friction[a, 0], self.ball_max_speed[a, 0])
+		self.games[0].force.apply_batch(pos, vel, self.ball_max_speed[a, 0], dt)
+		clamp_balls_with_walls(pos, vel, radius, self.ball_bounds, self.restitution)
+		self.ball_pos[a, 0] = pos
+		self.ball_vel[a, 0] = vel
+		contacts.hit[rows] = hits
+
+		# Step 2: possession flags from the contact list, read by the AI through Player.has_ball
+		has_ball = contacts.has_ball()[rows]
+		self.player_has_ball[a] = has_ball
+
+		# Step 3: AI re-planning, per match (SimpleAI.update only acts every `reaction` seconds)
+		n_left = self.n_left
+		for i in active.tolist():
+			game = self.games[i]
+			for ai, team, offset in ((game.ai_l, game.team_l, 0), (game.ai_r, game.team_r, n_left)):
+				if ai.timer + dt < ai.reaction:
+					ai.timer += dt
+					continue
+				# Positions were integrated in the batch arrays; let the AI's broadphase see them
+				game.world.mark_players_moved()
+				ai.update(dt, self.play_rect, game.ball, team.players)
+				# AI targets are indexed by pid, which matches the team's column order
+				n = len(team.players)
+				self.target[i, offset:offset + n] = ai.targets[:n]
+				self.has_target[i, offset:offset + n] = True
+
+		# Step 4: hit counters and possession time
+		hits = contacts.hit[rows]
+		self.hits[a, 0] += hits[:, :n_left].sum(axis=1)
+		self.hits[a, 1] += hits[:, n_left:].sum(axis=1)
+		self.possession[a, 0] += np.where(has_ball[:, :n_left].any(axis=1), dt, 0.0)
+		self.possession[a, 1] += np.where(has_ball[:, n_left:].any(axis=1), dt, 0.0)
+
+		# Step 5: goal sensors; kickoff resets run through the match's Game
+		for k in np.flatnonzero(goal != GOAL_NONE).tolist():
+			i = int(active[k])
+			self.score[i, 1 if goal[k] == GOAL_LEFT else 0] += 1
+			self.games[i]._goal_scored()
+			self.state[i] = GOAL_PAUSE
+			self.countdown_timer[i] = self.games[i].countdown_timer
+			self.has_target[i] = False
+
+	def run(self) -> list:
+		"""Step until every match has finished and return their results."""
+		while not self.done:
+			self.step()
+		return self.results()
+
+	def results(self) -> list:
+		"""Per-match result dictionaries, in the same format as Game.result()."""
+		out = []
+		for i, game in enumerate(self.games):
+			out.append({
+				"mode": game.mode,
+				"per_team": self.n_left,
+				"minutes": game.match_time / 60.0,
+				"ai_difficulty": game.ai_difficulty,
+				"score_l": int(self.score[i, 0]),
+				"score_r": int(self.score[i, 1]),
+				"hits_l": int(self.hits[i, 0]),
+				"hits_r": int(self.hits[i, 1]),
+				"possession_l": float(self.possession[i, 0]),
+				"possession_r": float(self.possession[i, 1]),
+				"ticks": int(self.ticks[i]),
+				"finished": bool(self.state[i] == FINISHED),
+			})
+		return out
+
+
+def run_batch(matches: int, per_team: int = 2, minutes: int = 2, ai_difficulty: str = "Normal", seed: int = 0) -> list:
+	"""Play `matches` seeded matches in lockstep; match i uses seed + i."""
+	sim = BatchSimulator([seed + i for i in range(matches)], per_team=per_team, minutes=minutes, ai_difficulty=ai_difficulty)
+	return sim.run()
+
+
+def main() -> None:
+	"""Command line entry point: run a batch and optionally check it against the single-match engine."""
+	parser = argparse.ArgumentParser(description="Run many Tiny Football AI matches in lockstep.")
+	parser.add_argument("--matches", type=int, default=100, help="number of matches in the batch")
+	parser.add_argument("--per-team", type=int, default=2, help="players per team")
+	parser.add_argument("--minutes", type=int, default=2, help="match length in minutes")
+	parser.add_argument("--difficulty", default="Normal", choices=["Easy", "Normal", "Hard"])
+	parser.add_argument("--seed", type=int, default=0, help="seed of the first match (match i uses seed + i)")
+	parser.add_argument("--verify", type=int, default=0, metavar="K", help="replay the first K matches with the single-match engine and compare")
+	args = parser.parse_args()
+
+	start = time.perf_counter()
+	results = run_batch(args.matches, args.per_team, args.minutes, args.difficulty, args.seed)
+	elapsed = time.perf_counter() - start
+	ticks = sum(r["ticks"] for r in results)
+	goals = sum(r["score_l"] + r["score_r"] for r in results)
+	print(f"{len(results)} matches, {goals} goals, {ticks} match ticks in {elapsed:.2f}s ({ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+
+	if args.verify:
+		from headless import run_match
+		mismatches = 0
+		for i, res in enumerate(results[:args.verify]):
+			single = run_match(per_team=args.per_team, minutes=args.minutes, ai_difficulty=args.difficulty, seed=args.seed + i)
+			if single != res:
+				mismatches += 1
+				print(f"match {i}: batch {res} != single {single}")
+		print(f"verified {min(args.verify, len(results))} matches, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+	main()
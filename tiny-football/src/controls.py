@@ -0,0 +1,102 @@
+"""Key bindings as data, and a single-pass key dispatcher.
+
+Bindings are plain tables: key code -> action name for the game, and a
+controls dict per team (held movement keys plus cycle, select and kick keys).
+Rebinding a key means editing these tables; Game and Team turn them into a
+KeyDispatcher, which walks a frame's events once and looks every KEYDOWN up in
+the table of the current mode, so the cost does not grow with the number of
+handlers.
+"""
+
+import pygame
+
+# Game actions while the match runs, and the only one available while paused
+GAME_KEYS = {
+	pygame.K_p: "pause",
+	pygame.K_r: "restart",
+	pygame.K_m: "mute",
+	pygame.K_b: "debug",
+	pygame.K_F3: "profiler",
+}
+PAUSED_KEYS = {
+	pygame.K_p: "pause",
+}
+
+# Per-team controls: movement keys are read as held keys every step, the rest
+# are KEYDOWN actions ("select" lists the keys for players 1, 2, ...)
+TEAM_CONTROLS = {
+	"p1": {
+		"up": pygame.K_w, "down": pygame.K_s, "left": pygame.K_a, "right": pygame.K_d,
+		"cycle": pygame.K_TAB, "kick": pygame.K_SPACE,
+		"select": (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5),
+	},
+	"p2": {
+		"up": pygame.K_UP, "down": pygame.K_DOWN, "left": pygame.K_LEFT, "right": pygame.K_RIGHT,
+		"cycle": pygame.K_k, "kick": pygame.K_RETURN,
+		"select": (pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9, pygame.K_0),
+	},
+}
+
+# Game actions listed in the on-screen controls hint, with their labels
+HINT_ACTIONS = (("debug", "stats"), ("pause", "pause"), ("mute", "mute"))
+ARROWS = (pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT)
+
+
+def key_label(key: int) -> str:
+	"""Display name of a key ("W", "Tab", "F3")."""
+	name = pygame.key.name(key)
+	return name.upper() if len(name) == 1 or name[0] == "f" and name[1:].isdigit() else name.title()
+
+
+def controls_hint() -> str:
+	"""One-line controls summary built from TEAM_CONTROLS and GAME_KEYS."""
+	p1, p2 = TEAM_CONTROLS["p1"], TEAM_CONTROLS["p2"]
+
+	def movement(ctrl: dict) -> str:
+		keys = tuple(ctrl[d] for d in ("up", "left", "down", "right"))
+		return "Arrows" if keys == ARROWS else "".join(key_label(k) for k in keys)
+
+	def select(ctrl: dict) -> str:
+		keys = ctrl["select"]
+		return f"{key_label(keys[0])}-{key_label(keys[-1])}"
+
+	parts = [
+		f"{movement(p1)} vs {movement(p2)}",
+		f"{key_label(p1['cycle'])}/{key_label(p2['cycle'])}: cycle",
+		f"{select(p1)}/{select(p2)}: select",
+	]
+	for action, label in HINT_ACTIONS:
+		keys = [key_label(k) for k, name in GAME_KEYS.items() if name == action]
+		if keys:
+			parts.append(f"{'/'.join(keys)}: {label}")
+	return " | ".join(parts)
+
+
+class KeyDispatcher:
+	"""Per-mode key -> actions tables, applied to a list of events in one pass."""
+
+	def __init__(self):
+		self.tables = {}  # mode -> {key: [(action, args), ...]}
+
+	def bind(self, mode: str, key: int, action, *args) -> None:
+		"""Call action(*args) when key is pressed in mode (after any actions already bound to it)."""
+		self.tables.setdefault(mode, {}).setdefault(key, []).append((action, args))
+
+	def bind_map(self, mode: str, keymap: dict, actions: dict) -> None:
+		"""Bind every key of keymap (key -> action name) to the callable named in actions."""
+		for key, name in keymap.items():
+			self.bind(mode, key, actions[name])
+
+	def clear(self) -> None:
+		"""Drop every binding."""
+		self.tables.clear()
+
+	def dispatch(self, events: list, mode: str) -> None:
+		"""Run the actions bound in mode for each KEYDOWN in events, in event order."""
+		table = self.tables.get(mode)
+		if not table:
+			return
+		for e in events:
+			if e.type == pygame.KEYDOWN:
+				for action, args in table.get(e.key, ()):
+					action(*args)
@@ -1,62 +1,128 @@
 """Player entity for Tiny Football, with movement and kick methods."""
 
-import os
 import pygame
 from pygame.math import Vector2 as V2
 from settings import CFG
 from scaling import SCALING
+from assets import ASSETS
+from fonts import FONTS
+from physics.world import PhysicsWorld
 
 
 class Player:
-	"""A controllable round player pawn with movement and kicking abilities."""
+	"""A controllable round player pawn with movement and kicking abilities.
+
+	Physics state (position, velocity, radius, acceleration, speed cap, drag,
+	possession) lives in a row of a shared PhysicsWorld; the attributes below
+	are views onto that row, in world units (the unscaled 960x540 field).
+	"""
 	
-	def __init__(self, pos: V2, color, active_glow, team_key: str = "p1", player_name: str = "", pitch_rect: pygame.Rect = None, is_left_team: bool = True):
-		"""Initialize player with physics properties and optional sprite."""
-		self.pos = V2(pos)
-		self.vel = V2(0, 0)
-		self.radius = int(CFG.player.get("radius", 16))
-		self.accel = float(CFG.player.get("accel", 2600))
-		self.max_speed = float(CFG.player.get("speed", 260))
-		self.drag = float(CFG.player.get("drag", 0.90))
+	def __init__(self, pos: V2, color, active_glow, team_key: str = "p1", player_name: str = "", is_left_team: bool = True, load_sprite: bool = True, world: PhysicsWorld = None, pid: int = 0):
+		"""Initialize player with physics properties and optional sprite.
+
+		pid is the player's stable slot in its team (0..per_team-1); it never
+		changes during a match and indexes per-player state such as the AI's
+		target arrays.
+		"""
+		self.pid = pid
+		self.world = world if world is not None else PhysicsWorld(player_capacity=1)
+		self.index = self.world.add_player(V2(pos), *self.tuning())
 		self.color = color
 		self.active_glow = active_glow
 		self.is_active = False
 		self.player_name = player_name
 		self.team_key = team_key
 		self.is_left_team = is_left_team
-		
-		# Ball possession tracking for AI decision-making
-		self.has_ball = False
-
 		# Home x coordinate used by AI line-lock and half-field clamping visuals
 		self.home_x = float(self.pos.x)
 		
-		# Store percentage-based position for scaling
-		if pitch_rect and pitch_rect.width > 0 and pitch_rect.height > 0:
-			if is_left_team:
-				# Left team: percentage from left edge and top edge
-				self.percent_x = (pos.x - pitch_rect.left) / pitch_rect.width
-				self.percent_y = (pos.y - pitch_rect.top) / pitch_rect.height
-			else:
-				# Right team: percentage from right edge and top edge
-				self.percent_x = (pitch_rect.right - pos.x) / pitch_rect.width
-				self.percent_y = (pos.y - pitch_rect.top) / pitch_rect.height
-		else:
-			self.percent_x = 0.1  # Default positions
-			self.percent_y = 0.5
-		
-		# Load player sprite
+		# Load player sprite (skipped for headless simulation)
 		self.sprite = None
-		try:
-			base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
-			sprite_path = os.path.join(base_dir, "assets", "gfx", f"player_{team_key}.png")
-			if os.path.exists(sprite_path):
-				self.sprite = pygame.image.load(sprite_path).convert_alpha()
-				# Scale sprite to fit player radius
-				size = self.radius * 2
-				self.sprite = pygame.transform.scale(self.sprite, (size, size))
-		except Exception:
-			self.sprite = None
+		if not load_sprite:
+			return
+		# Shared, pre-scaled sprite (None if the image is missing)
+		self.sprite_name = f"gfx/player_{team_key}.png"
+		size = int(self.radius * 2)
+		self.sprite = ASSETS.get(self.sprite_name, (size, size))
+
+	@staticmethod
+	def tuning() -> tuple:
+		"""Configured (radius, accel, max_speed, drag) for a fresh player."""
+		return (
+			int(CFG.player.get("radius", 16)),
+			float(CFG.player.get("accel", 2600)),
+			float(CFG.player.get("speed", 260)),
+			float(CFG.player.get("drag", 0.90)),
+		)
+
+	@property
+	def pos(self) -> V2:
+		"""Current position (copy of the world row; assign to change it)."""
+		return V2(*self.world.player_pos[self.index].tolist())
+
+	@pos.setter
+	def pos(self, value) -> None:
+		self.world.player_pos[self.index] = value
+		self.world.mark_players_moved()
+
+	@property
+	def vel(self) -> V2:
+		"""Current velocity (copy of the world row; assign to change it)."""
+		return V2(*self.world.player_vel[self.index].tolist())
+
+	@vel.setter
+	def vel(self, value) -> None:
+		self.world.player_vel[self.index] = value
+
+	@property
+	def prev_pos(self) -> V2:
+		"""Position at the previous fixed step, used for render interpolation."""
+		return V2(*self.world.player_prev[self.index].tolist())
+
+	@prev_pos.setter
+	def prev_pos(self, value) -> None:
+		self.world.player_prev[self.index] = value
+
+	@property
+	def radius(self) -> float:
+		return float(self.world.player_radius[self.index])
+
+	@radius.setter
+	def radius(self, value: float) -> None:
+		self.world.player_radius[self.index] = value
+
+	@property
+	def accel(self) -> float:
+		return float(self.world.player_accel[self.index])
+
+	@accel.setter
+	def accel(self, value: float) -> None:
+		self.world.player_accel[self.index] = value
+
+	@property
+	def max_speed(self) -> float:
+		return float(self.world.player_max_speed[self.index])
+
+	@max_speed.setter
+	def max_speed(self, value: float) -> None:
+		self.world.player_max_speed[self.index] = value
+
+	@property
+	def drag(self) -> float:
+		return float(self.world.player_drag[self.index])
+
+	@drag.setter
+	def drag(self, value: float) -> None:
+		self.world.player_drag[self.index] = value
+
+	@property
+	def has_ball(self) -> bool:
+		"""Ball possession flag for AI decision-making (set by the world's possession pass)."""
+		return bool(self.world.player_has_ball[self.index])
+
+	@has_ball.setter
+	def has_ball(self, value: bool) -> None:
+		self.world.player_has_ball[self.index] = value
 
 	def move(self, input_dir: V2, dt: float, pitch_rect: pygame.Rect) -> None:
 		"""Update player position based on input direction and physics.
@@ -86,62 +152,8 @@ class Player:
 		   pos.x = clamp(pos.x, left_bound + radius, right_bound - radius)
 		   pos.y = clamp(pos.y, top_bound + radius, bottom_bound - radius)
 		"""
-		# Step 1: Normalize input direction for consistent acceleration
-		if input_dir.length_squared() > 0:
-			input_dir = input_dir.normalize()
-			# Step 2: Apply acceleration (F = ma, but a is constant)
-			self.vel += input_dir * self.accel * dt
-		
-		# Step 3: Apply drag/friction (exponential velocity decay)
-		self.vel *= self.drag
-		
-		# Step 4: Limit maximum speed (velocity magnitude capping)
-		spd = self.vel.length()
-		if spd > self.max_speed:
-			self.vel.scale_to_length(self.max_speed)
-		
-		# Step 5: Update position (kinematic integration)
-		self.pos += self.vel * dt
-		
-		# Step 6: Boundary collision detection and response (position clamping)
-		r = self.radius
-		self.pos.x = max(pitch_rect.left + r, min(pitch_rect.right - r, self.pos.x))
-		self.pos.y = max(pitch_rect.top + r, min(pitch_rect.bottom - r, self.pos.y))
-		
-		# Update percentage position after movement
-		self.update_percentage_position(pitch_rect)
-	
-	def update_percentage_position(self, pitch_rect: pygame.Rect) -> None:
-		"""Update percentage position based on current absolute position."""
-		if pitch_rect.width > 0 and pitch_rect.height > 0:
-			if self.is_left_team:
-				# Left team: percentage from left edge (ax distance)
-				self.percent_x = (self.pos.x - pitch_rect.left) / pitch_rect.width
-				self.percent_y = (self.pos.y - pitch_rect.top) / pitch_rect.height
-			else:
-				# Right team: percentage from right edge (bx distance) 
-				self.percent_x = (pitch_rect.right - self.pos.x) / pitch_rect.width
-				self.percent_y = (self.pos.y - pitch_rect.top) / pitch_rect.height
-				
-			# Clamp to valid range
-			self.percent_x = max(0.0, min(1.0, self.percent_x))
-			self.percent_y = max(0.0, min(1.0, self.percent_y))
-			
-	
-	def set_position_from_percentage(self, pitch_rect: pygame.Rect) -> None:
-		"""Set absolute position based on percentage position and pitch size."""
-		if pitch_rect.width > 0 and pitch_rect.height > 0:
-			if self.is_left_team:
-				# Left team: maintain ax distance from left edge
-				self.pos.x = pitch_rect.left + self.percent_x * pitch_rect.width
-				self.pos.y = pitch_rect.top + self.percent_y * pitch_rect.height
-			else:
-				# Right team: maintain bx distance from right edge
-				self.pos.x = pitch_rect.right - self.percent_x * pitch_rect.width
-				self.pos.y = pitch_rect.top + self.percent_y * pitch_rect.height
-			
-			# Update home_x for AI
-			self.home_x = self.pos.x
+		# Steps 1-6 run in the world's batched kernel (a batch of one here)
+		self.world.move_players(slice(self.index, self.index + 1), (tuple(input_dir),), dt, pitch_rect)
 
 	def kick(self, ball) -> bool:
 		"""Attempt to kick the ball if within reach.
@@ -174,53 +186,54 @@ class Player:
 			return True
 		return False
 
-	def draw(self, surface: pygame.Surface, debug: bool = False, game_finished: bool = False) -> None:
-		"""Render the player on the given surface."""
-		# Position is already scaled, just use it directly
-		scaled_pos = self.pos
+	def draw(self, surface: pygame.Surface, debug: bool = False, game_finished: bool = False, alpha: float = 1.0) -> pygame.Rect:
+		"""Render the player on the given surface, blended between physics steps by alpha.
+
+		Returns the bounding box of everything drawn (sprite, glow, name, debug).
+		"""
+		# World position blended between steps, then mapped to the screen
+		pos = self.prev_pos.lerp(self.pos, alpha) if alpha < 1.0 else self.pos
+		scaled_pos = SCALING.apply_offset(pos)
 		scaled_radius = SCALING.scale_radius(self.radius)
 		
 		if self.sprite:
-			# Scale sprite if it exists
+			# Sprite at the current render size, scaled once per size and shared
 			scaled_sprite_size = int(self.radius * 2 * SCALING.uniform_scale)
-			if scaled_sprite_size != self.sprite.get_width():
-				scaled_sprite = pygame.transform.scale(self.sprite, (scaled_sprite_size, scaled_sprite_size))
-			else:
-				scaled_sprite = self.sprite
+			scaled_sprite = ASSETS.get(self.sprite_name, (scaled_sprite_size, scaled_sprite_size))
 			# Draw sprite centered on position
 			rect = scaled_sprite.get_rect(center=(int(scaled_pos.x), int(scaled_pos.y)))
-			surface.blit(scaled_sprite, rect)
+			drawn = [surface.blit(scaled_sprite, rect)]
 		else:
 			# Fallback to circle drawing
-			pygame.draw.circle(surface, self.color, (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius))
+			drawn = [pygame.draw.circle(surface, self.color, (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius))]
 			pygame.draw.circle(surface, (10, 10, 10), (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius), 2)
 		
 		# Show active player highlight only when game is not finished
 		if self.is_active and not game_finished:
-			pygame.draw.circle(surface, self.active_glow, (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius + 4), 3)
+			drawn.append(pygame.draw.circle(surface, self.active_glow, (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius + 4), 3))
 		
 		# Always show player name above the player
 		if self.player_name:
-			font_size = SCALING.scale_font_size(20)
-			font = pygame.font.SysFont(None, font_size)
+			font = FONTS.font(SCALING.scale_font_size(20))
 			# Color the name based on whether player is active (but not when game is finished)
 			if self.is_active and not game_finished:
 				text_color = (255, 255, 100)  # Bright yellow for active player
 				# Add background rectangle for active player name
-				text_surf = font.render(self.player_name, True, text_color)
+				text_surf = FONTS.render(self.player_name, font, text_color)
 				text_rect = text_surf.get_rect(center=(int(scaled_pos.x), int(scaled_pos.y) - scaled_radius - 15))
 				# Draw background for better visibility
 				bg_rect = text_rect.inflate(8, 4)
-				pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect, border_radius=4)
+				drawn.append(pygame.draw.rect(surface, (0, 0, 0, 180), bg_rect, border_radius=4))
 				surface.blit(text_surf, text_rect)
 			else:
 				text_color = (220, 220, 220)  # Light gray for inactive players
-				text_surf = font.render(self.player_name, True, text_color)
+				text_surf = FONTS.render(self.player_name, font, text_color)
 				text_rect = text_surf.get_rect(center=(int(scaled_pos.x), int(scaled_pos.y) - scaled_radius - 15))
-				surface.blit(text_surf, text_rect)
+				drawn.append(surface.blit(text_surf, text_rect))
 		
 		if debug:
 			pygame.draw.circle(surface, (255, 255, 0), (int(scaled_pos.x), int(scaled_pos.y)), int(scaled_radius), 1)
 			end = scaled_pos + SCALING.scale_position(self.vel * 0.1)
-			pygame.draw.line(surface, (255, 255, 0), scaled_pos, end, 2)
+			drawn.append(pygame.draw.line(surface, (255, 255, 0), scaled_pos, end, 2))
+		return drawn[0].unionall(drawn[1:])
 
@@ -4,48 +4,75 @@ import pygame
 from pygame.math import Vector2 as V2
 from typing import List, Dict
 from settings import CFG
+from physics.world import PhysicsWorld
+from log import get_logger
 from .player import Player
 
+log = get_logger("team")
+
 
 class Team:
 	"""Holds players, selected index, and control bindings."""
 	
-	def __init__(self, left_side: bool, pitch_rect: pygame.Rect, controls: Dict[str, int], color_key: str):
-		"""Initialize team with players and control configuration."""
+	def __init__(self, left_side: bool, pitch_rect: pygame.Rect, controls: Dict[str, int], color_key: str, load_sprites: bool = True, world: PhysicsWorld = None):
+		"""Initialize team with players and control configuration.
+
+		Players are appended to world as one contiguous block of rows, exposed
+		as body_slice so the whole team can be moved in a single batched call.
+		"""
 		self.left_side = left_side
 		self.controls = controls
 		self.players: List[Player] = []
 		self.selected_idx = 0
-		self.pitch_rect = pitch_rect  # Store pitch rect for rescaling
 
 		active_glow = CFG.colors.get("active_glow", (255, 213, 79))
 		color = CFG.colors.get(color_key, (76, 175, 80))
 		num = int(max(1, min(CFG.teams.get("per_team", 2), CFG.teams.get("max_per_team", 5))))
+		self.world = world if world is not None else PhysicsWorld(player_capacity=num)
+		first = self.world.num_players
+		self.body_slice = slice(first, first + num)
 
-		print(f"\n=== TEAM {'P1' if left_side else 'P2'} INIT DEBUG ===")
-		print(f"Received pitch_rect for initialization: {pitch_rect}")
-		print(f"Pitch rect width: {pitch_rect.width}, height: {pitch_rect.height}")
-		
-		for i in range(num):
-			# Position players in better positions on the field
-			if left_side:
-				# Left team: position at 15% from left edge (more towards center)
-				x = pitch_rect.left + pitch_rect.width * 0.15
-			else:
-				# Right team: position at 15% from right edge (more towards center)
-				x = pitch_rect.right - pitch_rect.width * 0.15
-			
-			y = pitch_rect.centery + (i - (num - 1) / 2) * (CFG.player.get("radius", 16) * 3)
+		for i, pos in enumerate(self._formation(pitch_rect, num)):
 			# Create player name based on team and player number
 			team_num = "1" if left_side else "2"
 			player_name = f"P{team_num}-{i+1}"
-			print(f"  {player_name}: calculated pos({x:.1f}, {y:.1f})")
-			self.players.append(Player(V2(x, y), color, active_glow, color_key, player_name, pitch_rect, left_side))
+			log.debug("%s init: pitch_rect %s, pos (%.1f, %.1f)", player_name, pitch_rect, pos.x, pos.y)
+			self.players.append(Player(pos, color, active_glow, color_key, player_name, left_side, load_sprites, self.world, pid=i))
+
+		self.players[self.selected_idx].is_active = True
+
+	def _formation(self, pitch_rect: pygame.Rect, num: int) -> List[V2]:
+		"""Kickoff positions: a vertical line of num players on this team's side."""
+		# Position players in better positions on the field
+		if self.left_side:
+			# Left team: position at 15% from left edge (more towards center)
+			x = pitch_rect.left + pitch_rect.width * 0.15
+		else:
+			# Right team: position at 15% from right edge (more towards center)
+			x = pitch_rect.right - pitch_rect.width * 0.15
+		spacing = CFG.player.get("radius", 16) * 3
+		return [V2(x, pitch_rect.centery + (i - (num - 1) / 2) * spacing) for i in range(num)]
+
+	def reset(self, pitch_rect: pygame.Rect) -> None:
+		"""Put the existing players back in kickoff formation, at rest, with the first one selected.
 
+		Same state as a freshly built team, without new objects or world rows.
+		"""
+		formation = self._formation(pitch_rect, len(self.players))
+		# One batched write for the team's contiguous world rows
+		self.world.reset_players(self.body_slice, [tuple(pos) for pos in formation], *Player.tuning())
+		for p, pos in zip(self.players, formation):
+			p.is_active = False
+			p.home_x = float(pos.x)
+		self.selected_idx = 0
 		self.players[self.selected_idx].is_active = True
 
-	def handle_input(self, pressed: pygame.key.ScancodeWrapper, events: list, dt: float, pitch_rect: pygame.Rect, restrict_half: bool = False) -> V2:
-		"""Process input events and update selected player movement."""
+	def handle_input(self, pressed: pygame.key.ScancodeWrapper, dt: float, pitch_rect: pygame.Rect, restrict_half: bool = False) -> V2:
+		"""Move the selected player from the held movement keys.
+
+		Player selection keys are KEYDOWN actions, routed by the game's
+		KeyDispatcher (see bind_keys()).
+		"""
 		move_vec = V2(0, 0)
 		if not self.controls:
 			return None
@@ -58,31 +85,6 @@ class Team:
 		if pressed[self.controls["right"]]:
 			move_vec.x += 1
 
-		# activation keys: numbers and cycle
-		for e in events:
-			if e.type == pygame.KEYDOWN:
-				if e.key == self.controls.get("cycle"):
-					self._cycle()
-				
-				# Separate number keys for each team
-				if self.left_side:
-					# Left team uses keys 1-5
-					if pygame.K_1 <= e.key <= pygame.K_5:
-						i = e.key - pygame.K_1
-						self._select(i)
-				else:
-					# Right team uses keys 6-9-0 (6,7,8,9,0)
-					if e.key == pygame.K_6:
-						self._select(0)
-					elif e.key == pygame.K_7:
-						self._select(1)
-					elif e.key == pygame.K_8:
-						self._select(2)
-					elif e.key == pygame.K_9:
-						self._select(3)
-					elif e.key == pygame.K_0:
-						self._select(4)
-
 		if move_vec.length_squared() > 0:
 			move_vec = move_vec.normalize()
 		
@@ -92,8 +94,19 @@ class Team:
 			self._clamp_half(self.players[self.selected_idx], pitch_rect)
 		return move_vec
 
-	def try_kick(self, ball) -> bool:
-		"""Attempt to kick the ball with any team player."""
+	def bind_keys(self, keys, mode: str) -> None:
+		"""Bind this team's cycle and player-select keys in a KeyDispatcher mode."""
+		if not self.controls:
+			return
+		if "cycle" in self.controls:
+			keys.bind(mode, self.controls["cycle"], self._cycle)
+		for i, key in enumerate(self.controls.get("select", ())):
+			keys.bind(mode, key, self._select, i)
+
+	def try_kick(self, ball, contacts=None) -> bool:
+		"""Attempt to kick the ball with any team player, reusing the step's contact list if given."""
+		if ball.world is self.world:
+			return bool(self.world.kick_ball(ball.index, self.body_slice, contacts=contacts).any())
 		kicked = False
 		for p in self.players:
 			kicked = p.kick(ball) or kicked
@@ -112,39 +125,17 @@ class Team:
 			self.selected_idx = idx
 			self.players[self.selected_idx].is_active = True
 
-	def draw(self, surface: pygame.Surface, debug: bool = False, game_finished: bool = False) -> None:
-		"""Draw all team players on the surface."""
-		for p in self.players:
-			p.draw(surface, debug, game_finished)
+	def draw(self, surface: pygame.Surface, debug: bool = False, game_finished: bool = False, alpha: float = 1.0) -> list:
+		"""Draw all team players on the surface; returns each player's drawn bounding box."""
+		return [p.draw(surface, debug, game_finished, alpha) for p in self.players]
 
 	def _clamp_half(self, player: Player, pitch_rect: pygame.Rect) -> None:
 		"""Prevent team players from crossing the center line."""
 		# Prevent this team's players from crossing the center line
 		cx = pitch_rect.centerx
+		pos = player.pos
 		if self.left_side:
-			player.pos.x = min(player.pos.x, cx - player.radius)
+			pos.x = min(pos.x, cx - player.radius)
 		else:
-			player.pos.x = max(player.pos.x, cx + player.radius)
-			
-	def rescale_positions(self, new_pitch_rect: pygame.Rect) -> None:
-		"""Rescale all player positions to fit the new field size."""
-		team_name = "P1" if self.left_side else "P2"
-		print(f"\n=== TEAM {team_name} RESCALE DEBUG ===")
-		print(f"Received new_pitch_rect for rescaling: {new_pitch_rect}")
-		print(f"New pitch rect width: {new_pitch_rect.width}, height: {new_pitch_rect.height}")
-		
-		for i, player in enumerate(self.players):
-			old_pos = player.pos.copy()
-			old_percent_x = player.percent_x
-			old_percent_y = player.percent_y
-			
-			# Use the stored percentage positions to calculate new absolute positions
-			player.set_position_from_percentage(new_pitch_rect)
-			
-			print(f"  {team_name}-{i+1}:")
-			print(f"    OLD: pos({old_pos.x:.1f},{old_pos.y:.1f}) percent({old_percent_x:.3f},{old_percent_y:.3f})")
-			print(f"    NEW: pos({player.pos.x:.1f},{player.pos.y:.1f}) percent({player.percent_x:.3f},{player.percent_y:.3f})")
-		
-		# Store new pitch rect for future reference
-		self.pitch_rect = new_pitch_rect
-
+			pos.x = max(pos.x, cx + player.radius)
+		player.pos = pos
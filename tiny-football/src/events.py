@@ -0,0 +1,95 @@
+"""Typed game events and a per-frame batched event bus.
+
+The simulation announces what happened in a step (goals, wall bounces, player
+contacts, kicks, possession changes, state transitions) as small immutable
+events. Emit sites ask wants(EventType) before building an event, so a type
+nobody subscribed to costs a single dict lookup per step and the headless
+path, which has no subscribers, creates no events at all.
+
+Events are queued and delivered once per frame by dispatch(): each handler
+receives the list of that frame's events of its type, in emission order.
+"""
+
+from typing import Callable, NamedTuple, Optional
+
+
+class Goal(NamedTuple):
+	"""A team scored; scores are the new totals."""
+	t: float  # match seconds elapsed
+	side: str  # "l" or "r": the scoring team
+	score_l: int
+	score_r: int
+
+
+class WallBounce(NamedTuple):
+	"""A ball bounced off the pitch walls during the step."""
+	t: float
+	ball: int  # ball row in the physics world
+
+
+class PlayerContact(NamedTuple):
+	"""A player struck the ball during the step (counted as a hit)."""
+	t: float
+	side: str
+	player: int  # index within the team
+
+
+class Kick(NamedTuple):
+	"""A team kicked the ball, by key press (manual) or by running into it."""
+	t: float
+	side: str
+	manual: bool
+
+
+class PossessionChange(NamedTuple):
+	"""Which team is close enough to the ball to have it changed."""
+	t: float
+	side: Optional[str]  # "l", "r", "both" (contested) or None (loose ball)
+
+
+class StateChange(NamedTuple):
+	"""The match state machine moved (countdown | playing | goal_pause | finished)."""
+	t: float
+	old: str
+	new: str
+
+
+class EventBus:
+	"""Queue of game events with per-type subscribers, flushed once per frame."""
+
+	def __init__(self):
+		self.handlers = {}  # event type -> [handler(list_of_events)]
+		self.pending = []
+
+	def subscribe(self, event_type: type, handler: Callable[[list], None]) -> None:
+		"""Call handler with the list of each frame's events of event_type."""
+		self.handlers.setdefault(event_type, []).append(handler)
+
+	def unsubscribe(self, event_type: type, handler: Callable[[list], None]) -> None:
+		"""Stop delivering event_type to handler."""
+		handlers = self.handlers.get(event_type, [])
+		if handler in handlers:
+			handlers.remove(handler)
+		if not handlers:
+			self.handlers.pop(event_type, None)
+
+	def wants(self, event_type: type) -> bool:
+		"""Whether anyone listens to event_type (check before building events)."""
+		return event_type in self.handlers
+
+	def emit(self, event: tuple) -> None:
+		"""Queue an event for the next dispatch()."""
+		self.pending.append(event)
+
+	def dispatch(self) -> int:
+		"""Deliver queued events grouped by type; returns how many were delivered."""
+		if not self.pending:
+			return 0
+		events, self.pending = self.pending, []
+		by_type = {}
+		for event in events:
+			by_type.setdefault(type(event), []).append(event)
+		for event_type, batch in by_type.items():
+			for handler in list(self.handlers.get(event_type, ())):
+				handler(batch)
+		return len(events)
@@ -0,0 +1,56 @@
+"""Shared fonts and a cache of rendered text surfaces.
+
+Fonts are created once per (face, size) and rendered text is kept in an LRU
+cache keyed by (text, font, color, antialias), so labels that do not change
+(controls hint, player names, menu entries) are rendered once instead of every
+frame. Changing text such as the FPS counter simply cycles through the cache.
+Cached surfaces are shared: blit them, never draw onto them.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+class FontCache:
+	"""Font registry plus an LRU cache of rendered text.
+
+	Args:
+		max_texts: Rendered surfaces kept before the least recently used is dropped.
+	"""
+
+	def __init__(self, max_texts: int = 256):
+		self.max_texts = max_texts
+		self.fonts = {}  # (face, size) -> Font
+		self.texts = OrderedDict()  # (text, font, color, antialias) -> Surface
+
+	def font(self, size: int, face: str = None) -> pygame.font.Font:
+		"""The shared font for face (None: pygame's default font) at size."""
+		key = (face, max(1, int(size)))
+		font = self.fonts.get(key)
+		if font is None:
+			if not pygame.font.get_init():
+				pygame.font.init()
+			font = pygame.font.SysFont(face, key[1]) if face else pygame.font.Font(None, key[1])
+			self.fonts[key] = font
+		return font
+
+	def render(self, text: str, font: pygame.font.Font, color, antialias: bool = True) -> pygame.Surface:
+		"""font.render(text, antialias, color), rendered once and reused while it stays in the cache."""
+		key = (text, font, tuple(color), antialias)
+		surf = self.texts.get(key)
+		if surf is not None:
+			self.texts.move_to_end(key)
+			return surf
+		surf = font.render(text, antialias, color)
+		self.texts[key] = surf
+		if len(self.texts) > self.max_texts:
+			self.texts.popitem(last=False)
+		return surf
+
+	def clear(self) -> None:
+		"""Drop every font and rendered text."""
+		self.fonts.clear()
+		self.texts.clear()
+
+
+FONTS = FontCache()
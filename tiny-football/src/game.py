@@ -3,88 +3,97 @@
 Handles input, physics updates, scoring, timers, and rendering.
 """
 
+import os
 import time
+import random
+import numpy as np
 import pygame
-from pygame.math import Vector2 as V2
 from settings import CFG
-from scaling import SCALING
+from scaling import SCALING, ResizeDebouncer
 from pitch import Pitch
 from hud import HUD
+from fonts import FONTS
+from assets import ASSETS
 from entities.ball import Ball
 from entities.team import Team
-from physics.collisions import clamp_ball_with_walls, ball_player_collision
 from physics.force_field import ForceField
+from physics.world import PhysicsWorld
+from physics.sweep import GOAL_LEFT, GOAL_RIGHT
+from events import EventBus, Goal, WallBounce, PlayerContact, Kick, PossessionChange, StateChange
+from profiler import FrameProfiler
+from latency import LatencyHistogram
+from controls import KeyDispatcher, GAME_KEYS, PAUSED_KEYS, TEAM_CONTROLS
 from ai.simple_ai import SimpleAI
+from log import get_logger
+
+log = get_logger("game")
 
 
 class Game:
 	"""Encapsulates a running match.
 
 	Args:
-		surface: Target display surface.
+		surface: Target display surface (None when headless).
 		mode: Gameplay mode string.
 		per_team: Number of players per team.
 		minutes: Match duration in minutes.
+		headless: Run the simulation only - no window, audio, fonts or sprites.
+		seed: Seed for all match randomness (kickoffs, AI); None draws from config or entropy.
+		world: Physics storage to use (e.g. a BatchSimulator slice); a new PhysicsWorld by default.
 	"""
 
-	def __init__(self, surface: pygame.Surface, mode: str = None, per_team: int = None, minutes: int = 2, ai_difficulty: str = "Normal"):
+	def __init__(self, surface: pygame.Surface = None, mode: str = None, per_team: int = None, minutes: int = 2, ai_difficulty: str = "Normal", headless: bool = False, seed: int = None, world: PhysicsWorld = None):
 		self.surface = surface
+		self.headless = headless
+		# Per-frame event stream; audio subscribes below, headless matches run with no listeners
+		self.events = EventBus()
+		# Single seedable RNG shared by ball spawns and AI so whole matches are reproducible
+		self.seed = seed if seed is not None else CFG.sim.get("seed")
+		self.rng = random.Random(self.seed)
 		self.clock = pygame.time.Clock()
-		self.pitch = Pitch(surface)
+		# Coalesces drag-resize events (see _handle_system_events)
+		self.resize = ResizeDebouncer(surface.get_size() if surface else CFG.size, float(CFG.render.get("resize_settle", 0.2)))
+		self.pitch = Pitch(surface, load_images=not headless)
 		# Ensure pitch rectangle is properly scaled before initializing other components
 		self.pitch.reset_rects()
-		self.hud = HUD()
-		self.ball = Ball(self.pitch.get_scaled_inner())
-		self.force = ForceField(self.pitch.get_scaled_inner())
+		self.hud = None if headless else HUD()
+		# Struct-of-arrays storage for every player and ball; entities are views onto it
+		self.world = world or PhysicsWorld(player_capacity=2 * int(CFG.teams.get("max_per_team", 5)))
+		self.ball = Ball(self.pitch.inner, load_sprite=not headless, rng=self.rng, world=self.world)
+		self.force = ForceField(self.pitch.inner)
 		# sounds
-		self.muted = False
+		self.muted = headless
 		self.background_music_playing = False
-		try:
-			import os
-			base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
-			# Original sounds
-			goal_path = os.path.join(base_dir, "assets", "sfx", "goal.wav")
-			bounce_path = os.path.join(base_dir, "assets", "sfx", "bounce.wav")
-			# New sounds
-			goal_net_path = os.path.join(base_dir, "assets", "sfx", "a-football-hits-the-net-goal-313216.mp3")
-			bg_music_path = os.path.join(base_dir, "assets", "sfx", "football-crowd-3-69245.mp3")
-			crowd_cheer_path = os.path.join(base_dir, "assets", "sfx", "crowd-cheering-379666.mp3")
-			
-			# Initialize pygame mixer if not already initialized
-			if not pygame.mixer.get_init():
-				pygame.mixer.init()
-			
-			if os.path.exists(goal_net_path):
-				self.sfx_goal = pygame.mixer.Sound(goal_net_path)
-			elif os.path.exists(goal_path):
-				self.sfx_goal = pygame.mixer.Sound(goal_path)
-			else:
-				self.sfx_goal = None
-				
-			if os.path.exists(bounce_path):
-				self.sfx_bounce = pygame.mixer.Sound(bounce_path)
-			else:
-				self.sfx_bounce = None
-				
-			if os.path.exists(bg_music_path):
-				self.bg_music_path = bg_music_path
-			else:
-				self.bg_music_path = None
-				
-			if os.path.exists(crowd_cheer_path):
-				self.sfx_crowd_cheer = pygame.mixer.Sound(crowd_cheer_path)
-			else:
-				self.sfx_crowd_cheer = None
-		except Exception as e:
-			print(f"Error loading sounds: {e}")
-			self.sfx_goal = None
-			self.sfx_bounce = None
-			self.bg_music_path = None
-			self.sfx_crowd_cheer = None
+		self.sfx_goal = None
+		self.sfx_bounce = None
+		self.bg_music_path = None
+		self.sfx_crowd_cheer = None
+		# Per-phase frame timings (F3 toggles recording and the overlay)
+		self.profiler = FrameProfiler(CFG.profiler.get("frames", 600), bool(CFG.profiler.get("enabled", False)) and not headless)
+		self._profile_stats = {}
+		# Key event-to-flip latency, recorded only while asked for: with the B overlay or
+		# the profiler on, or for the whole match with input.latency_dump (written when
+		# the match ends). Low-latency mode polls events after the frame-pacing sleep
+		self.low_latency = bool(CFG.input.get("low_latency", False))
+		self.latency_dump = bool(CFG.input.get("latency_dump", False))
+		self.latency = LatencyHistogram()
+		self._key_stamps = []  # poll times of key events whose frame has not been shown yet
+		if not headless:
+			self._load_sounds()
+			self._subscribe_audio()
+			self.events.subscribe(StateChange, self._on_profile_state)
 		self.score_l = 0
 		self.score_r = 0
 		self.hits_l = 0
 		self.hits_r = 0
+		# Seconds each side spent with a player in possession of the ball
+		self.possession_l = 0.0
+		self.possession_r = 0.0
+		# Team currently in possession: "l", "r", "both" or None
+		self.possession_side = None
+		# Proximity stage of the current step (see _handle_kicks)
+		self.contacts = None
+		self.ticks = 0
 		self.paused = False
 		self.debug = False
 		# self.mode = mode or str(CFG.raw.get("mode", "multiplayer"))
@@ -96,13 +105,30 @@ class Game:
 		self.time_left = self.match_time
 		self.state = "countdown"  # countdown | playing | goal_pause | finished
 		self.countdown_timer = 3.0
+		self.team_l = self.team_r = None
+		self.ai_l = self.ai_r = None
 		self.reset_positions(kickoff=True)
 		self.last_time = time.time()
 		self.dt = 1.0 / max(1, CFG.fps)
+		# Fixed-timestep loop: physics always advances in step_dt increments and
+		# rendering interpolates between the last two steps
+		self.fixed_step = bool(CFG.sim.get("fixed_step", False))
+		self.step_dt = 1.0 / max(1, int(CFG.sim.get("tick_rate", CFG.fps)))
+		self.max_frame_time = float(CFG.sim.get("max_frame_time", 0.25))
+		self.accumulator = 0.0
+		self._pending_events = []
+		# Dirty-rect rendering: repaint and push only what changed since last frame
+		self.dirty_rects = bool(CFG.render.get("dirty_rects", False))
+		self._drawn_rects = []
 		self.ai_enabled = bool(CFG.raw.get("ai", {}).get("enabled", True))
 		if self.ai_enabled:
-			self.ai_l = SimpleAI(True, difficulty=self.ai_difficulty)
-			self.ai_r = SimpleAI(False, difficulty=self.ai_difficulty)
+			self.ai_l = SimpleAI(True, difficulty=self.ai_difficulty, rng=self.rng)
+			self.ai_r = SimpleAI(False, difficulty=self.ai_difficulty, rng=self.rng)
+
+		# Key -> action tables, one per input mode; manual kicks requested this step
+		self.keys = KeyDispatcher()
+		self._kick_keys = {"l": False, "r": False}
+		self._bind_keys()
 
 		# Start background music
 		self.start_background_music()
@@ -111,47 +137,136 @@ class Game:
 		self.goal_sound_playing = False
 		self.goal_sound_timer = 0.0
 
+	def _load_sounds(self) -> None:
+		"""Initialize the mixer and fetch sound effects and background music.
+
+		Sounds are decoded once by the asset manager and shared by every match.
+		"""
+		try:
+			# Initialize pygame mixer if not already initialized
+			if not pygame.mixer.get_init():
+				pygame.mixer.init()
+			
+			# Net sound, falling back to the original goal sound
+			self.sfx_goal = ASSETS.sound("sfx/a-football-hits-the-net-goal-313216.mp3") or ASSETS.sound("sfx/goal.wav")
+			self.sfx_bounce = ASSETS.sound("sfx/bounce.wav")
+			# Music is streamed by pygame.mixer.music, so only its path is needed
+			self.bg_music_path = ASSETS.path("sfx/football-crowd-3-69245.mp3")
+			self.sfx_crowd_cheer = ASSETS.sound("sfx/crowd-cheering-379666.mp3")
+		except Exception as e:
+			log.warning("Error loading sounds: %s", e)
+			self.sfx_goal = None
+			self.sfx_bounce = None
+			self.bg_music_path = None
+			self.sfx_crowd_cheer = None
+
+	def _subscribe_audio(self) -> None:
+		"""Play sound effects from the event stream."""
+		self.events.subscribe(WallBounce, self._on_bounces)
+		self.events.subscribe(Goal, self._on_goals)
+		self.events.subscribe(StateChange, self._on_state_changes)
+
+	def _on_bounces(self, events: list) -> None:
+		"""One bounce sound per frame, however many bounces it had."""
+		if self.sfx_bounce and not self.muted:
+			self.sfx_bounce.play()
+
+	def _on_goals(self, events: list) -> None:
+		"""Goal sound, running alongside the 3-second goal countdown."""
+		if not self.sfx_goal or self.muted:
+			return
+		try:
+			self.sfx_goal.play()
+			self.goal_sound_timer = 3.0
+			self.goal_sound_playing = True
+		except Exception as e:
+			log.warning("Error playing goal sound: %s", e)
+			self.goal_sound_playing = False
+
+	def _on_state_changes(self, events: list) -> None:
+		"""Stop the music and play crowd cheering when the match ends."""
+		if not any(e.new == "finished" for e in events):
+			return
+		self.stop_background_music()
+		if self.sfx_crowd_cheer and not self.muted:
+			self.sfx_crowd_cheer.play()
+
+	def _on_profile_state(self, events: list) -> None:
+		"""Write the frame profile and input latencies when the match ends (if anything was recorded)."""
+		if not any(e.new == "finished" for e in events):
+			return
+		if self.profiler.frames:
+			self.dump_profile()
+		if self.latency.count:
+			self.dump_latency()
+
+	def _profile_path(self, name: str) -> str:
+		"""Timestamped JSON path for name under profiler.dir (relative paths are under tiny-football/)."""
+		directory = CFG.profiler.get("dir", "profiles")
+		if not os.path.isabs(directory):
+			directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), directory)
+		return os.path.join(directory, time.strftime(f"{name}_%Y%m%d_%H%M%S.json"))
+
+	def dump_profile(self, path: str = None) -> str:
+		"""Write the profiler's timings to path (default: a timestamped file under profiler.dir) and reset it."""
+		if path is None:
+			path = self._profile_path("frame_profile")
+		w, h = self.surface.get_size() if self.surface is not None else (0, 0)
+		path = self.profiler.dump(path, mode=self.mode, per_team=len(self.team_l.players), window=[w, h],
+			fixed_step=self.fixed_step, dirty_rects=self.dirty_rects)
+		self.profiler.reset()
+		log.info("Frame profile written to %s", path)
+		return path
+
+	def dump_latency(self, path: str = None) -> str:
+		"""Write the key event-to-flip latency histogram to path (default: under profiler.dir) and reset it."""
+		if path is None:
+			path = self._profile_path("input_latency")
+		path = self.latency.dump(path, mode=self.mode, low_latency=self.low_latency, fps=CFG.fps,
+			fixed_step=self.fixed_step, dirty_rects=self.dirty_rects)
+		self.latency.reset()
+		log.info("Input latency histogram written to %s", path)
+		return path
+
 	def reset_positions(self, kickoff: bool = False) -> None:
-		"""Recreate teams and position the ball and players for kickoff."""
+		"""Position the ball and players for kickoff.
+
+		Teams are built on the first call and reset in place afterwards, so
+		Player objects (and the AI's per-player state) survive goals and restarts.
+		"""
 		if kickoff:
-			self.ball.spawn(self.pitch.get_scaled_inner().center, direction_randomized=False)
-			self.ball.vel.update(0, 0)  # Remove initial ball speed and direction
+			self.ball.spawn(self.pitch.inner.center, direction_randomized=False)
+			self.ball.vel = (0, 0)  # Remove initial ball speed and direction
 		else:
-			self.ball.spawn(self.pitch.get_scaled_inner().center, direction_randomized=True)
-		controls_p1 = {"up": pygame.K_w, "down": pygame.K_s, "left": pygame.K_a, "right": pygame.K_d, "cycle": pygame.K_TAB}
-		# For P2, use 'K' to cycle as requested
-		controls_p2 = {"up": pygame.K_UP, "down": pygame.K_DOWN, "left": pygame.K_LEFT, "right": pygame.K_RIGHT, "cycle": pygame.K_k}
-		self.team_l = Team(True, self.pitch.get_scaled_inner(), controls_p1, "p1")
+			self.ball.spawn(self.pitch.inner.center, direction_randomized=True)
+		# Fresh AI plans: players start from rest, as new ones would
+		for ai in (self.ai_l, self.ai_r):
+			if ai is not None:
+				ai.forget()
+		if self.team_l is not None:
+			self.team_l.reset(self.pitch.inner)
+			self.team_r.reset(self.pitch.inner)
+			return
+		# Key tables live in controls.py (P2 cycles with 'K')
+		controls_p1 = TEAM_CONTROLS["p1"]
+		controls_p2 = TEAM_CONTROLS["p2"]
+		load_sprites = not self.headless
+		# First build: teams take world rows from the start
+		self.world.clear_players()
+		self.team_l = Team(True, self.pitch.inner, controls_p1, "p1", load_sprites, self.world)
 		# self.team_r = Team(False, self.pitch.get_scaled_inner(), controls_p2, "p2")
 		# If human_vs_ai, make right team's non-nearest players stay on line
 		# self.human_vs_ai = (self.mode == "human_vs_ai")
 		if self.mode == "human_vs_ai":
 			# Right team: AI controlled
-			self.team_r = Team(False, self.pitch.get_scaled_inner(), controls_p2, "p2")
+			self.team_r = Team(False, self.pitch.inner, controls_p2, "p2", load_sprites, self.world)
 			for player in self.team_r.players:
 				player.is_ai = True
 				player.ai_difficulty = self.ai_difficulty
 		else:
 			# Default (multiplayer)
-			self.team_r = Team(False, self.pitch.get_scaled_inner(), controls_p2, "p2")
+			self.team_r = Team(False, self.pitch.inner, controls_p2, "p2", load_sprites, self.world)
 		
-	def rescale_game_elements(self) -> None:
-		"""Rescale all game elements to match the new window size."""
-		# Update ball properties and position
-		self.ball.radius = SCALING.scale_radius(10)  # Base radius from config
-		self.ball.max_speed = SCALING.scale_speed(520)  # Base max speed
-		self.ball.rescale_position(self.pitch.get_scaled_inner())
-
-		# Rescale team positions to fit new field
-		self.team_l.rescale_positions(self.pitch.get_scaled_inner())
-		self.team_r.rescale_positions(self.pitch.get_scaled_inner())
-
-		# Update player properties
-		for player in self.team_l.players + self.team_r.players:
-			player.radius = SCALING.scale_radius(16)  # Base radius from config
-			player.max_speed = SCALING.scale_speed(260)  # Base max speed
-			player.accel = SCALING.scale_acceleration(1400)  # Base acceleration
-
 	def start_background_music(self):
 		"""Start the background music if available and not muted."""
 		if self.bg_music_path and not self.muted:
@@ -168,7 +283,7 @@ class Game:
 				pygame.mixer.music.play(-1)  # Loop indefinitely
 				self.background_music_playing = True
 			except Exception as e:
-				print(f"Error starting background music: {e}")
+				log.warning("Error starting background music: %s", e)
 				self.background_music_playing = False
 
 	def stop_background_music(self):
@@ -178,11 +293,13 @@ class Game:
 				pygame.mixer.music.stop()
 				self.background_music_playing = False
 			except Exception as e:
-				print(f"Error stopping background music: {e}")
+				log.warning("Error stopping background music: %s", e)
 				self.background_music_playing = False
 
 	def update(self, dt: float) -> None:
 		"""Advance simulation by dt seconds and handle state transitions."""
+		# This step's proximity stage (measured in _handle_kicks); consumed once
+		contacts, self.contacts = self.contacts, None
 		# Handle goal sound timing - both sound and countdown happen simultaneously
 		if self.goal_sound_playing:
 			self.goal_sound_timer -= dt
@@ -195,13 +312,13 @@ class Game:
 			# 3-2-1 countdown before match starts
 			self.countdown_timer -= dt
 			if self.countdown_timer <= 0:
-				self.state = "playing"
+				self._set_state("playing")
 			return
 		if self.state == "goal_pause":
 			# Brief pause after scoring
 			self.countdown_timer -= dt
 			if self.countdown_timer <= 0:
-				self.state = "playing"
+				self._set_state("playing")
 			return
 		if self.state == "finished":
 			# Game over - no updates
@@ -210,140 +327,227 @@ class Game:
 		# Update match timer and check for end of match
 		self.time_left -= dt
 		if self.time_left <= 0:
-			self.state = "finished"
 			self.time_left = 0
-			# Stop background music and play crowd cheering
-			self.stop_background_music()
-			if self.sfx_crowd_cheer and not self.muted:
-				self.sfx_crowd_cheer.play()
+			# Audio stops the music and plays the crowd cheering on this transition
+			self._set_state("finished")
 			return
 			
-		# Update ball physics (position, velocity, friction)
-		self.ball.update(dt)
+		# Move the ball through the step with swept contacts: walls, players
+		# (moving from their start-of-step positions) and goal sensors are hit
+		# in time order, so fast balls cannot tunnel at low frame rates. The
+		# array kernels are shared with BatchSimulator so both engines agree.
+		restitution = float(CFG.ball.get("restitution", 0.98))
+		goals = (self.pitch.left_goal, self.pitch.right_goal)
+		if contacts is None:
+			contacts = self.world.find_contacts(dt)
+		bounced, goal = self.world.sweep_balls(dt, self.ball.play_rect, goals, restitution, contacts)
 		
 		# Apply force field effects (gravity, wind, etc.)
-		self.force.apply(self.ball, dt)
+		b = self.world.balls
+		self.force.apply_batch(self.world.ball_pos[b], self.world.ball_vel[b], self.world.ball_max_speed[b], dt)
 		
-		# Handle ball-wall collisions with sound effects
-		if clamp_ball_with_walls(self.ball) and getattr(self, "sfx_bounce", None) and not getattr(self, "muted", False):
-			self.sfx_bounce.play()
+		# Wall bounces (plus a final clamp against numerical drift) with sound effects
+		bounced |= self.world.clamp_balls(self.ball.play_rect, restitution)
+		if self.events.wants(WallBounce):
+			for ball in np.flatnonzero(bounced).tolist():
+				self.events.emit(WallBounce(self._match_clock(), ball))
+
+		# Possession from the contact list (margin slightly larger than kick range);
+		# the AI reads it through Player.has_ball
+		self.world.set_possession(contacts)
 			
 		# Update AI predictions for both teams
 		if self.ai_enabled:
-			# Pass home_x for line-locked prediction (left uses its players' home_x; right similarly)
-			lx = self.team_l.players[-1].home_x if self.team_l.players else self.pitch.get_scaled_inner().left + 80
-			rx = self.team_r.players[-1].home_x if self.team_r.players else self.pitch.get_scaled_inner().right - 80
-			self.ai_l.update(dt, self.pitch.get_scaled_inner(), V2(self.ball.pos), V2(self.ball.vel), self.team_l.players)
-			self.ai_r.update(dt, self.pitch.get_scaled_inner(), V2(self.ball.pos), V2(self.ball.vel), self.team_r.players)
-
-			
-		# Check ball-player collisions and update hit counters
-		# Also update ball possession tracking for AI decision-making
-		for p in self.team_l.players:
-			if ball_player_collision(self.ball, p):
-				self.hits_l += 1
-			# Update possession based on proximity (for AI to know who has ball)
-			delta = self.ball.pos - p.pos
-			possession_margin = p.radius + self.ball.radius + 8  # slightly larger than kick range
-			p.has_ball = (delta.length_squared() <= possession_margin * possession_margin)
-		for p in self.team_r.players:
-			if ball_player_collision(self.ball, p):
-				self.hits_r += 1
-			# Update possession based on proximity
-			delta = self.ball.pos - p.pos
-			possession_margin = p.radius + self.ball.radius + 8
-			p.has_ball = (delta.length_squared() <= possession_margin * possession_margin)
+			self.profiler.lap("physics")
+			self.ai_l.update(dt, self.pitch.inner, self.ball, self.team_l.players)
+			self.ai_r.update(dt, self.pitch.inner, self.ball, self.team_r.players)
+			self.profiler.lap("ai")
+
+		# Hit counters and possession clocks, per team columns of the contact list
+		cols_l = contacts.columns(self.team_l.body_slice)
+		cols_r = contacts.columns(self.team_r.body_slice)
+		self.hits_l += int(contacts.hit[:, cols_l].sum())
+		self.hits_r += int(contacts.hit[:, cols_r].sum())
+		has_ball = contacts.has_ball()
+		if has_ball[cols_l].any():
+			self.possession_l += dt
+		if has_ball[cols_r].any():
+			self.possession_r += dt
+		self._track_possession(bool(has_ball[cols_l].any()), bool(has_ball[cols_r].any()))
+		if self.events.wants(PlayerContact):
+			self._emit_contacts(contacts)
 				
-		# Check for goals: ball center must enter the sensor rectangle
-		if self.pitch.left_goal.collidepoint(int(self.ball.pos.x), int(self.ball.pos.y)):
+		# Goals: the ball center entered a sensor rectangle during the step
+		if goal[self.ball.index] == GOAL_LEFT:
 			self.score_r += 1
+			self._announce_goal("r")
 			self._goal_scored()
-		elif self.pitch.right_goal.collidepoint(int(self.ball.pos.x), int(self.ball.pos.y)):
+		elif goal[self.ball.index] == GOAL_RIGHT:
 			self.score_l += 1
+			self._announce_goal("l")
 			self._goal_scored()
 
+	def _match_clock(self) -> float:
+		"""Match seconds elapsed (event timestamps)."""
+		return self.match_time - self.time_left
+
+	def _set_state(self, state: str) -> None:
+		"""Switch the match state, announcing the transition."""
+		if self.events.wants(StateChange):
+			self.events.emit(StateChange(self._match_clock(), self.state, state))
+		self.state = state
+
+	def _announce_goal(self, side: str) -> None:
+		"""Emit a Goal event for the team that just scored."""
+		if self.events.wants(Goal):
+			self.events.emit(Goal(self._match_clock(), side, self.score_l, self.score_r))
+
+	def _track_possession(self, left: bool, right: bool) -> None:
+		"""Remember which team has the ball and announce changes."""
+		side = ("both" if right else "l") if left else ("r" if right else None)
+		if side != self.possession_side and self.events.wants(PossessionChange):
+			self.events.emit(PossessionChange(self._match_clock(), side))
+		self.possession_side = side
+
+	def _emit_contacts(self, contacts) -> None:
+		"""Emit a PlayerContact event per player that struck the ball this step."""
+		t = self._match_clock()
+		for row in np.arange(self.world.num_players)[contacts.rows][contacts.hit.any(axis=0)].tolist():
+			side, team = ("l", self.team_l) if row < self.team_l.body_slice.stop else ("r", self.team_r)
+			self.events.emit(PlayerContact(t, side, row - team.body_slice.start))
+
 	def _goal_scored(self) -> None:
 		"""Enter a brief pause after scoring and reset for kickoff."""
 		# stop ball at center and play goal sound
-		self.ball.spawn(self.pitch.get_scaled_inner().center, direction_randomized=False)
-		self.ball.vel.update(0, 0)
+		self.ball.spawn(self.pitch.inner.center, direction_randomized=False)
+		self.ball.vel = (0, 0)
 		
-		# Play goal sound and set countdown - both happen simultaneously for 3 seconds
-		if self.sfx_goal and not self.muted:
-			try:
-				self.sfx_goal.play()
-				# Both goal sound and countdown happen together for 3 seconds
-				self.goal_sound_timer = 3.0
-				self.goal_sound_playing = True
-				self.countdown_timer = 3.0  # Countdown also runs for 3 seconds
-			except Exception as e:
-				print(f"Error playing goal sound: {e}")
-				self.countdown_timer = 3.0  # Still do 3-second countdown even without sound
-				self.goal_sound_playing = False
-		else:
-			self.countdown_timer = 3.0  # 3-second countdown even without sound
-			self.goal_sound_playing = False
-			
-		self.state = "goal_pause"
+		# 3-second countdown; the goal sound (Goal event) plays alongside it
+		self.countdown_timer = 3.0
+		self._set_state("goal_pause")
 		self.reset_positions(kickoff=False)
 	def _handle_system_events(self, events):
-		"""Window resize and system-level handling."""
-		for event in events:
-			if event.type == pygame.VIDEORESIZE:
-				SCALING.update_size(event.w, event.h)
-				pygame.display.set_mode((SCALING.current_width, SCALING.current_height), pygame.RESIZABLE)
-				self.pitch.reset_rects()
-				self.ball.play_rect = self.pitch.get_scaled_inner()
-				self.force.pitch_rect = self.pitch.get_scaled_inner()
-				self.rescale_game_elements()
-
-	def _handle_game_state_events(self, events):
-		"""Pause, restart, mute/unmute."""
-		for e in events:
-			if e.type == pygame.KEYDOWN:
-				if e.key == pygame.K_p:
-					self.paused = not self.paused
-				elif e.key == pygame.K_r:
-					self._restart_game()
-				elif e.key == pygame.K_m:
-					self.muted = not self.muted
-					if self.muted:
-						self.stop_background_music()
-					else:
-						self.start_background_music()
-
-	def _handle_debug_events(self, events):
-		"""Toggle debug info and HUD stats."""
-		for e in events:
-			if e.type == pygame.KEYDOWN and e.key == pygame.K_b:
-				self.hud.toggle_live_stats()
-				self.debug = not self.debug
-				self.hud.debug = self.debug
+		"""Window resizes, once per frame: a cheap preview while dragging, a full rebuild once settled."""
+		now = time.perf_counter()
+		# The simulation runs in world units: only the render side changes
+		size = self.resize.feed(events, now)
+		if size is not None:
+			SCALING.update_size(*size)
+			self.pitch.reset_rects(preview=True)
+		size = self.resize.settled(now)
+		if size is not None:
+			SCALING.update_size(*size)
+			pygame.display.set_mode((SCALING.current_width, SCALING.current_height), pygame.RESIZABLE)
+			self.resize.size = (SCALING.current_width, SCALING.current_height)
+			self.pitch.reset_rects()
+
+	def _bind_keys(self) -> None:
+		"""Build the key tables: "paused" only unpauses, "play" has game, team and kick keys."""
+		self.keys.clear()
+		actions = {
+			"pause": self._toggle_pause,
+			"restart": self._restart_game,
+			"mute": self._toggle_mute,
+			"debug": self._toggle_debug,
+			"profiler": self._toggle_profiler,
+		}
+		self.keys.bind_map("paused", PAUSED_KEYS, actions)
+		self.keys.bind_map("play", GAME_KEYS, actions)
+		# Player selection only for human-driven teams
+		self.team_l.bind_keys(self.keys, "play")
+		if self.mode not in ("human_vs_ai", "multiplayer_ai"):
+			self.team_r.bind_keys(self.keys, "play")
+		for side, team in (("l", self.team_l), ("r", self.team_r)):
+			if team.controls and "kick" in team.controls:
+				self.keys.bind("play", team.controls["kick"], self._request_kick, side)
+
+	def _toggle_pause(self) -> None:
+		"""Pause or resume the match (P)."""
+		self.paused = not self.paused
+
+	def _toggle_mute(self) -> None:
+		"""Mute or unmute the background music (M)."""
+		self.muted = not self.muted
+		if self.muted:
+			self.stop_background_music()
+		else:
+			self.start_background_music()
+
+	def _toggle_debug(self) -> None:
+		"""Toggle debug info and HUD stats (B)."""
+		self.hud.toggle_live_stats()
+		self.debug = not self.debug
+		self.hud.debug = self.debug
+
+	def _toggle_profiler(self) -> None:
+		"""Toggle the frame profiler overlay (F3)."""
+		self.profiler.toggle()
+		self._profile_stats = {}
+
+	def _request_kick(self, side: str) -> None:
+		"""Manual kick key for a team ("l" or "r"), resolved in _handle_kicks()."""
+		self._kick_keys[side] = True
 
 	def _handle_ai_team(self, team, ai):
 		"""AI controls all players in a team."""
-		for p in team.players:
-			direction = ai.advise_direction(p)
-			p.move(direction, self.dt, self.pitch.get_scaled_inner())
+		self._handle_ai_teams([(team, ai)])
 
-	def _handle_kicks(self, events):
-		"""Handle manual and automatic kicking."""
-		if any(e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE for e in events):
-			self.team_l.try_kick(self.ball)
-		if any(e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN for e in events):
-			self.team_r.try_kick(self.ball)
+	def _handle_ai_teams(self, pairs: list) -> None:
+		"""Move every AI-driven player of the given (team, ai) pairs in one batched call."""
+		if not pairs:
+			return
+		rect = self.pitch.inner
+		dirs = []
+		rows = []
+		for team, ai in pairs:
+			dirs.extend(tuple(ai.advise_direction(p)) for p in team.players)
+			rows.extend(range(team.body_slice.start, team.body_slice.stop))
+		# Teams occupy adjacent rows, so both AI teams usually form one slice
+		index = slice(rows[0], rows[-1] + 1) if rows == list(range(rows[0], rows[-1] + 1)) else rows
+		self.world.move_players(index, dirs, self.dt, rect)
+
+	def _ai_controlled_teams(self) -> list:
+		"""Return the (team, ai) pairs the computer drives in the current mode."""
+		if not self.ai_enabled:
+			return []
+		if self.mode == "human_vs_ai":
+			return [(self.team_r, self.ai_r)]
+		if self.mode == "multiplayer_ai":
+			return [(self.team_l, self.ai_l), (self.team_r, self.ai_r)]
+		return []
+
+	def _handle_kicks(self):
+		"""Handle manual and automatic kicking.
+
+		Ball-player distances are measured once here, after everyone moved; the
+		contact list serves every kick below and the rest of the step in update().
+		Manual kicks were requested by the kick keys during dispatch.
+		"""
+		self.contacts = self.world.find_contacts(self.dt)
+		manual_l = manual_r = False
+		if self._kick_keys["l"]:
+			manual_l = self.team_l.try_kick(self.ball, self.contacts)
+		if self._kick_keys["r"]:
+			manual_r = self.team_r.try_kick(self.ball, self.contacts)
+		self._kick_keys["l"] = self._kick_keys["r"] = False
 
 		# Auto kick when overlapping
-		self.team_l.try_kick(self.ball)
-		self.team_r.try_kick(self.ball)
+		auto_l = self.team_l.try_kick(self.ball, self.contacts)
+		auto_r = self.team_r.try_kick(self.ball, self.contacts)
+		if self.events.wants(Kick):
+			for side, manual, kicked in (("l", True, manual_l), ("r", True, manual_r), ("l", False, auto_l), ("r", False, auto_r)):
+				if kicked:
+					self.events.emit(Kick(self._match_clock(), side, manual))
 
 	def _restart_game(self):
 		"""Restart or reset match."""
 		if self.state == "finished":
 			self.score_l = self.score_r = 0
 			self.hits_l = self.hits_r = 0
+			self.possession_l = self.possession_r = 0.0
+			self.possession_side = None
 			self.time_left = self.match_time
-			self.state = "countdown"
+			self._set_state("countdown")
 			self.countdown_timer = 3.0
 			self.goal_sound_playing = False
 			self.goal_sound_timer = 0.0
@@ -356,111 +560,249 @@ class Game:
 	def handle_input(self, events: list) -> None:
 		"""Process all input events including keyboard, game state changes, and AI behavior."""
 
-		# --- 1. Handle system-level events (resize, quit, etc.) ---
-		self._handle_system_events(events)
-
 		# If paused, allow only unpause
 		if self.paused:
-			if any(e.type == pygame.KEYDOWN and e.key == pygame.K_p for e in events):
-				self.paused = False
+			self.keys.dispatch(events, "paused")
+			# No kicks this frame, so no contact list for the next update either
+			self.contacts = None
 			return
 
 		pressed = pygame.key.get_pressed()
 
-		# --- 2. Handle debug, pause, restart, mute ---
-		self._handle_game_state_events(events)
-		self._handle_debug_events(events)
+		# --- 1. Key presses, in one pass: pause, restart, mute, debug, player selection, kick requests ---
+		self.keys.dispatch(events, "play")
 
-		# --- 3. Human team input ---
+		# --- 2. Human team input ---
 		# restrict = CFG.teams.get("per_team", 2) > 1
 		restrict = False
-		self.team_l.handle_input(pressed, events, self.dt, self.pitch.get_scaled_inner(), restrict_half=restrict)
+		self.team_l.handle_input(pressed, self.dt, self.pitch.inner, restrict_half=restrict)
 
 		# Right team → AI or human depending on mode
 		if self.mode == "human_vs_ai":
 			self._handle_ai_team(self.team_r, self.ai_r)
 		elif self.mode == "multiplayer_ai":
-			self._handle_ai_team(self.team_l, self.ai_l)
-			self._handle_ai_team(self.team_r, self.ai_r)
+			self._handle_ai_teams([(self.team_l, self.ai_l), (self.team_r, self.ai_r)])
 		else:  # default multiplayer
-			self.team_r.handle_input(pressed, events, self.dt, self.pitch.get_scaled_inner(), restrict_half=restrict)
+			self.team_r.handle_input(pressed, self.dt, self.pitch.inner, restrict_half=restrict)
+
+		# --- 3. Handle manual & auto kicking ---
+		self._handle_kicks()
 
-		# --- 4. Handle manual & auto kicking ---
-		self._handle_kicks(events)
+	def draw(self, fps_val: float, alpha: float = 1.0) -> list:
+		"""Render the current frame contents.
 
-	def draw(self, fps_val: float) -> None:
-		"""Render the current frame contents."""
-		self.surface.fill(CFG.colors.get("bg", (18, 110, 18)))
+		alpha blends entity positions between the previous and current
+		physics step when the fixed-timestep loop is active.
+
+		Returns the screen regions that changed and must be pushed to the
+		display, or None when the whole window has to be flipped (always the
+		case unless dirty-rect rendering is enabled).
+		"""
 		# Disable debug indicators when game is finished
 		show_debug = self.debug and self.state != "finished"
 		game_finished = (self.state == "finished")
-		self.pitch.draw(debug=show_debug)
-		self.ball.draw(self.surface, debug=show_debug)
-		self.team_l.draw(self.surface, debug=show_debug, game_finished=game_finished)
-		self.team_r.draw(self.surface, debug=show_debug, game_finished=game_finished)
+		if self.dirty_rects:
+			# Erase last frame's sprites and text from the cached pitch layer
+			full = self.pitch.restore(self._drawn_rects, debug=show_debug)
+		else:
+			self.pitch.draw(debug=show_debug)  # cached layer, also clears the previous frame
+			full = True
+		prof = self.profiler
+		prof.lap("draw_pitch")
+		drawn = [self.ball.draw(self.surface, debug=show_debug, alpha=alpha)]
+		prof.lap("draw_ball")
+		drawn += self.team_l.draw(self.surface, debug=show_debug, game_finished=game_finished, alpha=alpha)
+		drawn += self.team_r.draw(self.surface, debug=show_debug, game_finished=game_finished, alpha=alpha)
+		prof.lap("draw_players")
 		# draw AI hint markers
 		if self.ai_enabled:
-			self.ai_l.draw_hint(self.surface, debug=show_debug)
-			self.ai_r.draw_hint(self.surface, debug=show_debug)
+			drawn += self.ai_l.draw_hint(self.surface, debug=show_debug)
+			drawn += self.ai_r.draw_hint(self.surface, debug=show_debug)
+			prof.lap("draw_ai")
 		force_label = ""
 		if self.force.enabled:
 			force_label = f"{self.force.kind.title()} ON: {self.force.strength:.0f}"
-		self.hud.draw(self.surface, self.score_l, self.score_r, self.hits_l, self.hits_r, fps_val, force_label, time_left=self.time_left if self.state != "countdown" else self.match_time)
+		drawn += self.hud.draw(self.surface, self.score_l, self.score_r, self.hits_l, self.hits_r, fps_val, force_label, time_left=self.time_left if self.state != "countdown" else self.match_time)
 		# Draw live stats if enabled
-		self.hud.draw_live_stats(self.surface, self.ball, [self.team_l, self.team_r])
+		drawn += self.hud.draw_live_stats(self.surface, self.ball, [self.team_l, self.team_r])
+		prof.lap("draw_hud")
 		# overlay countdown or winner screen
 		if self.state in ("countdown", "goal_pause"):
 			# Fix countdown display: use ceiling for proper 3-2-1 timing
 			import math
 			countdown_display = math.ceil(self.countdown_timer)
-			self._draw_center_text(f"{countdown_display}")
+			drawn.append(self._draw_center_text(f"{countdown_display}"))
 		elif self.state == "finished":
 			winner = "Draw" if self.score_l == self.score_r else ("P1 Wins" if self.score_l > self.score_r else "P2 Wins")
-			self._draw_center_text(f"{winner}")
-			self._draw_sub_text("Press R to restart or Esc to quit")
+			drawn.append(self._draw_center_text(f"{winner}"))
+			drawn.append(self._draw_sub_text("Press R to restart or Esc to quit"))
 			# Debug stats are disabled when game is finished for clean finish screen
-
-	def _draw_center_text(self, text: str) -> None:
+		if prof.enabled:
+			# Percentiles are refreshed twice a second so the numbers stay readable
+			if not self._profile_stats or prof.frames % max(1, CFG.fps // 2) == 0:
+				self._profile_stats = prof.summary()
+			drawn += self.hud.draw_profile(self.surface, self._profile_stats)
+		if show_debug:
+			drawn += self.hud.draw_latency(self.surface, self.latency.summary(), self.low_latency)
+		prof.lap("draw_overlay")
+		# Changed regions: where things were last frame plus where they are now
+		# (unchanged HUD text lands on the same rect both frames and is pushed once)
+		dirty = None if full else list({tuple(r): r for r in self._drawn_rects + drawn}.values())
+		self._drawn_rects = drawn
+		return dirty
+
+	def _draw_center_text(self, text: str) -> pygame.Rect:
 		"""Draw a large centered text overlay."""
-		font_size = SCALING.scale_font_size(96)
-		font = pygame.font.SysFont(None, font_size)
-		surf = font.render(text, True, (255, 255, 255))
-		# Center on the actual screen center
-		center_pos = SCALING.apply_offset(SCALING.scale_position(V2(self.pitch.inner.center)))
+		surf = FONTS.render(text, FONTS.font(SCALING.scale_font_size(96)), (255, 255, 255))
+		# Center on the pitch center as drawn on screen
+		center_pos = SCALING.geometry.center
 		rect = surf.get_rect(center=(int(center_pos.x), int(center_pos.y)))
-		self.surface.blit(surf, rect)
+		return self.surface.blit(surf, rect)
 
-	def _draw_sub_text(self, text: str) -> None:
+	def _draw_sub_text(self, text: str) -> pygame.Rect:
 		"""Draw smaller text under the main overlay message."""
-		font_size = SCALING.scale_font_size(28)
-		font = pygame.font.SysFont(None, font_size)
-		surf = font.render(text, True, (240, 240, 240))
+		surf = FONTS.render(text, FONTS.font(SCALING.scale_font_size(28)), (240, 240, 240))
 		# Position below center text
-		center_pos = SCALING.apply_offset(SCALING.scale_position(V2(self.pitch.inner.center)))
+		center_pos = SCALING.geometry.center
 		offset_y = SCALING.scale_radius(80)
 		rect = surf.get_rect(center=(int(center_pos.x), int(center_pos.y + offset_y)))
-		self.surface.blit(surf, rect)
+		return self.surface.blit(surf, rect)
 
 	def run_frame(self) -> bool:
 		"""Process one frame. Returns False to exit the program loop."""
-		events = pygame.event.get()
+		prof = self.profiler
+		prof.begin_frame()
+		# Low-latency mode polls after the frame-pacing sleep, so keys pressed
+		# during the sleep reach this frame's simulation instead of the next one
+		events = None if self.low_latency else self._poll_events()
 		# compute dt first so input-driven movement uses this frame's dt
 		frame_ms = self.clock.tick(CFG.fps)
-		self.dt = frame_ms / 1000.0 if frame_ms > 0 else self.dt
+		prof.lap("wait")
+		if events is None:
+			events = self._poll_events()
 		for e in events:
 			if e.type == pygame.QUIT:
 				return False
 			if e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE:
 				return False
-		self.handle_input(events)
-		if not self.paused:
-			# sub-steps for very fast ball
-			steps = 2 if self.ball.vel.length() > 0.75 * self.ball.max_speed else 1
-			for _ in range(steps):
-				self.update(self.dt / steps)
+		# Every frame, so a resize settles even when no new events arrive
+		self._handle_system_events(events)
+		if self.fixed_step:
+			alpha = self._advance_fixed(events, frame_ms / 1000.0)
 		else:
-			pass
+			self.dt = frame_ms / 1000.0 if frame_ms > 0 else self.dt
+			# Swept contacts need the players' start-of-step positions
+			self._snapshot_states()
+			self.handle_input(events)
+			prof.lap("input")
+			if not self.paused:
+				self.update(self.dt)
+				prof.lap("physics")
+			alpha = 1.0
+		# Deliver this frame's events (sounds etc.) in one batch
+		self.events.dispatch()
+		prof.lap("dispatch")
 		fps_val = self.clock.get_fps()
-		self.draw(fps_val)
-		pygame.display.flip()
+		dirty = self.draw(fps_val, alpha)
+		if dirty is None:
+			pygame.display.flip()
+		else:
+			pygame.display.update(dirty)
+		prof.lap("flip")
+		# Key events count as shown once a step has applied them (a fixed-step
+		# frame without a step keeps them pending for the next frame)
+		if self._key_stamps and not self._pending_events:
+			now = time.perf_counter()
+			for stamp in self._key_stamps:
+				self.latency.add(now - stamp)
+			self._key_stamps.clear()
+		prof.end_frame()
 		return True
+
+	def _poll_events(self) -> list:
+		"""Pump the event queue, stamping key events with the poll time while latency is recorded."""
+		events = pygame.event.get()
+		if self.latency_dump or self.debug or self.profiler.enabled:
+			now = time.perf_counter()
+			for e in events:
+				if e.type == pygame.KEYDOWN or e.type == pygame.KEYUP:
+					self._key_stamps.append(now)
+		self.profiler.lap("events")
+		return events
+
+	def _snapshot_states(self) -> None:
+		"""Remember current positions as the 'previous' step for render interpolation."""
+		self.world.snapshot()
+
+	def _advance_fixed(self, events: list, frame_time: float) -> float:
+		"""Run as many fixed physics steps as the elapsed frame time allows.
+
+		Input is applied per step (events on the first step only, held keys on
+		every step), so the simulation never sees a variable dt. Returns the
+		interpolation factor for rendering.
+		"""
+		# Clamp long stalls (window drags, breakpoints) to avoid a spiral of death
+		self.accumulator += min(frame_time, self.max_frame_time)
+		if self.paused:
+			self.handle_input(events)
+			self.profiler.lap("input")
+			self.accumulator = 0.0
+			return 1.0
+		if self.accumulator < self.step_dt:
+			# No step this frame - keep the events for the next one
+			self._pending_events.extend(events)
+			return self.accumulator / self.step_dt
+		pending = self._pending_events + events
+		self._pending_events = []
+		self.dt = self.step_dt
+		while self.accumulator >= self.step_dt:
+			self._snapshot_states()
+			self.handle_input(pending)
+			self.profiler.lap("input")
+			pending = []
+			if not self.paused:
+				self.update(self.step_dt)
+				self.ticks += 1
+				self.profiler.lap("physics")
+			self.accumulator -= self.step_dt
+		return self.accumulator / self.step_dt
+
+	def step(self, dt: float) -> None:
+		"""Advance the match by one tick without polling input or rendering.
+
+		AI-controlled teams move and auto-kicks are resolved exactly as in
+		handle_input(), then update() runs the regular simulation. Human teams
+		receive no input and stand still.
+		"""
+		self.dt = dt
+		self._snapshot_states()
+		self._handle_ai_teams(self._ai_controlled_teams())
+		self._handle_kicks()
+		self.update(dt)
+		self.ticks += 1
+		self.events.dispatch()
+
+	def run_headless(self, dt: float = None, max_seconds: float = None) -> dict:
+		"""Step the match until it finishes (or max_seconds elapse) and return its result."""
+		dt = dt or 1.0 / max(1, CFG.fps)
+		limit = None if max_seconds is None else int(max_seconds / dt)
+		while self.state != "finished" and (limit is None or self.ticks < limit):
+			self.step(dt)
+		return self.result()
+
+	def result(self) -> dict:
+		"""Summary of the match so far, suitable for logging or aggregation."""
+		return {
+			"mode": self.mode,
+			"per_team": len(self.team_l.players),
+			"minutes": self.match_time / 60.0,
+			"ai_difficulty": self.ai_difficulty,
+			"score_l": self.score_l,
+			"score_r": self.score_r,
+			"hits_l": self.hits_l,
+			"hits_r": self.hits_r,
+			"possession_l": self.possession_l,
+			"possession_r": self.possession_r,
+			"ticks": self.ticks,
+			"finished": self.state == "finished",
+		}
@@ -0,0 +1,43 @@
+"""Headless match runner for AI-vs-AI balancing.
+
+Runs the regular Game simulation (ball, force field, collisions, AI, goals,
+timer) without opening a window, initializing audio or loading sprites, so
+matches step as fast as the CPU allows.
+"""
+
+import argparse
+import time
+from game import Game
+
+
+def run_match(mode: str = "multiplayer_ai", per_team: int = 2, minutes: int = 2, ai_difficulty: str = "Normal", dt: float = None, seed: int = None) -> dict:
+	"""Play one complete headless match and return its result dictionary.
+
+	With a seed the match is bit-for-bit reproducible.
+	"""
+	game = Game(None, mode=mode, per_team=per_team, minutes=minutes, ai_difficulty=ai_difficulty, headless=True, seed=seed)
+	return game.run_headless(dt=dt or game.step_dt)
+
+
+def main() -> None:
+	"""Command line entry point: run a batch of headless matches and print results."""
+	parser = argparse.ArgumentParser(description="Run Tiny Football matches without a window.")
+	parser.add_argument("--matches", type=int, default=1, help="number of matches to play")
+	parser.add_argument("--per-team", type=int, default=2, help="players per team")
+	parser.add_argument("--minutes", type=int, default=2, help="match length in minutes")
+	parser.add_argument("--difficulty", default="Normal", choices=["Easy", "Normal", "Hard"])
+	parser.add_argument("--seed", type=int, default=None, help="seed of the first match (match i uses seed + i)")
+	args = parser.parse_args()
+
+	for i in range(args.matches):
+		start = time.perf_counter()
+		seed = None if args.seed is None else args.seed + i
+		res = run_match(per_team=args.per_team, minutes=args.minutes, ai_difficulty=args.difficulty, seed=seed)
+		elapsed = time.perf_counter() - start
+		print(f"match {i + 1}: {res['score_l']}-{res['score_r']} hits {res['hits_l']}/{res['hits_r']} "
+			f"possession {res['possession_l']:.1f}s/{res['possession_r']:.1f}s "
+			f"({res['ticks']} ticks in {elapsed:.2f}s, {res['ticks'] / max(elapsed, 1e-9):.0f} ticks/s)")
+
+
+if __name__ == "__main__":
+	main()
@@ -1,9 +1,10 @@
 """Heads-up display for scores, stats, timer, and debug text."""
 
-import os
 import pygame
 from settings import CFG
 from scaling import SCALING
+from fonts import FONTS
+from controls import controls_hint
 
 
 class HUD:
@@ -11,16 +12,15 @@ class HUD:
 	
 	def __init__(self):
 		"""Initialize HUD with fonts and display settings."""
-		pygame.font.init()
 		self.base_font_size = int(CFG.hud.get("font_size", 20))
 		self.base_big_font_size = self.base_font_size + 6
-		self.font = pygame.font.SysFont(None, self.base_font_size)
-		self.big = pygame.font.SysFont(None, self.base_big_font_size)
 		self.show_fps = bool(CFG.hud.get("show_fps", True))
 		self.debug = False
 		self.show_live_stats = False  # Toggle for live player stats
+		self.controls_hint = controls_hint()  # from the keymaps in controls.py
 		
 		# Update fonts with current scaling
+		self._fonts_generation = None
 		self._update_fonts()
 
 	def toggle_debug(self):
@@ -32,13 +32,14 @@ class HUD:
 		self.show_live_stats = not self.show_live_stats
 		
 	def _update_fonts(self):
-		"""Update fonts with current scaling factor."""
-		scaled_font_size = SCALING.scale_font_size(self.base_font_size)
-		scaled_big_font_size = SCALING.scale_font_size(self.base_big_font_size)
-		self.font = pygame.font.SysFont(None, scaled_font_size)
-		self.big = pygame.font.SysFont(None, scaled_big_font_size)
+		"""Pick the shared fonts for the current scaling factor (created once per size)."""
+		if self._fonts_generation == SCALING.generation:
+			return
+		self._fonts_generation = SCALING.generation
+		self.font = FONTS.font(SCALING.scale_font_size(self.base_font_size))
+		self.big = FONTS.font(SCALING.scale_font_size(self.base_big_font_size))
 
-	def draw(self, surface: pygame.Surface, score_l: int, score_r: int, hits_l: int, hits_r: int, fps_val: float, force_label: str = "", time_left: float = None) -> None:
+	def draw(self, surface: pygame.Surface, score_l: int, score_r: int, hits_l: int, hits_r: int, fps_val: float, force_label: str = "", time_left: float = None) -> list:
 		"""Draw main HUD elements including score, controls, and optional info.
 		
 		Args:
@@ -50,40 +51,46 @@ class HUD:
 			fps_val: Current FPS value
 			force_label: Optional force field status text
 			time_left: Remaining match time in seconds
+
+		Returns:
+			Rects of the text drawn this frame (for dirty-rect updates)
 		"""
-		# Update fonts with current scaling
+		# Refresh fonts if the window was resized
 		self._update_fonts()
+		drawn = []
 		
 		w, h = surface.get_size()
 		offset = SCALING.get_offset()
 		
 		# Top center score - simplified without scoreboard
-		score_text = self.big.render(f"P1 {score_l} - {score_r} P2", True, (255, 255, 255))
+		score_text = FONTS.render(f"P1 {score_l} - {score_r} P2", self.big, (255, 255, 255))
 		rect = score_text.get_rect(center=(w // 2, int(24 + offset.y)))
-		surface.blit(score_text, rect)
+		drawn.append(surface.blit(score_text, rect))
 		
-		# Controls hint bottom-left (updated to remove group command)
-		hint = self.font.render("WASD vs Arrows | Tab/K: cycle | 1-5/6-0: select | B: stats | P: pause | M: mute", True, (235, 235, 235))
-		surface.blit(hint, (int(16 + offset.x), int(h - 28)))
+		# Controls hint bottom-left, built from the keymap tables
+		hint = FONTS.render(self.controls_hint, self.font, (235, 235, 235))
+		drawn.append(surface.blit(hint, (int(16 + offset.x), int(h - 28))))
 		
 		if force_label:
-			fl = self.font.render(force_label, True, (220, 240, 255))
-			surface.blit(fl, (int(16 + offset.x), int(16 + offset.y)))
+			fl = FONTS.render(force_label, self.font, (220, 240, 255))
+			drawn.append(surface.blit(fl, (int(16 + offset.x), int(16 + offset.y))))
 		if self.show_fps:
-			fps = self.font.render(f"{fps_val:.0f} FPS", True, (230, 230, 230))
-			surface.blit(fps, (int(16 + offset.x), int(16 + offset.y)))
+			fps = FONTS.render(f"{fps_val:.0f} FPS", self.font, (230, 230, 230))
+			drawn.append(surface.blit(fps, (int(16 + offset.x), int(16 + offset.y))))
 		if time_left is not None:
 			m = int(time_left // 60)
 			s = int(time_left % 60)
-			txt = self.big.render(f"{m:02d}:{s:02d}", True, (255, 255, 255))
-			surface.blit(txt, (int(w - 110 + offset.x), int(16 + offset.y)))
+			txt = FONTS.render(f"{m:02d}:{s:02d}", self.big, (255, 255, 255))
+			drawn.append(surface.blit(txt, (int(w - 110 + offset.x), int(16 + offset.y))))
+		return drawn
 
-	def draw_live_stats(self, surface: pygame.Surface, ball, teams) -> None:
-		"""Draw live player statistics on top left and right corners."""
+	def draw_live_stats(self, surface: pygame.Surface, ball, teams) -> list:
+		"""Draw live player statistics on top left and right corners; returns the drawn rects."""
 		if not self.show_live_stats:
-			return
+			return []
 		
 		w, _ = surface.get_size()
+		drawn = []
 		
 		# Show only basic info in normal mode, detailed info in debug mode
 		if not self.debug:
@@ -95,8 +102,8 @@ class HUD:
 						active_players.append(f"P1-{pi+1}")
 				if active_players:
 					text = f"Active: {', '.join(active_players)}"
-					surf = self.font.render(text, True, (255, 255, 100))
-					surface.blit(surf, (16, 60))
+					surf = FONTS.render(text, self.font, (255, 255, 100))
+					drawn.append(surface.blit(surf, (16, 60)))
 			
 			if teams and len(teams) > 1:
 				active_players = []
@@ -105,9 +112,9 @@ class HUD:
 						active_players.append(f"P2-{pi+1}")
 				if active_players:
 					text = f"Active: {', '.join(active_players)}"
-					surf = self.font.render(text, True, (255, 255, 100))
+					surf = FONTS.render(text, self.font, (255, 255, 100))
 					text_rect = surf.get_rect()
-					surface.blit(surf, (w - text_rect.width - 16, 60))
+					drawn.append(surface.blit(surf, (w - text_rect.width - 16, 60)))
 		else:
 			# Debug mode: show detailed position and speed info
 			# Get offset for proper scaling
@@ -123,12 +130,11 @@ class HUD:
 				for pi, p in enumerate(teams[0].players):
 					speed = p.vel.length()
 					# Show the actual rendered position (scaled + offset)
-					rendered_pos = SCALING.apply_offset(SCALING.scale_position(p.pos))
+					rendered_pos = SCALING.apply_offset(p.pos)
 					text = f"P1-{pi+1}: pos({rendered_pos.x:.0f},{rendered_pos.y:.0f}) spd({speed:.0f})"
 					# Use scaled font size like in starting screen
-					scaled_font = pygame.font.Font(None, SCALING.scale_font_size(16))
-					surf = scaled_font.render(text, True, (255, 255, 255))
-					surface.blit(surf, (int(SCALING.scale_font_size(16)), int(y_left)))
+					surf = FONTS.render(text, FONTS.font(SCALING.scale_font_size(16)), (255, 255, 255))
+					drawn.append(surface.blit(surf, (int(SCALING.scale_font_size(16)), int(y_left))))
 					y_left += SCALING.scale_font_size(18)
 			
 			# Right team stats (top right corner)
@@ -137,25 +143,29 @@ class HUD:
 				for pi, p in enumerate(teams[1].players):
 					speed = p.vel.length()
 					# Show the actual rendered position (scaled + offset)
-					rendered_pos = SCALING.apply_offset(SCALING.scale_position(p.pos))
+					rendered_pos = SCALING.apply_offset(p.pos)
 					text = f"P2-{pi+1}: pos({rendered_pos.x:.0f},{rendered_pos.y:.0f}) spd({speed:.0f})"
 					# Use scaled font size like in starting screen
-					scaled_font = pygame.font.Font(None, SCALING.scale_font_size(16))
-					surf = scaled_font.render(text, True, (255, 255, 255))
+					surf = FONTS.render(text, FONTS.font(SCALING.scale_font_size(16)), (255, 255, 255))
 					text_rect = surf.get_rect()
-					surface.blit(surf, (int(w - text_rect.width - SCALING.scale_font_size(16)), int(y_right)))
+					drawn.append(surface.blit(surf, (int(w - text_rect.width - SCALING.scale_font_size(16)), int(y_right))))
 					y_right += SCALING.scale_font_size(18)
+		return drawn
 
-	def draw_debug_text(self, surface: pygame.Surface, ball, teams) -> None:
+	def draw_debug_text(self, surface: pygame.Surface, ball, teams) -> list:
 		"""Draw detailed debug information about ball and player positions/velocities.
 		
 		Args:
 			surface: Pygame surface to draw on
 			ball: Ball object to display info for
 			teams: List of team objects to display player info for
+
+		Returns:
+			Rects of the lines drawn
 		"""
 		if not self.debug:
-			return
+			return []
+		drawn = []
 		info = [
 			f"Ball pos=({ball.pos.x:.1f},{ball.pos.y:.1f}) vel=({ball.vel.x:.1f},{ball.vel.y:.1f})",
 		]
@@ -164,7 +174,66 @@ class HUD:
 				info.append(f"T{ti+1}P{pi+1} pos=({p.pos.x:.1f},{p.pos.y:.1f}) vel=({p.vel.x:.1f},{p.vel.y:.1f}){' *' if p.is_active else ''}")
 		y = 72
 		for line in info:
-			surf = self.font.render(line, True, (255, 255, 0))
-			surface.blit(surf, (16, y))
+			surf = FONTS.render(line, self.font, (255, 255, 0))
+			drawn.append(surface.blit(surf, (16, y)))
 			y += 18
+		return drawn
+
+	def draw_profile(self, surface: pygame.Surface, stats: dict) -> list:
+		"""Draw the frame profiler table (p50/p95/p99 per phase, in ms) at the bottom right.
+
+		Args:
+			surface: Pygame surface to draw on
+			stats: FrameProfiler.summary() output
 
+		Returns:
+			Rects of the panel drawn
+		"""
+		font = FONTS.font(SCALING.scale_font_size(16))
+		rows = [("phase", "p50", "p95", "p99")]
+		rows += [(phase, f"{s['p50']:.2f}", f"{s['p95']:.2f}", f"{s['p99']:.2f}") for phase, s in stats.items()]
+		line_h = font.get_linesize()
+		col_w = font.size("000.00")[0] + 8
+		name_w = font.size("draw_overlay")[0] + 8
+		w, h = surface.get_size()
+		panel = pygame.Rect(0, 0, name_w + 3 * col_w + 12, line_h * len(rows) + 8)
+		panel.bottomright = (w - 16, h - 36)
+		drawn = [pygame.draw.rect(surface, (0, 0, 0), panel)]
+		y = panel.top + 4
+		for i, row in enumerate(rows):
+			color = (255, 255, 100) if i == 0 or row[0] == "frame" else (230, 230, 230)
+			surface.blit(FONTS.render(row[0], font, color), (panel.left + 6, y))
+			for c, cell in enumerate(row[1:]):
+				surf = FONTS.render(cell, font, color)
+				right = panel.left + 6 + name_w + (c + 1) * col_w
+				surface.blit(surf, (right - surf.get_width(), y))
+			y += line_h
+		return drawn
+
+	def draw_latency(self, surface: pygame.Surface, stats: dict, low_latency: bool = False) -> list:
+		"""Draw the key event-to-flip latency summary (ms) at the bottom left.
+
+		Args:
+			surface: Pygame surface to draw on
+			stats: LatencyHistogram.summary() output
+			low_latency: Whether events are polled after the frame-pacing sleep
+
+		Returns:
+			Rects of the panel drawn
+		"""
+		font = FONTS.font(SCALING.scale_font_size(16))
+		mode = "low-latency" if low_latency else "standard"
+		lines = [f"input latency ({mode}), {stats['count']} keys"]
+		if stats["count"]:
+			lines.append(f"p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f}  max {stats['max']:.1f} ms")
+		line_h = font.get_linesize()
+		w, h = surface.get_size()
+		panel = pygame.Rect(0, 0, max(font.size(line)[0] for line in lines) + 12, line_h * len(lines) + 8)
+		panel.bottomleft = (16, h - 36)
+		drawn = [pygame.draw.rect(surface, (0, 0, 0), panel)]
+		y = panel.top + 4
+		for i, line in enumerate(lines):
+			color = (255, 255, 100) if i == 0 else (230, 230, 230)
+			surface.blit(FONTS.render(line, font, color), (panel.left + 6, y))
+			y += line_h
+		return drawn
@@ -0,0 +1,77 @@
+"""Input-to-display latency histogram.
+
+Game.run_frame stamps every key event with the time it was polled and, once
+the frame that applied the event has been flipped, records flip time minus
+poll time here. pygame events carry no arrival time, so the numbers are a
+lower bound of what a player feels: time spent queued in SDL before the poll
+is not seen, which is exactly the part the low-latency input mode
+(input.low_latency, polling after the frame-pacing sleep) shrinks.
+
+Samples go into fixed-width bins, so recording is O(1) and a long session
+costs no more memory than a short one.
+"""
+
+import json
+import os
+import numpy as np
+
+BIN_MS = 0.5  # bin width
+MAX_MS = 100.0  # larger samples land in the last (overflow) bin
+
+
+class LatencyHistogram:
+	"""Counts of latency samples in BIN_MS-wide bins from 0 to MAX_MS, plus an overflow bin."""
+
+	def __init__(self):
+		self.counts = np.zeros(int(MAX_MS / BIN_MS) + 1, dtype=np.int64)
+		self.count = 0
+		self.total_ms = 0.0
+		self.max_ms = 0.0
+
+	def reset(self) -> None:
+		"""Forget every sample."""
+		self.counts[:] = 0
+		self.count = 0
+		self.total_ms = 0.0
+		self.max_ms = 0.0
+
+	def add(self, seconds: float) -> None:
+		"""Record one event-to-flip latency."""
+		ms = max(0.0, seconds * 1000.0)
+		self.counts[min(int(ms / BIN_MS), len(self.counts) - 1)] += 1
+		self.count += 1
+		self.total_ms += ms
+		self.max_ms = max(self.max_ms, ms)
+
+	def percentile(self, q: float) -> float:
+		"""Upper edge (ms) of the bin holding the q-th percentile sample; 0 with no samples."""
+		if self.count == 0:
+			return 0.0
+		rank = max(1, int(np.ceil(q / 100.0 * self.count)))
+		i = int(np.searchsorted(np.cumsum(self.counts), rank))
+		# The overflow bin has no upper edge; the largest sample bounds it
+		return self.max_ms if i == len(self.counts) - 1 else min((i + 1) * BIN_MS, self.max_ms)
+
+	def summary(self) -> dict:
+		"""{"count", "p50", "p95", "p99", "mean", "max"}, latencies in milliseconds."""
+		return {
+			"count": self.count,
+			"p50": self.percentile(50),
+			"p95": self.percentile(95),
+			"p99": self.percentile(99),
+			"mean": self.total_ms / self.count if self.count else 0.0,
+			"max": self.max_ms,
+		}
+
+	def dump(self, path: str, **meta) -> str:
+		"""Write the summary and the non-empty bins ([lower edge ms, count]) as JSON; returns path."""
+		data = dict(meta)
+		data["bin_ms"] = BIN_MS
+		data["summary_ms"] = self.summary()
+		data["bins"] = [[round(i * BIN_MS, 3), int(n)] for i, n in enumerate(self.counts) if n]
+		directory = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		with open(path, "w", encoding="utf-8") as f:
+			json.dump(data, f, indent=1)
+		return path
@@ -0,0 +1,52 @@
+"""Leveled logging for the game, configured once from config.json.
+
+All game loggers live under "tiny_football" (get_logger("ball") is
+"tiny_football.ball"). Messages use logging's lazy %-style arguments, so a
+record below the configured level is dropped before its text is built; debug
+dumps that need extra work to gather their values are wrapped in
+`if log.isEnabledFor(logging.DEBUG)`. Records go to stderr and, if "file" is
+set, are appended to that file as well.
+"""
+
+import logging
+import os
+from settings import CFG
+
+ROOT = "tiny_football"
+CONSOLE_FORMAT = "%(levelname)s %(name)s: %(message)s"
+FILE_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def get_logger(name: str) -> logging.Logger:
+	"""Logger for one part of the game (e.g. "ball", "team", "game")."""
+	return logging.getLogger(f"{ROOT}.{name}")
+
+
+def configure(level="INFO", file: str = None) -> logging.Logger:
+	"""(Re)configure the game's root logger: level name or number, optional file sink.
+
+	Replaces handlers added by an earlier call, so it is safe to call again.
+	"""
+	root = logging.getLogger(ROOT)
+	for handler in list(root.handlers):
+		root.removeHandler(handler)
+		handler.close()
+	root.setLevel(level.upper() if isinstance(level, str) else level)
+	root.propagate = False
+
+	console = logging.StreamHandler()
+	console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+	root.addHandler(console)
+	if file:
+		base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+		path = os.path.join(base_dir, file)  # relative paths are under tiny-football/
+		directory = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		sink = logging.FileHandler(path, encoding="utf-8")
+		sink.setFormatter(logging.Formatter(FILE_FORMAT))
+		root.addHandler(sink)
+	return root
+
+
+configure(CFG.log.get("level", "INFO"), CFG.log.get("file"))
@@ -1,8 +1,17 @@
 import pygame
 import sys
+import time
 from settings import CFG
-from scaling import SCALING
+from scaling import SCALING, ResizeDebouncer
+from fonts import FONTS
+from assets import ASSETS
 from game import Game
+from log import get_logger
+
+log = get_logger("menu")
+
+# Menu backdrop, scaled to the window
+MENU_BACKGROUND = "gfx/start_bg.jpg"
 
 
 class Menu:
@@ -11,11 +20,8 @@ class Menu:
 	def __init__(self, screen: pygame.Surface):
 		"""Initialize menu with UI elements and default settings"""
 		self.screen = screen
-		pygame.font.init()
 		self.base_font_size = 24
 		self.base_big_font_size = 42
-		self.font = pygame.font.SysFont(None, self.base_font_size)
-		self.big = pygame.font.SysFont(None, self.base_big_font_size)
 		
 		# Update fonts with current scaling
 		self._update_fonts()
@@ -28,18 +34,14 @@ class Menu:
 		self.ai_difficulty = self.ai_difficulties[self.ai_diff_idx]
   		# self.ai_difficulty = ai_difficulty
 		try:
-			import os
-			base_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
-			bg_path = os.path.join(base_dir, "assets", "gfx", "start_bg.jpg")
-			if os.path.exists(bg_path):
-				self.original_background = pygame.image.load(bg_path).convert()
+			self.original_background = ASSETS.load(MENU_BACKGROUND, alpha=False)
+			if self.original_background:
 				self._update_background()
-				print(f"Background loaded successfully: {bg_path}")
+				log.info("Background loaded: %s", MENU_BACKGROUND)
 			else:
-				print(f"Background image not found: {bg_path}")
-				self.original_background = None
+				log.warning("Background image not found: %s", MENU_BACKGROUND)
 		except Exception as e:
-			print(f"Error loading background: {e}")
+			log.warning("Error loading background: %s", e)
 			self.original_background = None
 
 		# 0: multiplayer, 1: human_vs_ai, 2: two_plus_ai
@@ -71,35 +73,51 @@ class Menu:
 		"""Update fonts with current scaling factor."""
 		scaled_font_size = max(12, min(48, SCALING.scale_font_size(self.base_font_size)))  # Clamp font size
 		scaled_big_font_size = max(16, min(72, SCALING.scale_font_size(self.base_big_font_size)))  # Clamp font size
-		# Use a more reliable font
-		self.font = pygame.font.Font(None, scaled_font_size)
-		self.big = pygame.font.Font(None, scaled_big_font_size)
+		# Shared fonts, created once per size
+		self.font = FONTS.font(scaled_font_size)
+		self.big = FONTS.font(scaled_big_font_size)
 		
-	def _update_background(self):
-		"""Update background image with current scaling."""
+	def _update_background(self, size: tuple = None, preview: bool = False):
+		"""Update background image with current scaling (a fast, unsmoothed copy if preview)."""
 		if self.original_background:
-			screen_size = self.screen.get_size()
-			self.background = pygame.transform.smoothscale(self.original_background, screen_size)
+			size = size or self.screen.get_size()
+			if preview:
+				# Mid-drag sizes are seen once: skip smoothing and the shared cache
+				self.background = pygame.transform.scale(self.original_background, size)
+			else:
+				# Scaled once per window size and shared through the asset manager
+				self.background = ASSETS.get(MENU_BACKGROUND, size, smooth=True, alpha=False)
+
+	def _handle_resize(self, resize: ResizeDebouncer, events: list) -> None:
+		"""Window resizes, once per frame: a cheap preview while dragging, a full rebuild once settled."""
+		now = time.perf_counter()
+		size = resize.feed(events, now)
+		if size is not None:
+			# Update scaling system with new window size (forced uniform scaling)
+			SCALING.update_size(*size)
+			self._update_fonts()
+			self._update_background(size, preview=True)
+		size = resize.settled(now)
+		if size is not None:
+			SCALING.update_size(*size)
+			# Resize window to forced aspect ratio
+			pygame.display.set_mode((SCALING.current_width, SCALING.current_height), pygame.RESIZABLE)
+			resize.size = (SCALING.current_width, SCALING.current_height)
+			self._update_fonts()
+			self._update_background()
 
 	def loop(self):
 		"""Main menu event loop handling user input and rendering."""
 		clock = pygame.time.Clock()
 		running = True
+		resize = ResizeDebouncer(self.screen.get_size(), float(CFG.render.get("resize_settle", 0.2)))
 
 		while running:
-			for e in pygame.event.get():
+			events = pygame.event.get()
+			self._handle_resize(resize, events)
+			for e in events:
 				if e.type == pygame.QUIT:
 					return None
-				
-				# Handle window resize events
-				if e.type == pygame.VIDEORESIZE:
-					# Update scaling system with new window size (forced uniform scaling)
-					SCALING.update_size(e.w, e.h)
-					# Resize window to forced aspect ratio
-					pygame.display.set_mode((SCALING.current_width, SCALING.current_height), pygame.RESIZABLE)
-					# Update fonts and background
-					self._update_fonts()
-					self._update_background()
 
 				if e.type == pygame.KEYDOWN:
 					if e.key == pygame.K_ESCAPE:
@@ -192,8 +210,8 @@ class Menu:
 		offset = SCALING.get_offset()
 
 		# Title with subtle backdrop - centered on screen
-		title = self.big.render("Tiny Football", True, (255, 255, 255))
-		shadow = self.big.render("Tiny Football", True, (0, 0, 0))
+		title = FONTS.render("Tiny Football", self.big, (255, 255, 255))
+		shadow = FONTS.render("Tiny Football", self.big, (0, 0, 0))
 		title_y = int(60 + offset.y)
 		tr = title.get_rect(center=(w // 2, title_y))
 		self.screen.blit(shadow, tr.move(2, 2))
@@ -235,7 +253,7 @@ class Menu:
 			else:
 				color = (180, 180, 180)  # Gray for unselected
 				
-			surf = self.font.render(text, True, color)
+			surf = FONTS.render(text, self.font, color)
 			rect = surf.get_rect(center=row_rect.center)
 			self.screen.blit(surf, rect)
 			if len(self._mode_rects) < len(options):
@@ -254,10 +272,10 @@ class Menu:
 		button_size = int(24 * SCALING.uniform_scale)
 		
 		# Players per team - Line 1
-		pt_label = self.font.render("Players per team:", True, (240, 240, 240))
+		pt_label = FONTS.render("Players per team:", self.font, (240, 240, 240))
 		self.screen.blit(pt_label, (settings_x, settings_y_start))
 		
-		pt_val = self.font.render(str(self.per_team), True, (255, 255, 255))
+		pt_val = FONTS.render(str(self.per_team), self.font, (255, 255, 255))
 		# Calculate proper spacing with margin
 		spacing = int(20 * SCALING.uniform_scale)
 		val_x = settings_x + pt_label.get_width() + spacing
@@ -269,16 +287,16 @@ class Menu:
 		self._plus_rect = pygame.Rect(val_x + pt_val.get_width() + button_spacing, settings_y_start, button_size, button_size)
 		pygame.draw.rect(self.screen, (240, 120, 120), self._minus_rect, 0, border_radius=int(4 * SCALING.uniform_scale))
 		pygame.draw.rect(self.screen, (120, 240, 120), self._plus_rect, 0, border_radius=int(4 * SCALING.uniform_scale))
-		minus_text = self.font.render("-", True, (255, 255, 255))
-		plus_text = self.font.render("+", True, (255, 255, 255))
+		minus_text = FONTS.render("-", self.font, (255, 255, 255))
+		plus_text = FONTS.render("+", self.font, (255, 255, 255))
 		self.screen.blit(minus_text, minus_text.get_rect(center=self._minus_rect.center))
 		self.screen.blit(plus_text, plus_text.get_rect(center=self._plus_rect.center))
 
 		# Player acceleration - Line 2
-		pa_label = self.font.render("Player acceleration:", True, (240, 240, 240))
+		pa_label = FONTS.render("Player acceleration:", self.font, (240, 240, 240))
 		self.screen.blit(pa_label, (settings_x, settings_y_start + line_height))
 		
-		pa_val = self.font.render(f"{int(self.player_accel)}", True, (255, 255, 255))
+		pa_val = FONTS.render(f"{int(self.player_accel)}", self.font, (255, 255, 255))
 		pa_val_x = settings_x + pa_label.get_width() + int(15 * SCALING.uniform_scale)
 		self.screen.blit(pa_val, (pa_val_x, settings_y_start + line_height))
 		
@@ -287,23 +305,23 @@ class Menu:
 		self._pa_plus = pygame.Rect(pa_val_x + pa_val.get_width() + button_spacing, settings_y_start + line_height, button_size, button_size)
 		pygame.draw.rect(self.screen, (240, 120, 120), self._pa_minus, 0, border_radius=int(4 * SCALING.uniform_scale))
 		pygame.draw.rect(self.screen, (120, 240, 120), self._pa_plus, 0, border_radius=int(4 * SCALING.uniform_scale))
-		pa_minus_text = self.font.render("-", True, (255, 255, 255))
-		pa_plus_text = self.font.render("+", True, (255, 255, 255))
+		pa_minus_text = FONTS.render("-", self.font, (255, 255, 255))
+		pa_plus_text = FONTS.render("+", self.font, (255, 255, 255))
 		self.screen.blit(pa_minus_text, pa_minus_text.get_rect(center=self._pa_minus.center))
 		self.screen.blit(pa_plus_text, pa_plus_text.get_rect(center=self._pa_plus.center))
 
 		# Match length - Line 3
-		match_label = self.font.render("Match length (minutes):", True, (240, 240, 240))
+		match_label = FONTS.render("Match length (minutes):", self.font, (240, 240, 240))
 		self.screen.blit(match_label, (settings_x, settings_y_start + line_height * 2))
 		
-		match_val = self.font.render(str(self.match_minutes), True, (255, 255, 255))
+		match_val = FONTS.render(str(self.match_minutes), self.font, (255, 255, 255))
 		match_val_x = settings_x + match_label.get_width() + int(15 * SCALING.uniform_scale)
 		self.screen.blit(match_val, (match_val_x, settings_y_start + line_height * 2))
   
 		# AI Difficulty toggle (only for Human vs AI)
 		if self.mode_idx == 1:
-			diff_label = self.font.render("AI Difficulty:", True, (240, 240, 240))
-			diff_val = self.font.render(self.ai_difficulty, True, (255, 255, 0))
+			diff_label = FONTS.render("AI Difficulty:", self.font, (240, 240, 240))
+			diff_val = FONTS.render(self.ai_difficulty, self.font, (255, 255, 0))
 			diff_y = settings_y_start + line_height * 3
 			self.screen.blit(diff_label, (settings_x, diff_y))
 			self.screen.blit(diff_val, (settings_x + diff_label.get_width() + 20, diff_y))
@@ -316,8 +334,8 @@ class Menu:
 		self._tplus_rect = pygame.Rect(match_val_x + match_val.get_width() + button_spacing, settings_y_start + line_height * 2, button_size, button_size)
 		pygame.draw.rect(self.screen, (240, 120, 120), self._tminus_rect, 0, border_radius=int(4 * SCALING.uniform_scale))
 		pygame.draw.rect(self.screen, (120, 240, 120), self._tplus_rect, 0, border_radius=int(4 * SCALING.uniform_scale))
-		match_minus_text = self.font.render("-", True, (255, 255, 255))
-		match_plus_text = self.font.render("+", True, (255, 255, 255))
+		match_minus_text = FONTS.render("-", self.font, (255, 255, 255))
+		match_plus_text = FONTS.render("+", self.font, (255, 255, 255))
 		self.screen.blit(match_minus_text, match_minus_text.get_rect(center=self._tminus_rect.center))
 		self.screen.blit(match_plus_text, match_plus_text.get_rect(center=self._tplus_rect.center))
 		
@@ -358,7 +376,7 @@ class Menu:
 		mouse = pygame.mouse.get_pos()
 		hover = start_rect.collidepoint(mouse)
 		pygame.draw.rect(self.screen, (60, 140, 240) if hover else (40, 100, 200), start_rect, 0, border_radius=int(8 * SCALING.uniform_scale))
-		label = self.font.render("Start", True, (255, 255, 255))
+		label = FONTS.render("Start", self.font, (255, 255, 255))
 		self.screen.blit(label, label.get_rect(center=start_rect.center))
 		self._start_rect = start_rect
 
@@ -1,7 +1,9 @@
 import math
+import numpy as np
 import pygame
 from pygame.math import Vector2 as V2
 from settings import CFG
+from physics.world import cap_speed
 
 
 class ForceField:
@@ -60,6 +62,20 @@ class ForceField:
 			# Step 4: Apply force as impulse to ball
 			ball.apply_force(force)
 
+	def apply_batch(self, pos: np.ndarray, vel: np.ndarray, max_speed: np.ndarray, dt: float) -> None:
+		"""Vectorized apply() for many balls: same inverse-square pull, in place on vel.
+
+		Args:
+			pos, vel: Ball positions and velocities shaped (..., 2)
+			max_speed: Per-ball speed caps shaped (...)
+			dt: Delta time in seconds
+		"""
+		if not self.enabled or self.kind != "gravity":
+			return
+		d = np.array((self.center.x, self.center.y)) - pos
+		d2 = np.maximum(np.add.reduce(d * d, axis=-1), 50.0)
+		vel[...] = cap_speed(vel + d * (self.strength / d2)[..., None] * dt, max_speed)
+
 	def draw(self, surface: pygame.Surface, t: float) -> None:
 		"""Draw visual representation of the force field."""
 		if not self.enabled:
@@ -0,0 +1,240 @@
+"""Closed-form ball trajectory prediction.
+
+The simulation moves the ball at constant velocity through each step,
+reflects it off the walls with restitution mid-step (sweep_balls) and only
+at the end of the step applies friction f, zeroing speeds below 0.1 px/s
+(damp_balls). Between bounces the ball moves in a straight line, its speed
+drops by f once per step, and the distance covered is a geometric series
+that is linear inside each step, so the whole future path can be written
+down without stepping the simulation:
+
+BALL TRAJECTORY EQUATIONS:
+
+1. Distance after x steps (speed S in step 0, x = n + frac, n whole steps):
+   s(x) = S * dt * (1 - f^n) / (1 - f) + S * f^n * dt * frac
+   (S * dt * x when f = 1)
+
+2. Steps needed to cover a distance D (inverse of 1.):
+   n = floor(log(1 - D * (1 - f) / (S * dt)) / log(f)),  frac = (D - s(n)) / (S * f^n * dt)
+
+3. Stop: the ball always finishes the step it is in, then stops at the end of
+   the first step n >= 1 with S * f^n < 0.1 px/s
+
+4. Wall bounce at step x_b: the path is split into straight segments at each
+   wall hit; the hit axis of the direction is flipped and the rest of step
+   floor(x_b) runs at S * f^floor(x_b) * restitution. Each segment keeps its
+   series anchored to whole steps, so friction lands on the same step
+   boundaries as in the simulation.
+
+5. Speed cap: damp_balls caps the speed at the end of a step, so a ball
+   faster than max_speed / f runs one step uncapped and a new segment then
+   starts at max_speed in the same direction.
+
+Players and the force field are not modeled. For a ball in free flight the
+predictions match stepping sweep_balls -> damp_balls up to float rounding,
+bounces included.
+"""
+
+import math
+import numpy as np
+from settings import CFG
+
+# Speed below which the simulation stops the ball (Ball.update / damp_balls threshold)
+STOP_SPEED = 0.1
+
+
+def default_step_dt() -> float:
+	"""Step length the simulation runs at: the fixed tick, or one frame in the variable-dt loop."""
+	if CFG.sim.get("fixed_step", False):
+		return 1.0 / max(1, int(CFG.sim.get("tick_rate", CFG.fps)))
+	return 1.0 / max(1, CFG.fps)
+
+
+class BallTrajectory:
+	"""Predicted path of one ball as straight segments between wall bounces.
+
+	Times inside the class are in steps from now (seconds / dt). Segment k
+	starts at step starts[k], runs along units[k] from origins[k] and anchors
+	its series at whole step anchors[k], whose speed is speeds[k]; it ends at
+	ends[k] (a bounce, the stop or the cut-off after max_bounces).
+
+	Args:
+		pos, vel: Current ball position and velocity
+		radius: Ball radius (walls stop the center at bounds +/- radius)
+		bounds: (left, top, right, bottom) of the play area
+		friction: Per-step velocity multiplier
+		max_speed: Speed cap applied at the end of each step
+		restitution: Speed kept at each wall bounce
+		dt: Simulation step length in seconds
+		max_bounces: Bounces followed before the path is cut off
+	"""
+
+	def __init__(self, pos, vel, radius: float, bounds, friction: float, max_speed: float, restitution: float, dt: float, max_bounces: int = 16):
+		self.dt = float(dt)
+		self.friction = float(friction)
+		lo = np.array(bounds[:2], dtype=float) + radius
+		hi = np.array(bounds[2:], dtype=float) - radius
+		p = np.array(pos, dtype=float)
+		v = np.array(vel, dtype=float)
+		speed = math.hypot(v[0], v[1])
+		u = v / speed if speed > 0 else np.zeros(2)
+
+		# Step 1: follow the path bounce by bounce
+		starts, anchors, origins, units, speeds, stops, ends = [], [], [], [], [], [], []
+		start, anchor, bounces = 0.0, 0, 0
+		while True:
+			stop = anchor + self._steps_to_stop(speed)
+			# damp_balls caps the speed at the end of the step; the series restarts there
+			cap = anchor + 1.0 if speed * self.friction > max_speed else math.inf
+			free = min(stop, cap)
+			offset = self._distance(speed, start - anchor)
+			length = self._distance(speed, free - anchor) - offset
+			# Distance to the first wall along the direction of travel
+			with np.errstate(divide="ignore", invalid="ignore"):
+				to_wall = np.where(u < 0, (lo - p) / u, np.where(u > 0, (hi - p) / u, np.inf))
+			to_wall = np.maximum(to_wall, 0.0)
+			wall = float(to_wall.min())
+			bounce = speed > 0 and wall < length
+			end = anchor + self._steps_to_cover(speed, offset + wall) if bounce else free
+			starts.append(start)
+			anchors.append(anchor)
+			origins.append(p)
+			units.append(u)
+			speeds.append(speed)
+			stops.append(stop)
+			ends.append(end)
+			if bounce and bounces < max_bounces:
+				# Step 2: reflect off the wall(s) hit; the rest of the bounce step runs at the reduced speed
+				p = p + u * wall
+				u = np.where(to_wall == wall, -u, u)
+				step = math.floor(end)
+				speed = speed * self.friction ** (step - anchor) * restitution
+				start, anchor = end, step
+				bounces += 1
+			elif not bounce and end == cap:
+				# Step 3: carry on in the same direction at the capped speed
+				p = p + u * length
+				speed = float(max_speed)
+				start, anchor = cap, int(cap)
+			else:
+				break
+		self.starts = np.array(starts)
+		self.anchors = np.array(anchors, dtype=float)
+		self.origins = np.array(origins)
+		self.units = np.array(units)
+		self.speeds = np.array(speeds)
+		self.stops = np.array(stops)
+		self.ends = np.array(ends)
+		# Distance from each anchor to the segment start, and the segment lengths
+		self.offsets = self._distance(self.speeds, self.starts - self.anchors)
+		self.lengths = self._distance(self.speeds, self.ends - self.anchors) - self.offsets
+
+	@classmethod
+	def of(cls, ball, restitution: float = None, dt: float = None) -> "BallTrajectory":
+		"""Trajectory of a Ball entity inside its play_rect."""
+		rect = ball.play_rect
+		return cls(
+			tuple(ball.pos), tuple(ball.vel), ball.radius, (rect.left, rect.top, rect.right, rect.bottom),
+			ball.friction, ball.max_speed,
+			float(CFG.ball.get("restitution", 0.98)) if restitution is None else restitution,
+			default_step_dt() if dt is None else dt,
+		)
+
+	@staticmethod
+	def _whole(x):
+		"""Whole steps in x, robust to x landing a hair below a step boundary."""
+		return np.floor(np.asarray(x) + 1e-9)
+
+	def _distance(self, speed, x):
+		"""Distance covered in x steps from a whole step at speed (equation 1); works on arrays."""
+		if self.friction == 1.0:
+			return speed * self.dt * x
+		n = self._whole(x)
+		decay = self.friction ** n
+		return speed * self.dt * ((1.0 - decay) / (1.0 - self.friction) + decay * (x - n))
+
+	def _steps_to_cover(self, speed: float, distance: float) -> float:
+		"""Steps from a whole step at speed until distance is covered (equation 2)."""
+		if self.friction == 1.0:
+			return distance / (speed * self.dt)
+		f = self.friction
+		n = math.floor(math.log(max(1.0 - distance * (1.0 - f) / (speed * self.dt), 1e-300)) / math.log(f))
+		# The log can land one step off near a boundary; settle on the step holding distance
+		whole = lambda k: speed * self.dt * (1.0 - f ** k) / (1.0 - f)
+		while n > 0 and whole(n) > distance:
+			n -= 1
+		while whole(n + 1) <= distance:
+			n += 1
+		return n + (distance - whole(n)) / (speed * f ** n * self.dt)
+
+	def _steps_to_stop(self, speed: float) -> float:
+		"""Whole steps until the ball stops (equation 3); inf without friction."""
+		if speed <= 0.0:
+			return 0.0
+		if self.friction >= 1.0:
+			return math.inf
+		n = max(1, math.ceil(math.log(STOP_SPEED / speed) / math.log(self.friction)))
+		# Match damp_balls' strict threshold exactly, whatever the log rounded to
+		while n > 1 and speed * self.friction ** (n - 1) < STOP_SPEED:
+			n -= 1
+		while speed * self.friction ** n >= STOP_SPEED:
+			n += 1
+		return float(n)
+
+	@property
+	def stop_time(self) -> float:
+		"""Seconds until the ball comes to rest (inf if the path was cut off first)."""
+		return self.ends[-1] * self.dt if self.ends[-1] == self.stops[-1] else math.inf
+
+	def _locate(self, times) -> tuple:
+		"""Segment index and steps from its anchor (clamped to the segment) for each time."""
+		x = np.maximum(np.asarray(times, dtype=float) / self.dt, 0.0)
+		k = np.searchsorted(self.starts, x, side="right") - 1
+		return k, np.minimum(x, self.ends[k]) - self.anchors[k]
+
+	def positions(self, times) -> np.ndarray:
+		"""Predicted centers at each time in seconds from now; shape times.shape + (2,)."""
+		k, x = self._locate(times)
+		return self.origins[k] + self.units[k] * (self._distance(self.speeds[k], x) - self.offsets[k])[..., None]
+
+	def velocities(self, times) -> np.ndarray:
+		"""Predicted velocities at each time in seconds from now."""
+		k, x = self._locate(times)
+		n = self._whole(x)
+		speed = np.where(n + self.anchors[k] >= self.stops[k], 0.0, self.speeds[k] * self.friction ** n)
+		return self.units[k] * speed[..., None]
+
+	def position(self, t: float) -> tuple:
+		"""Predicted center after t seconds as an (x, y) tuple."""
+		x, y = self.positions(t).tolist()
+		return (x, y)
+
+	def time_to_reach(self, point, tolerance: float = 0.0) -> float:
+		"""Seconds until the ball center first comes within tolerance of point (inf if never)."""
+		d = np.asarray(point, dtype=float) - self.origins
+		along = np.add.reduce(d * self.units, axis=-1)
+		perp2 = np.add.reduce(d * d, axis=-1) - along * along
+		reach = np.sqrt(np.maximum(tolerance * tolerance - perp2, 0.0))
+		enter = np.maximum(along - reach, 0.0)
+		# Stationary segments only "reach" a point they already sit on
+		hit = (perp2 <= tolerance * tolerance) & (enter <= self.lengths) & (along + reach >= 0.0)
+		hit |= (self.speeds == 0) & (np.add.reduce(d * d, axis=-1) <= tolerance * tolerance)
+		return self._first_time(hit, enter)
+
+	def time_to_line(self, axis: int, value: float) -> float:
+		"""Seconds until the ball center first crosses x = value (axis 0) or y = value (axis 1)."""
+		u = self.units[:, axis]
+		with np.errstate(divide="ignore", invalid="ignore"):
+			s = (value - self.origins[:, axis]) / u
+		hit = (u != 0) & (s >= 0.0) & (s <= self.lengths)
+		hit |= self.origins[:, axis] == value
+		return self._first_time(hit, np.where(hit, s, 0.0))
+
+	def _first_time(self, hit: np.ndarray, distance: np.ndarray) -> float:
+		"""Time of the first segment flagged in hit, distance along it."""
+		if not hit.any():
+			return math.inf
+		k = int(np.argmax(hit))
+		if self.speeds[k] == 0 or distance[k] <= 0.0:
+			return self.starts[k] * self.dt
+		return (self.anchors[k] + self._steps_to_cover(float(self.speeds[k]), float(self.offsets[k] + distance[k]))) * self.dt
@@ -0,0 +1,184 @@
+"""Continuous (swept) collision detection for balls.
+
+Instead of moving the ball a whole step and then fixing overlaps, each ball is
+advanced to its earliest time of impact (TOI) against the walls or a player,
+the contact is resolved, and the rest of the step continues from there, so
+fast balls cannot tunnel through players or walls at any frame rate. Players
+are treated as moving in a straight line from their position at the start of
+the step (player_prev) to their current position. Goal sensors are tested
+against every segment the ball center travels.
+
+All arrays may carry one ball per match (balls (M, 2), players (M, P, 2)) or
+share one roster between the balls of a world (players (P, 2)).
+
+TIME OF IMPACT EQUATIONS:
+
+1. Walls (per axis, ball center confined to [min + r, max - r]):
+   t = (wall - r - x) / vx   for the wall the ball is moving towards
+
+2. Moving circles (relative offset d, relative velocity u, radius sum R):
+   |d + u t|² = R²  ->  (u·u) t² + 2 (d·u) t + (d·d - R²) = 0
+   t = (-(d·u) - sqrt((d·u)² - (u·u)(d·d - R²))) / (u·u)
+   Only approaching pairs (d·u < 0) collide; overlapping pairs collide at t = 0.
+
+3. Goal sensors (slab test of the segment p0 -> p1 against the rectangle)
+"""
+
+import numpy as np
+
+GOAL_NONE, GOAL_LEFT, GOAL_RIGHT = 0, 1, 2
+# Contacts resolved per ball and step before it finishes the step untouched
+MAX_EVENTS = 8
+
+
+def segment_in_rect(p0: np.ndarray, p1: np.ndarray, rect: tuple) -> np.ndarray:
+	"""Whether each segment p0 -> p1 (shape (..., 2)) touches rect (left, top, right, bottom)."""
+	lo = np.array(rect[:2], dtype=float)
+	hi = np.array(rect[2:], dtype=float)
+	d = p1 - p0
+	moving = d != 0
+	# A coordinate that does not change must already lie inside its slab
+	inside = (p0 >= lo) & (p0 < hi)
+	t0 = np.divide(lo - p0, d, out=np.zeros_like(d), where=moving)
+	t1 = np.divide(hi - p0, d, out=np.zeros_like(d), where=moving)
+	t_in = np.where(moving, np.minimum(t0, t1), np.where(inside, -np.inf, np.inf))
+	t_out = np.where(moving, np.maximum(t0, t1), np.where(inside, np.inf, -np.inf))
+	enter = t_in.max(axis=-1)
+	leave = t_out.min(axis=-1)
+	return (enter <= leave) & (enter <= 1.0) & (leave >= 0.0)
+
+
+def _per_ball(arr: np.ndarray, m: int, shared: bool) -> np.ndarray:
+	"""Give a roster array shared by all m balls a leading per-ball axis (a view)."""
+	if not shared:
+		return arr
+	return arr[None] if m == 1 else np.broadcast_to(arr, (m,) + arr.shape)
+
+
+def sweep_balls(ball_pos, ball_vel, ball_radius, player_pos, player_prev, player_vel, player_radius, bounds, goals, restitution: float, dt: float, max_events: int = MAX_EVENTS) -> tuple:
+	"""Advance balls by dt, resolving wall and player contacts in time order, in place.
+
+	Contact responses match the discrete versions: walls reflect the normal
+	component and apply restitution; players push the ball out along the
+	normal, reflect it, apply restitution and add 25% of the player's
+	velocity; a player still faster than the ball then carries it along the
+	normal. A player only hits the ball while they approach each other.
+	After max_events contacts the ball finishes the step without further
+	contacts (a ball pinned between a player and a wall).
+
+	Args:
+		ball_pos, ball_vel: Shaped (M, 2)
+		ball_radius: Shaped (M,)
+		player_pos, player_prev, player_vel: Shaped (P, 2) or (M, P, 2)
+		player_radius: Shaped (P,) or (M, P)
+		bounds: (left, top, right, bottom) of the play area
+		goals: (left_goal, right_goal) rectangles as (left, top, right, bottom)
+		restitution: Speed kept after each bounce
+		dt: Step length in seconds
+
+	Returns:
+		(hits, bounced, goal): (M, P) player hit matrix, (M,) wall bounce mask
+		and (M,) GOAL_* code of the first goal sensor each ball entered.
+	"""
+	m = ball_pos.shape[0]
+	# Step 1: player motion over the step and per-pair radius sums, one roster row per ball
+	shared = player_pos.ndim == 2
+	prev = _per_ball(player_prev, m, shared)
+	w = (_per_ball(player_pos, m, shared) - prev) / dt
+	pv = _per_ball(player_vel, m, shared)
+	r_sum = ball_radius[:, None] + _per_ball(player_radius, m, shared)
+	r = ball_radius[:, None]
+	lo = np.array(bounds[:2], dtype=float) + r
+	hi = np.array(bounds[2:], dtype=float) - r
+	# Goal sensors can only be reached by segments that get past these x coordinates
+	goal_x = (goals[0][2], goals[1][0])
+
+	pos = ball_pos.copy()
+	vel = ball_vel.copy()
+	t = np.zeros(m)
+	hits = np.zeros(r_sum.shape, dtype=bool)
+	bounced = np.zeros(m, dtype=bool)
+	goal = np.zeros(m, dtype=np.int8)
+	rows = np.arange(m)
+	for event_no in range(max_events + 1):
+		rem = dt - t
+		live = rem > 0
+		if not live.any():
+			break
+		final = event_no == max_events
+
+		# Step 2: earliest wall impact per axis
+		wall_at = np.where(vel < 0, lo, hi)
+		s_axis = np.maximum(np.divide(wall_at - pos, vel, out=np.full_like(vel, np.inf), where=vel != 0), 0.0)
+		s_wall = s_axis.min(axis=-1)
+
+		# Step 3: earliest player impact (moving circle vs moving circle)
+		q = prev + w * t[:, None, None]
+		d = pos[:, None, :] - q
+		u = vel[:, None, :] - w
+		a = np.add.reduce(u * u, axis=-1)
+		b = np.add.reduce(d * u, axis=-1)
+		c = np.add.reduce(d * d, axis=-1) - r_sum * r_sum
+		disc = b * b - a * c
+		closing = (b < 0) & (disc >= 0) & (a > 0)
+		s_pair = np.full(c.shape, np.inf)
+		if closing.any():
+			s_pair[closing] = np.maximum((-b[closing] - np.sqrt(disc[closing])) / a[closing], 0.0)
+		s_pair[c <= 0] = 0.0
+		if s_pair.shape[-1]:
+			j = s_pair.argmin(axis=-1)
+			s_player = s_pair[rows, j]
+		else:
+			j = np.zeros(m, dtype=int)
+			s_player = np.full(m, np.inf)
+
+		# Step 4: advance to the first event (or the end of the step)
+		s = np.minimum(s_wall, s_player)
+		event = live & (s <= rem) & (not final)
+		step = np.where(event, s, np.where(live, rem, 0.0))
+		new = pos + vel * step[:, None]
+		open_goal = live & (goal == GOAL_NONE)
+		open_goal &= (np.minimum(pos[:, 0], new[:, 0]) < goal_x[0]) | (np.maximum(pos[:, 0], new[:, 0]) >= goal_x[1])
+		if open_goal.any():
+			goal[open_goal & segment_in_rect(pos, new, goals[0])] = GOAL_LEFT
+			goal[open_goal & (goal == GOAL_NONE) & segment_in_rect(pos, new, goals[1])] = GOAL_RIGHT
+		pos = new
+		t = np.where(event, t + s, np.where(live, dt, t))
+		if not event.any():
+			continue
+
+		# Step 5: wall contacts (players win ties)
+		wall = event & (s_wall < s_player)
+		if wall.any():
+			axes = wall[:, None] & (s_axis == s_wall[:, None])
+			pos = np.where(axes, wall_at, pos)
+			vel = np.where(axes, -vel, vel)
+			vel[wall] *= restitution
+			bounced |= wall
+
+		# Step 6: player contacts, resolved like ball_player_collision()
+		hit_rows = np.flatnonzero(event & ~wall)
+		if hit_rows.size:
+			jj = j[hit_rows]
+			qj = q[hit_rows, jj] + w[hit_rows, jj] * s[hit_rows, None]
+			delta = pos[hit_rows] - qj
+			dist = np.sqrt(np.add.reduce(delta * delta, axis=-1))
+			n = np.where((dist == 0)[:, None], np.array([1.0, 0.0]), delta / np.where(dist == 0, 1.0, dist)[:, None])
+			pos[hit_rows] = qj + n * (r_sum[hit_rows, jj] + 0.01)[:, None]
+			v = vel[hit_rows]
+			approaching = np.add.reduce((v - w[hit_rows, jj]) * n, axis=-1) < 0
+			prev_speed = np.sqrt(np.add.reduce(v * v, axis=-1))
+			out = v - 2.0 * np.add.reduce(v * n, axis=-1)[:, None] * n
+			new_speed = np.sqrt(np.add.reduce(out * out, axis=-1))
+			moving = (prev_speed > 0) & (new_speed > 0)
+			out = np.where(moving[:, None], out * (prev_speed * restitution / np.where(moving, new_speed, 1.0))[:, None], out)
+			out = out + pv[hit_rows, jj] * 0.25
+			# A player faster than the ball carries it along the normal instead of re-hitting it
+			catch_up = np.minimum(np.add.reduce((out - w[hit_rows, jj]) * n, axis=-1), 0.0)
+			out = out - catch_up[:, None] * n
+			vel[hit_rows] = np.where(approaching[:, None], out, v)
+			hits[hit_rows[approaching], jj[approaching]] = True
+
+	ball_pos[...] = pos
+	ball_vel[...] = vel
+	return hits, bounced, goal
@@ -0,0 +1,439 @@
+"""Struct-of-arrays physics world for players and balls.
+
+Positions, velocities and tuning constants of every body live in contiguous
+NumPy arrays. Player movement, ball integration, swept ball contacts and
+possession are resolved for all bodies with a few batched operations instead
+of per-object Python loops. Each step measures ball-player distances once, in
+a single proximity stage (Contacts) that kicks, the ball sweep, hit counters,
+possession and the AI all read, and a spatial hash broadphase limits that
+stage and the AI neighbor queries to nearby players. Player and Ball objects
+are thin views that read and write their row of these arrays.
+
+The module-level kernels operate on arrays with arbitrary leading dimensions,
+so the same math serves one match (players shaped (P, 2)) or many matches
+stepped in lockstep (players shaped (N, P, 2))."""
+
+import numpy as np
+import pygame
+from physics.sweep import sweep_balls, MAX_EVENTS
+from physics.broadphase import SpatialHash
+
+
+def cap_speed(vel: np.ndarray, max_speed) -> np.ndarray:
+	"""Scale velocities whose magnitude exceeds max_speed back onto it.
+
+	SPEED LIMITING (vectorized scale_to_length):
+	   if |v| > max_speed: v = v * (max_speed / |v|)
+	"""
+	spd = np.sqrt(np.add.reduce(vel * vel, axis=-1))
+	over = spd > max_speed
+	if not over.any():
+		return vel
+	return vel * np.where(over, max_speed / np.where(over, spd, 1.0), 1.0)[..., None]
+
+
+def integrate_players(pos, vel, dirs, radius, accel, drag, max_speed, dt: float, bounds) -> tuple:
+	"""Batched Player.move: accelerate, drag, cap speed, integrate and clamp to bounds.
+
+	Args:
+		pos, vel, dirs: Arrays shaped (..., 2); dirs need not be normalized
+		radius, accel, drag, max_speed: Per-body arrays shaped (...)
+		dt: Step length in seconds
+		bounds: (left, top, right, bottom) of the play area
+
+	Returns:
+		New (pos, vel) arrays.
+	"""
+	# Steps 1-2: normalize input and accelerate (zero input adds nothing)
+	length = np.sqrt(np.add.reduce(dirs * dirs, axis=-1))
+	gain = accel * dt / np.where(length > 0, length, np.inf)
+	# Step 3: drag, Step 4: speed cap
+	vel = cap_speed((vel + dirs * gain[..., None]) * drag[..., None], max_speed)
+	# Step 5: integrate position
+	pos = pos + vel * dt
+	# Step 6: clamp inside the pitch
+	left, top, right, bottom = bounds
+	r = radius[..., None]
+	pos = np.maximum(r + (left, top), np.minimum((right, bottom) - r, pos))
+	return pos, vel
+
+
+def integrate_balls(pos, vel, friction, max_speed, dt: float) -> tuple:
+	"""Batched Ball.update: integrate, apply friction, stop crawling balls and cap speed."""
+	return pos + vel * dt, damp_balls(vel, friction, max_speed)
+
+
+def damp_balls(vel, friction, max_speed) -> np.ndarray:
+	"""Per-step friction, stop threshold and speed cap on ball velocities; returns new velocities."""
+	vel = vel * friction[..., None]
+	slow = np.add.reduce(vel * vel, axis=-1) < 1e-2
+	if slow.any():
+		vel = np.where(slow[..., None], 0.0, vel)
+	return cap_speed(vel, max_speed)
+
+
+class Contacts:
+	"""Single-pass ball-player proximity: offsets, distances and contact flags of one step.
+
+	The offset and squared distance from every ball to every candidate player
+	is computed once per step; kicks, the ball sweep, hit counters, possession
+	and the AI all read this list instead of measuring again.
+
+	Flags (shaped like d2, one column per player):
+	   kick:       |ball - player| <= ball_radius + player_radius + kick_tolerance
+	   possession: |ball - player| <= ball_radius + player_radius + possession_margin
+	   hit:        the ball sweep struck the player during the step
+
+	Balls are shaped (M, 2); players either (P, 2) (shared by all balls) or
+	(M, P, 2) (one roster per match). rows maps columns to world rows (a
+	slice or sorted array) when the players were a broadphase selection.
+	"""
+
+	def __init__(self, ball_pos, ball_radius, player_pos, player_radius, rows=None, kick_tolerance: float = 2.0, possession_margin: float = 8.0):
+		self.rows = rows
+		self.shared = player_radius.ndim == 1
+		self.delta = ball_pos[..., None, :] - player_pos
+		self.d2 = np.add.reduce(self.delta * self.delta, axis=-1)
+		touch = ball_radius[..., None] + player_radius
+		self.kick = self.d2 <= (touch + kick_tolerance) ** 2
+		self.possession = self.d2 <= (touch + possession_margin) ** 2
+		self.hit = np.zeros(self.d2.shape, dtype=bool)
+
+	def columns(self, index: slice):
+		"""Column selector for the players in the world-row slice index."""
+		if self.rows is None or isinstance(self.rows, slice):
+			return index
+		return np.flatnonzero((self.rows >= index.start) & (self.rows < index.stop))
+
+	def within(self, reach) -> np.ndarray:
+		"""Mask of columns within reach (one value per ball) of any ball."""
+		near = self.d2 <= np.square(reach)[..., None]
+		return near.any(axis=0) if self.shared else near
+
+	def has_ball(self) -> np.ndarray:
+		"""Possession per player column (reduced over balls for a shared roster)."""
+		return self.possession.any(axis=0) if self.shared else self.possession
+
+	def apply_kicks(self, ball_vel, ball_max_speed, balls=slice(None), columns=slice(None), strength: float = 220.0) -> np.ndarray:
+		"""Batched Player.kick: kick-reach players in columns push the selected balls away, in place.
+
+		Impulses are applied in column (roster) order with the speed cap after
+		each, like repeated Ball.apply_force() calls; coinciding centers kick
+		towards +x. Returns the kick mask of the selected balls and columns.
+		"""
+		kicked = self.kick[balls][..., columns]
+		if not kicked.any():
+			return kicked
+		delta = self.delta[balls][..., columns, :]
+		d2 = self.d2[balls][..., columns]
+		vel = ball_vel[balls]
+		max_speed = ball_max_speed[balls]
+		for j in np.flatnonzero(kicked.reshape(-1, kicked.shape[-1]).any(axis=0)):
+			sel = kicked[..., j]
+			d = delta[..., j, :][sel]
+			dist2 = d2[..., j][sel]
+			n = np.where((dist2 > 0)[:, None], d / np.sqrt(np.where(dist2 > 0, dist2, 1.0))[:, None], np.array([1.0, 0.0]))
+			vel[sel] = cap_speed(vel[sel] + n * strength, max_speed[sel])
+		ball_vel[balls] = vel
+		return kicked
+
+
+def clamp_balls_with_walls(ball_pos, ball_vel, ball_radius, bounds, restitution: float) -> np.ndarray:
+	"""Batched clamp_ball_with_walls: clamp balls inside bounds and reflect, in place.
+
+	Each axis is clamped to [min + r, max - r]; the matching velocity
+	component is negated and bounced balls lose (1 - restitution) of their
+	speed. Returns a boolean mask of balls that bounced.
+	"""
+	left, top, right, bottom = bounds
+	bounced = np.zeros(ball_radius.shape, dtype=bool)
+	for axis, lo, hi in ((0, left, right), (1, top, bottom)):
+		c = ball_pos[..., axis]
+		low = c - ball_radius < lo
+		high = ~low & (c + ball_radius > hi)
+		hit = low | high
+		if hit.any():
+			ball_pos[..., axis] = np.where(low, lo + ball_radius, np.where(high, hi - ball_radius, c))
+			ball_vel[..., axis] = np.where(hit, -ball_vel[..., axis], ball_vel[..., axis])
+			bounced |= hit
+	if bounced.any():
+		ball_vel[bounced] *= restitution
+	return bounced
+
+
+def rect_bounds(rect: pygame.Rect) -> tuple:
+	"""(left, top, right, bottom) of a Rect, the bounds format the kernels take."""
+	return (rect.left, rect.top, rect.right, rect.bottom)
+
+
+class PhysicsWorld:
+	"""Contiguous per-body arrays for all players and balls of one match."""
+
+	PLAYER_FIELDS = ("player_pos", "player_prev", "player_vel", "player_radius", "player_accel", "player_max_speed", "player_drag", "player_has_ball")
+	BALL_FIELDS = ("ball_pos", "ball_prev", "ball_vel", "ball_radius", "ball_friction", "ball_max_speed")
+
+	def __init__(self, player_capacity: int = 10, ball_capacity: int = 1):
+		"""Allocate storage; capacities grow automatically when exceeded."""
+		self.num_players = 0
+		self.num_balls = 0
+		self._alloc_players(max(1, player_capacity))
+		self._alloc_balls(max(1, ball_capacity))
+		self.grid = SpatialHash()
+		self.grid_stale = True
+
+	@classmethod
+	def bound_to(cls, arrays: dict) -> "PhysicsWorld":
+		"""Create a world whose storage is existing arrays (e.g. one match's slice of a batch).
+
+		arrays must provide every name in PLAYER_FIELDS and BALL_FIELDS. Bound
+		worlds cannot grow, so their capacity is the length of those arrays.
+		"""
+		world = cls.__new__(cls)
+		world.num_players = 0
+		world.num_balls = 0
+		for name in cls.PLAYER_FIELDS + cls.BALL_FIELDS:
+			setattr(world, name, arrays[name])
+		world.grid = SpatialHash()
+		world.grid_stale = True
+		return world
+
+	def _alloc_players(self, capacity: int) -> None:
+		"""(Re)allocate player arrays, keeping existing rows."""
+		old = getattr(self, "player_pos", None)
+		n = self.num_players
+		fields = {
+			"player_pos": (capacity, 2), "player_prev": (capacity, 2), "player_vel": (capacity, 2),
+			"player_radius": (capacity,), "player_accel": (capacity,), "player_max_speed": (capacity,),
+			"player_drag": (capacity,),
+		}
+		for name, shape in fields.items():
+			arr = np.zeros(shape)
+			if old is not None:
+				arr[:n] = getattr(self, name)[:n]
+			setattr(self, name, arr)
+		has_ball = np.zeros(capacity, dtype=bool)
+		if old is not None:
+			has_ball[:n] = self.player_has_ball[:n]
+		self.player_has_ball = has_ball
+
+	def _alloc_balls(self, capacity: int) -> None:
+		"""(Re)allocate ball arrays, keeping existing rows."""
+		old = getattr(self, "ball_pos", None)
+		n = self.num_balls
+		fields = {
+			"ball_pos": (capacity, 2), "ball_prev": (capacity, 2), "ball_vel": (capacity, 2),
+			"ball_radius": (capacity,), "ball_friction": (capacity,), "ball_max_speed": (capacity,),
+		}
+		for name, shape in fields.items():
+			arr = np.zeros(shape)
+			if old is not None:
+				arr[:n] = getattr(self, name)[:n]
+			setattr(self, name, arr)
+
+	@property
+	def players(self) -> slice:
+		"""Slice selecting every live player row."""
+		return slice(0, self.num_players)
+
+	@property
+	def balls(self) -> slice:
+		"""Slice selecting every live ball row."""
+		return slice(0, self.num_balls)
+
+	def add_player(self, pos, radius: float, accel: float, max_speed: float, drag: float) -> int:
+		"""Append a player body and return its row index."""
+		if self.num_players == len(self.player_pos):
+			# Grows by reallocation; bound worlds are sized exactly and never get here
+			self._alloc_players(len(self.player_pos) * 2)
+		i = self.num_players
+		self.num_players += 1
+		self.reset_players(i, pos, radius, accel, max_speed, drag)
+		return i
+
+	def reset_players(self, i, pos, radius: float, accel: float, max_speed: float, drag: float) -> None:
+		"""Put player row(s) i (an index or a slice) at rest at pos with fresh tuning, in place.
+
+		pos is one (x, y) per row; used at kickoff so teams keep their rows.
+		"""
+		self.player_pos[i] = pos
+		self.player_prev[i] = pos
+		self.player_vel[i] = (0.0, 0.0)
+		self.player_radius[i] = radius
+		self.player_accel[i] = accel
+		self.player_max_speed[i] = max_speed
+		self.player_drag[i] = drag
+		self.player_has_ball[i] = False
+		self.grid_stale = True
+
+	def clear_players(self) -> None:
+		"""Drop all player rows (before teams are built from scratch)."""
+		self.num_players = 0
+		self.grid_stale = True
+
+	def mark_players_moved(self) -> None:
+		"""Note that player positions were written directly, so the broadphase re-buckets before its next query."""
+		self.grid_stale = True
+
+	def refresh_broadphase(self) -> None:
+		"""Incrementally re-bucket players in the spatial hash if any moved since the last query."""
+		if self.grid_stale:
+			self.grid.update(self.player_pos[self.players])
+			self.grid_stale = False
+
+	def add_ball(self, pos, radius: float, friction: float, max_speed: float) -> int:
+		"""Append a ball body and return its row index."""
+		if self.num_balls == len(self.ball_pos):
+			self._alloc_balls(len(self.ball_pos) * 2)
+		i = self.num_balls
+		self.ball_pos[i] = pos
+		self.ball_prev[i] = pos
+		self.ball_vel[i] = (0.0, 0.0)
+		self.ball_radius[i] = radius
+		self.ball_friction[i] = friction
+		self.ball_max_speed[i] = max_speed
+		self.num_balls += 1
+		return i
+
+	def snapshot(self) -> None:
+		"""Copy current positions into the previous-step buffers (render interpolation)."""
+		self.player_prev[self.players] = self.player_pos[self.players]
+		self.ball_prev[self.balls] = self.ball_pos[self.balls]
+
+	def move_players(self, index, dirs, dt: float, rect: pygame.Rect) -> None:
+		"""Move the selected players (slice or index array) along their input directions."""
+		pos, vel = integrate_players(
+			self.player_pos[index], self.player_vel[index], np.asarray(dirs, dtype=float),
+			self.player_radius[index], self.player_accel[index], self.player_drag[index],
+			self.player_max_speed[index], dt, (rect.left, rect.top, rect.right, rect.bottom),
+		)
+		self.player_pos[index] = pos
+		self.player_vel[index] = vel
+		self.grid_stale = True
+
+	def integrate_balls(self, dt: float, index=None) -> None:
+		"""Advance the selected balls (all by default) by dt."""
+		index = self.balls if index is None else index
+		pos, vel = integrate_balls(self.ball_pos[index], self.ball_vel[index], self.ball_friction[index], self.ball_max_speed[index], dt)
+		self.ball_pos[index] = pos
+		self.ball_vel[index] = vel
+
+	def candidates(self, centers: np.ndarray, reach) -> object:
+		"""Broadphase: player rows that may lie within reach of any of the centers.
+
+		The grid is refreshed first if players moved, so queries always see the
+		current positions. Returns the players slice when nothing was culled,
+		otherwise a sorted row array (roster order is preserved either way).
+		"""
+		self.refresh_broadphase()
+		if self.grid.cells is None:
+			return self.players
+		reach = np.ravel(reach)
+		if len(centers) == 1:
+			rows = self.grid.query(centers[0] - reach[0], centers[0] + reach[-1])
+		else:
+			rows = np.unique(np.concatenate([self.grid.query(c - r, c + r) for c, r in zip(centers, np.broadcast_to(reach, len(centers)))]))
+		return self.players if len(rows) == self.num_players else rows
+
+	def _max_player_radius(self) -> float:
+		"""Largest live player radius (pads broadphase reach)."""
+		return float(self.player_radius[self.players].max(initial=0.0))
+
+	def _sweep_reach(self, dt: float, speed) -> np.ndarray:
+		"""Per-ball distance within which a player can be hit during a step of dt at the given ball speed.
+
+		Covers how far a ball can travel in the step (each contact can add at
+		most the player's speed plus a quarter of its velocity), how far any
+		player moved since snapshot() and the contact distance.
+		"""
+		p = self.players
+		moved = self.player_pos[p] - self.player_prev[p]
+		disp = np.sqrt(np.add.reduce(moved * moved, axis=-1)).max(initial=0.0)
+		vel = self.player_vel[p]
+		boost = 1.25 * np.sqrt(np.add.reduce(vel * vel, axis=-1)).max(initial=0.0) + (disp / dt if dt > 0 else 0.0)
+		return (speed + MAX_EVENTS * boost) * dt + disp + self.ball_radius[self.balls] + self._max_player_radius()
+
+	def find_contacts(self, dt: float = 0.0, kick_tolerance: float = 2.0, possession_margin: float = 8.0) -> Contacts:
+		"""Proximity stage of one step: a Contacts list for every ball and nearby player.
+
+		Call it once players have moved. Kicks only change ball velocities
+		(within max_speed), so the candidates gathered here also cover every
+		player the ball sweep of a step of dt can reach.
+		"""
+		b = self.balls
+		pad = self.ball_radius[b] + self._max_player_radius() + max(kick_tolerance, possession_margin)
+		rows = self.candidates(self.ball_pos[b], np.maximum(pad, self._sweep_reach(dt, self.ball_max_speed[b])))
+		return Contacts(self.ball_pos[b], self.ball_radius[b], self.player_pos[rows], self.player_radius[rows], rows, kick_tolerance, possession_margin)
+
+	def sweep_balls(self, dt: float, rect: pygame.Rect, goals: tuple, restitution: float, contacts: Contacts = None) -> tuple:
+		"""Move every ball through the step with swept wall, player and goal contacts, then apply friction.
+
+		Players move from player_prev to player_pos over the step, so call
+		snapshot() before moving them. Only players of the step's contact list
+		within reach of the ball are swept; hits are recorded in contacts.hit.
+		Returns sweep_balls()'s (bounced, goal).
+		"""
+		b = self.balls
+		if contacts is None:
+			contacts = self.find_contacts(dt)
+		ball_pos = self.ball_pos[b]
+		speed = np.sqrt(np.add.reduce(self.ball_vel[b] * self.ball_vel[b], axis=-1))
+		cols = np.flatnonzero(contacts.within(self._sweep_reach(dt, speed)))
+		rows = np.arange(self.num_players)[contacts.rows][cols]
+		hits, bounced, goal = sweep_balls(
+			ball_pos, self.ball_vel[b], self.ball_radius[b],
+			self.player_pos[rows], self.player_prev[rows], self.player_vel[rows], self.player_radius[rows],
+			rect_bounds(rect), tuple(rect_bounds(g) for g in goals), restitution, dt,
+		)
+		self.ball_pos[b] = ball_pos
+		self.ball_vel[b] = damp_balls(self.ball_vel[b], self.ball_friction[b], self.ball_max_speed[b])
+		contacts.hit[:, cols] = hits
+		return bounced, goal
+
+	def kick_ball(self, ball: int, index: slice, strength: float = 220.0, tolerance: float = 2.0, contacts: Contacts = None) -> np.ndarray:
+		"""Let the players in the index slice kick one ball; returns their kick mask.
+
+		Reuses the step's contact list when given, so repeated kicks within a
+		step (manual plus automatic) measure distances only once.
+		"""
+		if contacts is None:
+			contacts = self.find_contacts(kick_tolerance=tolerance)
+		cols = contacts.columns(index)
+		b = self.balls
+		kicked = contacts.apply_kicks(self.ball_vel[b], self.ball_max_speed[b], slice(ball, ball + 1), cols, strength)[0]
+		if isinstance(cols, slice):
+			return kicked
+		mask = np.zeros(index.stop - index.start, dtype=bool)
+		mask[contacts.rows[cols] - index.start] = kicked
+		return mask
+
+	def set_possession(self, contacts: Contacts) -> None:
+		"""Copy the contact list's possession flags into player_has_ball (read by Player.has_ball)."""
+		if not isinstance(contacts.rows, slice):
+			self.player_has_ball[self.players] = False
+		self.player_has_ball[contacts.rows] = contacts.has_ball()
+
+	def nearest_players(self, point, rows, k: int) -> list:
+		"""Up to k of the given player rows ordered by distance to point (ties keep row order).
+
+		The search box grows until k rows are inside its inscribed circle, so
+		only nearby cells are scanned on large rosters.
+		"""
+		point = np.asarray(point, dtype=float)
+		rows = np.asarray(rows, dtype=np.intp)
+		self.refresh_broadphase()
+		r = self.grid.cell_size
+		while True:
+			found = self.grid.query(point - r, point + r)
+			found = found[np.isin(found, rows)]
+			d = self.player_pos[found] - point
+			d2 = np.add.reduce(d * d, axis=-1)
+			if len(found) == len(rows) or np.count_nonzero(d2 <= r * r) >= k:
+				break
+			r *= 2
+		order = np.lexsort((found, d2))[:k]
+		return found[order].tolist()
+
+	def clamp_balls(self, rect: pygame.Rect, restitution: float) -> np.ndarray:
+		"""Keep every ball inside rect, bouncing off its walls; returns the bounce mask."""
+		b = self.balls
+		return clamp_balls_with_walls(self.ball_pos[b], self.ball_vel[b], self.ball_radius[b], rect_bounds(rect), restitution)
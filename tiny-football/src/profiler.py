@@ -0,0 +1,119 @@
+"""Per-phase frame profiler with ring buffers and percentile summaries.
+
+Game.run_frame calls lap(phase) after each phase (event pump, input, AI,
+physics, each draw call, flip): the time since the previous lap is added to
+that phase for the current frame, and end_frame() stores the frame's totals in
+fixed-size ring buffers. Phases that run several times per frame (one fixed
+step per tick) accumulate. While disabled every call returns right away, so
+the instrumentation costs a few attribute lookups per frame.
+"""
+
+import json
+import os
+import time
+import numpy as np
+
+# Display order of the phases recorded by Game (unknown phases follow)
+PHASES = (
+	"events", "wait", "input", "physics", "ai", "dispatch",
+	"draw_pitch", "draw_ball", "draw_players", "draw_ai", "draw_hud", "draw_overlay", "flip",
+)
+
+
+class FrameProfiler:
+	"""Frame phase timings over the last `capacity` frames.
+
+	Args:
+		capacity: Frames kept per phase (ring buffer length)
+		enabled: Start recording immediately
+	"""
+
+	def __init__(self, capacity: int = 600, enabled: bool = False):
+		self.capacity = max(1, int(capacity))
+		self.enabled = enabled
+		self.samples = {}  # phase -> ring buffer of per-frame seconds
+		self.frame = {}  # phase -> seconds accumulated in the current frame
+		self.frames = 0  # frames recorded since the last reset
+		self._last = time.perf_counter()
+
+	def toggle(self) -> bool:
+		"""Start or stop recording; returns the new state."""
+		self.enabled = not self.enabled
+		self.frame.clear()
+		self._last = time.perf_counter()
+		return self.enabled
+
+	def reset(self) -> None:
+		"""Forget every recorded frame."""
+		self.samples.clear()
+		self.frame.clear()
+		self.frames = 0
+
+	def begin_frame(self) -> None:
+		"""Start timing a new frame."""
+		if not self.enabled:
+			return
+		self.frame.clear()
+		self._last = time.perf_counter()
+
+	def lap(self, phase: str) -> None:
+		"""Charge the time since the previous lap to phase."""
+		if not self.enabled:
+			return
+		now = time.perf_counter()
+		self.frame[phase] = self.frame.get(phase, 0.0) + (now - self._last)
+		self._last = now
+
+	def end_frame(self) -> None:
+		"""Store the current frame's phase totals in the ring buffers."""
+		if not self.enabled:
+			return
+		slot = self.frames % self.capacity
+		for phase, seconds in self.frame.items():
+			ring = self.samples.get(phase)
+			if ring is None:
+				# Frames recorded before the phase first appeared count as 0
+				ring = self.samples[phase] = np.zeros(self.capacity)
+			ring[slot] = seconds
+		# Phases skipped this frame (e.g. no fixed step ran) record 0
+		for phase, ring in self.samples.items():
+			if phase not in self.frame:
+				ring[slot] = 0.0
+		self.frames += 1
+		self.frame.clear()
+
+	def summary(self) -> dict:
+		"""{phase: {"p50", "p95", "p99", "mean", "max"}} in milliseconds, plus "frame" for the sum."""
+		n = min(self.frames, self.capacity)
+		if n == 0:
+			return {}
+		order = [p for p in PHASES if p in self.samples] + [p for p in self.samples if p not in PHASES]
+		rows = np.array([self.samples[p][:n] for p in order]) * 1000.0
+		rows = np.vstack([rows, rows.sum(axis=0)])
+		p50, p95, p99 = np.percentile(rows, (50, 95, 99), axis=1)
+		stats = {}
+		for i, phase in enumerate(order + ["frame"]):
+			stats[phase] = {
+				"p50": float(p50[i]),
+				"p95": float(p95[i]),
+				"p99": float(p99[i]),
+				"mean": float(rows[i].mean()),
+				"max": float(rows[i].max()),
+			}
+		return stats
+
+	def dump(self, path: str, **meta) -> str:
+		"""Write the summary (and the raw ring buffers, oldest first) as JSON; returns path."""
+		n = min(self.frames, self.capacity)
+		start = self.frames % self.capacity if self.frames > self.capacity else 0
+		data = dict(meta)
+		data["frames"] = self.frames
+		data["window"] = n
+		data["summary_ms"] = self.summary()
+		data["samples_ms"] = {p: (np.roll(ring, -start)[:n] * 1000.0).round(4).tolist() for p, ring in self.samples.items()}
+		directory = os.path.dirname(path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		with open(path, "w", encoding="utf-8") as f:
+			json.dump(data, f, indent=1)
+		return path
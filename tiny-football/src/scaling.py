@@ -1,7 +1,45 @@
+"""Uniform window scaling plus a cached snapshot of the scaled pitch geometry.
+
+The simulation runs in world units: the unscaled FIELD_BASE_SIZE layout, the
+same at every window size. Scaling is applied only when drawing, through
+apply_offset() (world position to screen pixels) and the Geometry snapshot.
+"""
+
+from typing import NamedTuple, Optional
 import pygame
 from pygame.math import Vector2 as V2
 from settings import CFG
 
+# Size of the layout the pitch is designed in (world units)
+FIELD_BASE_SIZE = (960, 540)
+
+
+def field_rects(scale: float = 1.0) -> tuple:
+	"""(pitch, left goal, right goal) rectangles at scale; scale 1 gives world units."""
+	w, h = FIELD_BASE_SIZE
+	m = CFG.field.get("margin", 40)
+	inner = pygame.Rect(m * scale, m * scale, (w - 2 * m) * scale, (h - 2 * m) * scale)
+	# Goals sit on the goal lines (edges of the field)
+	gw = int(CFG.field.get("goal_width", 140) * scale)
+	gd = int(CFG.field.get("goal_depth", 20) * scale)
+	y_goal = inner.centery - gw // 2
+	return inner, pygame.Rect(inner.left, y_goal, gd, gw), pygame.Rect(inner.right - gd, y_goal, gd, gw)
+
+
+class Geometry(NamedTuple):
+	"""Screen-side geometry for one window size; replaced (never modified) by update_size().
+
+	The Rects and Vector2s are shared by every reader: copy before changing them.
+	"""
+	generation: int  # bumped on every update_size()
+	scale: float
+	offset: V2  # centers the scaled content in the window
+	inner: pygame.Rect  # pitch rectangle, scaled
+	left_goal: pygame.Rect  # goal sensors, scaled
+	right_goal: pygame.Rect
+	center: V2  # pitch center on screen (scaled + offset)
+
+
 class ScalingManager:
 	def __init__(self, base_width: int, base_height: int):
 		self.base_width = base_width
@@ -11,6 +49,8 @@ class ScalingManager:
 		self.scale_x = 1.0
 		self.scale_y = 1.0
 		self.uniform_scale = 1.0
+		self.generation = 0
+		self.geometry = self._build_geometry()
 		
 	def update_size(self, new_width: int, new_height: int):
 		"""Update scaling factors based on new window size, forcing uniform scaling."""
@@ -39,6 +79,25 @@ class ScalingManager:
 		# Update CFG size for other components
 		CFG.window["width"] = adjusted_width
 		CFG.window["height"] = adjusted_height
+
+		# New snapshot for the new size; readers compare generation to notice it
+		self.generation += 1
+		self.geometry = self._build_geometry()
+
+	def _build_geometry(self) -> Geometry:
+		"""Compute every scaled rectangle and the offset for the current size."""
+		s = self.uniform_scale
+		offset = V2((self.current_width - self.base_width * s) / 2, (self.current_height - self.base_height * s) / 2)
+		inner, left_goal, right_goal = field_rects(s)
+		return Geometry(
+			generation=self.generation,
+			scale=s,
+			offset=offset,
+			inner=inner,
+			left_goal=left_goal,
+			right_goal=right_goal,
+			center=V2(field_rects()[0].center) * s + offset,
+		)
 	
 	def scale_position(self, pos: V2) -> V2:
 		"""Scale a position vector using uniform scaling to maintain aspect ratio."""
@@ -60,22 +119,12 @@ class ScalingManager:
 		return accel * self.uniform_scale
 	
 	def get_offset(self) -> V2:
-		"""Get offset to center uniformly scaled content in the window."""
-		# Calculate how much space we have after uniform scaling
-		scaled_width = self.base_width * self.uniform_scale
-		scaled_height = self.base_height * self.uniform_scale
-		
-		# Center the scaled content
-		offset_x = (self.current_width - scaled_width) / 2
-		offset_y = (self.current_height - scaled_height) / 2
-		
-		return V2(offset_x, offset_y)
+		"""Offset that centers uniformly scaled content in the window (shared; do not modify)."""
+		return self.geometry.offset
 	
 	def apply_offset(self, pos: V2) -> V2:
-		"""Apply uniform scaling and offset to a position."""
-		scaled_pos = self.scale_position(pos)
-		offset = self.get_offset()
-		return scaled_pos + offset
+		"""World position to screen pixels: uniform scaling plus the centering offset."""
+		return self.scale_position(pos) + self.geometry.offset
 	
 	def scale_rect(self, rect: pygame.Rect) -> pygame.Rect:
 		"""Scale a rectangle using uniform scaling."""
@@ -95,5 +144,45 @@ class ScalingManager:
 		scaled_size = (int(size[0] * self.uniform_scale), int(size[1] * self.uniform_scale))
 		return pygame.Surface(scaled_size)
 
+class ResizeDebouncer:
+	"""Coalesces the VIDEORESIZE storm of a drag-resize.
+
+	feed() reports at most one new size per frame (the last one in the frame's
+	events), for cheap preview work. settled() hands the size over once no new
+	size has arrived for `delay` seconds, for the expensive work (smoothscaled
+	images, snapping the window with set_mode).
+
+	Args:
+		size: Current window size
+		delay: Seconds without a new size before a resize counts as settled
+	"""
+
+	def __init__(self, size: tuple, delay: float = 0.2):
+		self.size = tuple(size)  # window size after the last settled resize
+		self.delay = delay
+		self.pending = None  # latest size not settled yet
+		self.changed_at = 0.0
+
+	def feed(self, events: list, now: float) -> Optional[tuple]:
+		"""Last new window size among events, or None if the size did not change."""
+		size = None
+		for e in events:
+			if e.type == pygame.VIDEORESIZE:
+				size = (e.w, e.h)
+		# Repeats (including the event set_mode's own resize produces) are ignored
+		if size is None or size == (self.pending or self.size):
+			return None
+		self.pending = size
+		self.changed_at = now
+		return size
+
+	def settled(self, now: float) -> Optional[tuple]:
+		"""The pending size once it has been stable for delay seconds (returned once), else None."""
+		if self.pending is None or now - self.changed_at < self.delay:
+			return None
+		size, self.pending = self.pending, None
+		return size
+
+
 # Initialize with default window size from CFG
 SCALING = ScalingManager(CFG.size[0], CFG.size[1])
@@ -26,6 +26,11 @@ DEFAULT_CFG: Dict[str, Any] = {
 	"ai": {"enabled": True, "line_locked": True},
 	"mode": "multiplayer",  # multiplayer | human_vs_ai | two_plus_ai
 	"hud": {"font_size": 20, "show_fps": True},
+	"sim": {"fixed_step": False, "tick_rate": 120, "max_frame_time": 0.25, "seed": None},
+	"render": {"dirty_rects": False, "resize_settle": 0.2},
+	"input": {"low_latency": False, "latency_dump": False},
+	"profiler": {"enabled": False, "frames": 600, "dir": "profiles"},
+	"log": {"level": "INFO", "file": None},
 }
 
 
@@ -42,6 +47,11 @@ class Settings:
 		self.teams = cfg.get("teams", {})
 		self.force_field = cfg.get("force_field", {})
 		self.hud = cfg.get("hud", {})
+		self.sim = cfg.get("sim", {})
+		self.render = cfg.get("render", {})
+		self.input = cfg.get("input", {})
+		self.profiler = cfg.get("profiler", {})
+		self.log = cfg.get("log", {})
 		self.colors_hex = cfg.get("colors", {})
 		self.colors = {k: _hex_to_rgb(v) for k, v in self.colors_hex.items()}
 		# derived defaults for menu
@@ -0,0 +1,105 @@
+"""Multi-core AI tournament: seeded AI-vs-AI matches over a parameter grid.
+
+Every combination of difficulty x team size x match length is played with a
+set of seeds. Matches are fanned out over a process pool (one worker per core
+by default), each result is printed as soon as its match finishes, and an
+aggregate table with one row per grid cell is printed and written to CSV.
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from headless import run_match
+
+TABLE_FIELDS = ["ai_difficulty", "per_team", "minutes", "matches", "wins_l", "draws", "wins_r", "goals_l", "goals_r", "hits_l", "hits_r", "possession_l", "possession_r"]
+
+
+def _play(difficulty: str, per_team: int, minutes: int, seed: int) -> dict:
+	"""Worker task: play one match and tag the result with its seed."""
+	res = run_match(mode="multiplayer_ai", per_team=per_team, minutes=minutes, ai_difficulty=difficulty, seed=seed)
+	res["seed"] = seed
+	return res
+
+
+def aggregate(results: list) -> list:
+	"""Collapse match results into one summary row per (difficulty, per_team, minutes) cell."""
+	cells = {}
+	for res in results:
+		cells.setdefault((res["ai_difficulty"], res["per_team"], res["minutes"]), []).append(res)
+	rows = []
+	for (difficulty, per_team, minutes), group in sorted(cells.items()):
+		n = len(group)
+		rows.append({
+			"ai_difficulty": difficulty,
+			"per_team": per_team,
+			"minutes": minutes,
+			"matches": n,
+			"wins_l": sum(r["score_l"] > r["score_r"] for r in group),
+			"draws": sum(r["score_l"] == r["score_r"] for r in group),
+			"wins_r": sum(r["score_l"] < r["score_r"] for r in group),
+			"goals_l": round(sum(r["score_l"] for r in group) / n, 2),
+			"goals_r": round(sum(r["score_r"] for r in group) / n, 2),
+			"hits_l": round(sum(r["hits_l"] for r in group) / n, 1),
+			"hits_r": round(sum(r["hits_r"] for r in group) / n, 1),
+			"possession_l": round(sum(r["possession_l"] for r in group) / n, 1),
+			"possession_r": round(sum(r["possession_r"] for r in group) / n, 1),
+		})
+	return rows
+
+
+def format_table(rows: list) -> str:
+	"""Render aggregate rows as a fixed-width text table."""
+	widths = {f: max(len(f), *(len(str(r[f])) for r in rows)) for f in TABLE_FIELDS}
+	lines = ["  ".join(f.rjust(widths[f]) for f in TABLE_FIELDS)]
+	lines += ["  ".join(str(r[f]).rjust(widths[f]) for f in TABLE_FIELDS) for r in rows]
+	return "\n".join(lines)
+
+
+def run_tournament(difficulties: list, team_sizes: list, lengths: list, seeds: int, base_seed: int = 0, workers: int = None) -> list:
+	"""Play every grid cell with `seeds` seeded matches in parallel; returns all match results.
+
+	Results are printed in completion order. Seeds are base_seed .. base_seed + seeds - 1
+	for every cell, so cells are compared on the same kickoffs.
+	"""
+	grid = list(itertools.product(difficulties, team_sizes, lengths, range(base_seed, base_seed + seeds)))
+	results = []
+	start = time.perf_counter()
+	with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+		futures = [pool.submit(_play, *task) for task in grid]
+		for done, future in enumerate(as_completed(futures), 1):
+			res = future.result()
+			results.append(res)
+			print(f"[{done}/{len(grid)}] {res['ai_difficulty']:<6} {res['per_team']}v{res['per_team']} {res['minutes']:g}min "
+				f"seed {res['seed']}: {res['score_l']}-{res['score_r']} hits {res['hits_l']}/{res['hits_r']} "
+				f"({time.perf_counter() - start:.1f}s)", flush=True)
+	return results
+
+
+def main() -> None:
+	"""Command line entry point."""
+	parser = argparse.ArgumentParser(description="Run a Tiny Football AI tournament on all CPU cores.")
+	parser.add_argument("--difficulties", nargs="+", default=["Easy", "Normal", "Hard"], choices=["Easy", "Normal", "Hard"])
+	parser.add_argument("--team-sizes", nargs="+", type=int, default=[1, 2, 3], help="players per team")
+	parser.add_argument("--minutes", nargs="+", type=int, default=[1, 2], help="match lengths in minutes")
+	parser.add_argument("--seeds", type=int, default=4, help="matches per grid cell")
+	parser.add_argument("--seed", type=int, default=0, help="first seed")
+	parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+	parser.add_argument("--out", default="tournament.csv", help="where to write the aggregate table")
+	args = parser.parse_args()
+
+	results = run_tournament(args.difficulties, args.team_sizes, args.minutes, args.seeds, args.seed, args.workers)
+	rows = aggregate(results)
+	print()
+	print(format_table(rows))
+	with open(args.out, "w", newline="") as f:
+		writer = csv.DictWriter(f, fieldnames=TABLE_FIELDS)
+		writer.writeheader()
+		writer.writerows(rows)
+	print(f"\nWrote {len(rows)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+	main()